@@ -1,10 +1,17 @@
-from typing import Optional
+from datetime import datetime
+from typing import List, Literal, Optional
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, File, Query, UploadFile
+from fastapi.responses import JSONResponse, PlainTextResponse, Response
 from sqlalchemy.orm import Session
 
+from backend.core import profiling
+from backend.core.audit import log_admin_action
 from backend.core.database import get_db
+from backend.core.exceptions import NotFoundError
+from backend.core.idempotency import idempotent
 from backend.core.security import get_admin_user_id
+from backend.tasks.notification_tasks import send_campaign_notification
 
 from . import schemas, service
 
@@ -30,13 +37,7 @@ def get_all_orders(
     
     result_orders = []
     for order in orders:
-        # 사용자 정보 조회
-        user = None
-        if order.user_id:
-            user = db.query(service.models.User).filter(
-                service.models.User.id == order.user_id
-            ).first()
-        
+        user = order.user
         result_orders.append(
             schemas.AdminOrderResponse(
                 id=str(order.id),
@@ -135,6 +136,44 @@ def get_order_detail(
     )
 
 
+def _register_shipments(
+    db: Session,
+    admin_id: str,
+    entries: List[schemas.ShipmentEntry],
+    source: str,
+) -> schemas.BulkShipmentResponse:
+    result = service.register_shipments(db=db, entries=entries)
+    log_admin_action(
+        db=db,
+        admin_id=admin_id,
+        action_description="bulk_register_shipments",
+        resource_type="order",
+        details={"source": source, "rows": len(entries), "updated": result.updated, "errors": len(result.errors)},
+    )
+    return result
+
+
+@router.post("/orders/shipments", response_model=schemas.BulkShipmentResponse)
+def register_shipments(
+    payload: schemas.BulkShipmentRequest,
+    admin_id: str = Depends(get_admin_user_id),
+    db: Session = Depends(get_db),
+) -> schemas.BulkShipmentResponse:
+    """송장 일괄 등록 (관리자 전용)"""
+    return _register_shipments(db, admin_id, payload.shipments, source="json")
+
+
+@router.post("/orders/shipments/csv", response_model=schemas.BulkShipmentResponse)
+def register_shipments_csv(
+    file: UploadFile = File(..., description="order_number,courier,tracking_number 헤더의 CSV"),
+    admin_id: str = Depends(get_admin_user_id),
+    db: Session = Depends(get_db),
+) -> schemas.BulkShipmentResponse:
+    """송장 CSV 업로드 일괄 등록 (관리자 전용)"""
+    entries = service.parse_shipment_csv(service.read_shipment_csv(file.file))
+    return _register_shipments(db, admin_id, entries, source="csv")
+
+
 @router.put("/orders/{order_id}/status", response_model=schemas.AdminOrderResponse)
 def update_order_status(
     order_id: str,
@@ -242,7 +281,11 @@ def get_user(
 # 포인트 관리 API
 # ==========================================
 
-@router.post("/users/{user_id}/points", response_model=schemas.PointHistoryResponse)
+@router.post(
+    "/users/{user_id}/points",
+    response_model=schemas.PointHistoryResponse,
+    dependencies=[Depends(idempotent("admin.points.issue"))],
+)
 def issue_points(
     user_id: str,
     payload: schemas.IssuePointsRequest,
@@ -265,14 +308,43 @@ def issue_points(
     )
 
 
+@router.post(
+    "/points/bulk",
+    response_model=schemas.BulkIssuePointsResponse,
+    dependencies=[Depends(idempotent("admin.points.bulk_issue"))],
+)
+def issue_points_bulk(
+    payload: schemas.BulkIssuePointsRequest,
+    admin_id: str = Depends(get_admin_user_id),
+    db: Session = Depends(get_db),
+) -> schemas.BulkIssuePointsResponse:
+    """여러 사용자에게 포인트 일괄 지급 (관리자 전용)"""
+    granted = service.issue_points_bulk(
+        db=db,
+        user_ids=payload.user_ids,
+        points=payload.points,
+        reason=payload.reason,
+    )
+    log_admin_action(
+        db=db,
+        admin_id=admin_id,
+        action_description="points_bulk_issue",
+        resource_type="points",
+        details={"points": payload.points, "reason": payload.reason, "requested": len(payload.user_ids), "granted": granted},
+    )
+    return schemas.BulkIssuePointsResponse(granted=granted)
+
+
 @router.get("/points/history", response_model=schemas.PointHistoryListResponse)
 def get_point_history(
     user_id: Optional[str] = Query(default=None, description="사용자 ID (없으면 전체)"),
+    cursor: Optional[str] = Query(default=None, description="이전 응답의 next_cursor"),
+    limit: int = Query(50, ge=1, le=200),
     admin_id: str = Depends(get_admin_user_id),
     db: Session = Depends(get_db),
 ) -> schemas.PointHistoryListResponse:
     """포인트 내역 조회 (관리자 전용)"""
-    history, total = service.get_point_history(db=db, user_id=user_id)
+    history, next_cursor = service.get_point_history(db=db, user_id=user_id, cursor=cursor, limit=limit)
     return schemas.PointHistoryListResponse(
         history=[
             schemas.PointHistoryResponse(
@@ -284,6 +356,122 @@ def get_point_history(
             )
             for h in history
         ],
-        total=total,
+        next_cursor=next_cursor,
+    )
+
+
+# ==========================================
+# 감사 로그 API
+# ==========================================
+
+@router.get("/audit-logs", response_model=schemas.AuditLogListResponse)
+def get_audit_logs(
+    user_id: Optional[str] = Query(default=None, description="수행한 사용자 ID"),
+    resource_type: Optional[str] = Query(default=None, description="리소스 유형 (user, order, product 등)"),
+    resource_id: Optional[str] = Query(default=None, description="리소스 ID"),
+    action: Optional[str] = Query(default=None, description="액션 (login, order_created 등)"),
+    start: Optional[datetime] = Query(default=None, description="조회 시작 시각 (기본: 종료 7일 전)"),
+    end: Optional[datetime] = Query(default=None, description="조회 종료 시각 (기본: 현재)"),
+    cursor: Optional[str] = Query(default=None, description="이전 응답의 next_cursor"),
+    limit: int = Query(50, ge=1, le=200),
+    admin_id: str = Depends(get_admin_user_id),
+    db: Session = Depends(get_db),
+) -> schemas.AuditLogListResponse:
+    """감사 로그 조회 (관리자 전용)"""
+    logs, next_cursor = service.list_audit_logs(
+        db=db,
+        user_id=user_id,
+        resource_type=resource_type,
+        resource_id=resource_id,
+        action=action,
+        start=start,
+        end=end,
+        cursor=cursor,
+        limit=limit,
+    )
+    return schemas.AuditLogListResponse(
+        logs=[
+            schemas.AuditLogResponse(
+                id=str(log.id),
+                action=log.action,
+                user_id=str(log.user_id) if log.user_id else None,
+                resource_type=log.resource_type,
+                resource_id=log.resource_id,
+                details=log.details or {},
+                ip_address=log.ip_address,
+                user_agent=log.user_agent,
+                created_at=log.created_at,
+            )
+            for log in logs
+        ],
+        next_cursor=next_cursor,
+    )
+
+
+# ==========================================
+# 알림 API
+# ==========================================
+
+@router.post("/notifications/campaign", response_model=schemas.CampaignNotificationResponse)
+def send_campaign(
+    payload: schemas.CampaignNotificationRequest,
+    admin_id: str = Depends(get_admin_user_id),
+    db: Session = Depends(get_db),
+) -> schemas.CampaignNotificationResponse:
+    """캠페인 알림 일괄 발송 (관리자 전용, Celery에서 배치 처리)"""
+    task = send_campaign_notification.delay(
+        notification_type=payload.type,
+        title=payload.title,
+        message=payload.message,
+        link=payload.link,
+        marketing_only=payload.marketing_only,
     )
+    log_admin_action(
+        db=db,
+        admin_id=admin_id,
+        action_description="campaign_notification",
+        resource_type="notification",
+        details={"title": payload.title, "marketing_only": payload.marketing_only, "task_id": task.id},
+    )
+    return schemas.CampaignNotificationResponse(
+        task_id=task.id,
+        message="캠페인 알림 발송을 시작했습니다.",
+    )
+
+
+# ==========================================
+# 프로파일링 API
+# ==========================================
+
+@router.get("/profiles/hot-stacks", response_model=schemas.HotStacksResponse)
+def get_hot_stacks(
+    route: str = Query(..., description="라우트 템플릿 (예: /products/{product_id})"),
+    limit: int = Query(20, ge=1, le=200),
+    admin_id: str = Depends(get_admin_user_id),
+) -> schemas.HotStacksResponse:
+    """상시 샘플링으로 누적된 라우트별 핫 스택 (관리자 전용)"""
+    stacks = profiling.stack_sampler.get_hot_stacks(route, limit=limit)
+    return schemas.HotStacksResponse(
+        route=route,
+        stacks=[schemas.HotStackEntry(stack=stack, samples=count) for stack, count in stacks],
+    )
+
+
+@router.get("/profiles/{profile_id}")
+def get_profile(
+    profile_id: str,
+    format: Literal["speedscope", "collapsed"] = Query("speedscope"),
+    admin_id: str = Depends(get_admin_user_id),
+) -> Response:
+    """요청별 프로파일 조회 (관리자 전용)
+
+    speedscope: https://www.speedscope.app 에서 열 수 있는 JSON
+    collapsed: flamegraph.pl / inferno 입력 형식 (가중치 단위 ms)
+    """
+    profile = profiling.get_profile(profile_id)
+    if profile is None:
+        raise NotFoundError("프로파일을 찾을 수 없습니다.")
+    if format == "collapsed":
+        return PlainTextResponse(profiling.speedscope_to_collapsed(profile))
+    return JSONResponse(profile)
 
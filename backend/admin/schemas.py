@@ -1,7 +1,7 @@
 from datetime import datetime
 from typing import List, Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 
 # 관리자용 주문 관련 스키마
@@ -56,6 +56,29 @@ class UpdateOrderStatusRequest(BaseModel):
     courier: Optional[str] = None
 
 
+# 송장 일괄 등록 스키마
+class ShipmentEntry(BaseModel):
+    order_number: str
+    courier: str
+    tracking_number: str
+
+
+class BulkShipmentRequest(BaseModel):
+    shipments: List[ShipmentEntry] = Field(..., min_length=1)
+
+
+class ShipmentError(BaseModel):
+    row: int  # 요청/파일 내 순서 (1부터)
+    order_number: str
+    reason: str
+
+
+class BulkShipmentResponse(BaseModel):
+    updated: int
+    shipped: int  # 이번에 배송중으로 전환된 주문 수 (발송 알림 대상)
+    errors: List[ShipmentError]
+
+
 # 사용자 검색 관련 스키마
 class UserSearchResponse(BaseModel):
     id: str
@@ -95,5 +118,54 @@ class PointHistoryResponse(BaseModel):
 
 class PointHistoryListResponse(BaseModel):
     history: List[PointHistoryResponse]
-    total: int
+    next_cursor: Optional[str] = None
+
+
+class BulkIssuePointsRequest(BaseModel):
+    user_ids: List[str] = Field(..., min_length=1, max_length=10000)
+    points: int = Field(..., gt=0)
+    reason: str
+
+
+class BulkIssuePointsResponse(BaseModel):
+    granted: int
+
+
+class HotStackEntry(BaseModel):
+    stack: str
+    samples: int
+
+
+class HotStacksResponse(BaseModel):
+    route: str
+    stacks: List[HotStackEntry]
+
+
+class AuditLogResponse(BaseModel):
+    id: str
+    action: str
+    user_id: Optional[str] = None
+    resource_type: Optional[str] = None
+    resource_id: Optional[str] = None
+    details: dict = {}
+    ip_address: Optional[str] = None
+    user_agent: Optional[str] = None
+    created_at: datetime
+
+
+class AuditLogListResponse(BaseModel):
+    logs: List[AuditLogResponse]
+    next_cursor: Optional[str] = None
+
+
+class CampaignNotificationRequest(BaseModel):
+    type: str = "promotion"  # promotion, system
+    title: str
+    message: str
+    link: Optional[str] = None
+    marketing_only: bool = True  # 마케팅 수신 동의 사용자에게만 발송
+
 
+class CampaignNotificationResponse(BaseModel):
+    task_id: str
+    message: str
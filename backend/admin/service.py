@@ -1,14 +1,21 @@
 from __future__ import annotations
 
-from datetime import datetime
-from typing import List, Optional, Tuple
-from uuid import uuid4
+import csv
+import io
+from datetime import datetime, timedelta
+from typing import BinaryIO, List, Optional, Tuple
 
-from sqlalchemy import func, or_
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import String, and_, case, column, func, or_, update, values
+from sqlalchemy.orm import Session, joinedload, selectinload
 
 from backend.core import models
+from backend.core.config import get_settings
 from backend.core.exceptions import NotFoundError, BadRequestError
+from backend.core.ids import new_id
+from backend.core.outbox import OutboxEventType, add_outbox_event
+from backend.orders.service import ORDER_STATUSES, invalidate_status_summary
+from backend.points import service as points_service
+from backend.shipping.tracker import COURIER_CODES
 
 from . import schemas
 
@@ -20,8 +27,11 @@ def list_all_orders(
     limit: int = 20,
     status_filter: Optional[str] = None,
 ) -> Tuple[List[models.Order], int, int]:
-    """모든 주문 목록 조회 (관리자용)"""
-    query = db.query(models.Order).options(joinedload(models.Order.items))
+    """모든 주문 목록 조회 (관리자용, 주문자 정보 함께 로딩)"""
+    query = db.query(models.Order).options(
+        joinedload(models.Order.items),
+        selectinload(models.Order.user),
+    )
     
     if status_filter:
         query = query.filter(models.Order.status == status_filter)
@@ -65,10 +75,10 @@ def update_order_status(
 ) -> models.Order:
     """주문 상태 변경 (관리자용)"""
     order = get_order_detail(db, order_id)
+    previous_status = order.status
     
-    valid_statuses = ["pending", "paid", "preparing", "shipped", "delivered", "cancelled", "refunded"]
-    if payload.status not in valid_statuses:
-        raise BadRequestError(f"유효하지 않은 상태입니다. 가능한 상태: {', '.join(valid_statuses)}")
+    if payload.status not in ORDER_STATUSES:
+        raise BadRequestError(f"유효하지 않은 상태입니다. 가능한 상태: {', '.join(ORDER_STATUSES)}")
     
     order.status = payload.status
     order.updated_at = datetime.utcnow()
@@ -89,11 +99,154 @@ def update_order_status(
     if payload.status == "cancelled":
         order.cancelled_at = datetime.utcnow()
     
+    # 알림/발송 이메일은 아웃박스를 통해 커밋 후 비동기 처리
+    if payload.status != previous_status:
+        add_outbox_event(
+            db,
+            OutboxEventType.ORDER_STATUS_CHANGED,
+            aggregate_type="order",
+            aggregate_id=order.id,
+            payload={"order_id": str(order.id), "status": payload.status},
+        )
+    
     db.commit()
+    if payload.status != previous_status:
+        invalidate_status_summary([order.user_id])
     db.refresh(order)
     return order
 
 
+# 송장 일괄 등록 관련 서비스
+SHIPPABLE_STATUSES = {"pending", "paid", "preparing", "shipped"}
+SHIPMENT_CSV_COLUMNS = ("order_number", "courier", "tracking_number")
+
+
+def read_shipment_csv(stream: BinaryIO) -> bytes:
+    """송장 CSV 업로드 읽기 (최대 행 수 × 행당 바이트 수 + 헤더 한 행까지만 메모리에 적재)"""
+    settings = get_settings()
+    limit = (settings.shipment_bulk_max_rows + 1) * settings.shipment_csv_row_bytes
+    content = stream.read(limit + 1)
+    if len(content) > limit:
+        raise BadRequestError(f"CSV 파일은 최대 {limit:,}바이트까지 업로드할 수 있습니다.")
+    return content
+
+
+def parse_shipment_csv(content: bytes) -> List[schemas.ShipmentEntry]:
+    """송장 CSV 파싱 (헤더: order_number,courier,tracking_number)"""
+    try:
+        text = content.decode("utf-8-sig")  # 엑셀에서 저장한 BOM 포함 파일 허용
+    except UnicodeDecodeError:
+        raise BadRequestError("CSV 파일은 UTF-8로 인코딩되어야 합니다.")
+
+    reader = csv.DictReader(io.StringIO(text))
+    missing = [column for column in SHIPMENT_CSV_COLUMNS if column not in (reader.fieldnames or [])]
+    if missing:
+        raise BadRequestError(f"CSV 헤더에 다음 컬럼이 필요합니다: {', '.join(missing)}")
+    return [
+        schemas.ShipmentEntry(**{column: row[column] or "" for column in SHIPMENT_CSV_COLUMNS})
+        for row in reader
+        if any((value or "").strip() for value in row.values() if isinstance(value, str))
+    ]
+
+
+def register_shipments(
+    db: Session,
+    entries: List[schemas.ShipmentEntry],
+) -> schemas.BulkShipmentResponse:
+    """송장 일괄 등록 (관리자용)
+
+    주문을 한 번에 조회해 모든 행을 검증하고, 유효한 행만 UPDATE ... FROM (VALUES ...)
+    한 문장으로 배송중 처리합니다. 오류가 있는 행은 건너뛰고 사유를 반환합니다.
+    새로 배송중이 된 주문의 발송 알림/이메일은 아웃박스 이벤트 하나로 묶어 처리합니다.
+    """
+    max_rows = get_settings().shipment_bulk_max_rows
+    if not entries:
+        raise BadRequestError("등록할 송장이 없습니다.")
+    if len(entries) > max_rows:
+        raise BadRequestError(f"한 번에 최대 {max_rows:,}건까지 등록할 수 있습니다.")
+    entries = [
+        schemas.ShipmentEntry(
+            order_number=entry.order_number.strip(),
+            courier=entry.courier.strip().lower(),
+            tracking_number=entry.tracking_number.strip(),
+        )
+        for entry in entries
+    ]
+
+    orders = {
+        row.order_number: row
+        for row in db.query(
+            models.Order.id,
+            models.Order.order_number,
+            models.Order.user_id,
+            models.Order.status,
+            models.Order.courier,
+            models.Order.tracking_number,
+        ).filter(models.Order.order_number.in_({entry.order_number for entry in entries}))
+    }
+
+    errors: List[schemas.ShipmentError] = []
+    valid = {}  # 주문 ID -> (주문 행, 송장)
+    seen = set()
+    for index, entry in enumerate(entries, start=1):
+        order = orders.get(entry.order_number)
+        if entry.order_number in seen:
+            reason = "같은 주문번호가 중복되었습니다."
+        elif order is None:
+            reason = "주문을 찾을 수 없습니다."
+        elif entry.courier not in COURIER_CODES:
+            reason = f"지원하지 않는 택배사입니다: {entry.courier}"
+        elif not entry.tracking_number:
+            reason = "운송장번호가 없습니다."
+        elif order.status not in SHIPPABLE_STATUSES:
+            reason = f"배송 처리할 수 없는 주문 상태입니다: {order.status}"
+        else:
+            reason = None
+        seen.add(entry.order_number)
+
+        if reason:
+            errors.append(schemas.ShipmentError(row=index, order_number=entry.order_number, reason=reason))
+        elif (order.status, order.courier, order.tracking_number) != ("shipped", entry.courier, entry.tracking_number):
+            valid[order.id] = (order, entry)
+
+    if not valid:
+        return schemas.BulkShipmentResponse(updated=0, shipped=0, errors=errors)
+
+    shipments = values(
+        column("id", models.Order.id.type),
+        column("courier", String),
+        column("tracking_number", String),
+        name="shipments",
+    ).data([(order_id, entry.courier, entry.tracking_number) for order_id, (_, entry) in valid.items()])
+    now = datetime.utcnow()
+    updated = db.execute(
+        update(models.Order)
+        .where(models.Order.id == shipments.c.id, models.Order.status.in_(SHIPPABLE_STATUSES))
+        .values(
+            status="shipped",
+            courier=shipments.c.courier,
+            tracking_number=shipments.c.tracking_number,
+            shipped_at=case((models.Order.status == "shipped", models.Order.shipped_at), else_=now),
+            updated_at=now,
+        )
+        .execution_options(synchronize_session=False)
+    ).rowcount
+
+    # 송장 정정(이미 배송중)은 알림 없이 반영
+    newly_shipped = [order for order, _ in valid.values() if order.status != "shipped"]
+    if newly_shipped:
+        add_outbox_event(
+            db,
+            OutboxEventType.ORDER_SHIPMENTS_REGISTERED,
+            aggregate_type="order",
+            aggregate_id=new_id(),
+            payload={"order_ids": [str(order.id) for order in newly_shipped]},
+        )
+    db.commit()
+    invalidate_status_summary(order.user_id for order in newly_shipped if order.user_id)
+    return schemas.BulkShipmentResponse(updated=updated, shipped=len(newly_shipped), errors=errors)
+
+
 # 사용자 검색 관련 서비스
 def search_users(
     db: Session,
@@ -133,38 +286,90 @@ def issue_points(
     points: int,
     reason: str,
 ) -> models.UserPoints:
-    """포인트 지급"""
-    user = get_user_by_id(db, user_id)
-    
-    point_record = models.UserPoints(
-        id=str(uuid4()),
-        user_id=user_id,
-        points=points,
-        reason=reason,
-        created_at=datetime.utcnow(),
-    )
-    db.add(point_record)
-    
-    # 사용자 포인트 업데이트 (DB 트리거로도 처리되지만 명시적으로)
-    user.points = user.points + points
-    
+    """포인트 지급/회수 (잔액은 원자적으로 갱신)"""
+    point_record = points_service.add_points(db, user_id, points, reason)
     db.commit()
     db.refresh(point_record)
     return point_record
 
 
+def issue_points_bulk(
+    db: Session,
+    user_ids: List[str],
+    points: int,
+    reason: str,
+) -> int:
+    """여러 사용자에게 포인트 일괄 지급 (활성 사용자만)"""
+    return points_service.grant_points_bulk(db, user_ids, points, reason)
+
+
 def get_point_history(
     db: Session,
     user_id: Optional[str] = None,
-) -> Tuple[List[models.UserPoints], int]:
-    """포인트 내역 조회"""
-    query = db.query(models.UserPoints)
-    
+    cursor: Optional[str] = None,
+    limit: int = 50,
+) -> Tuple[List[models.UserPoints], Optional[str]]:
+    """포인트 내역 조회 (커서 기반 페이지네이션)"""
+    return points_service.list_history(db, user_id=user_id, cursor=cursor, limit=limit)
+
+
+# 감사 로그 관련 서비스
+AUDIT_LOG_DEFAULT_DAYS = 7
+
+
+def encode_audit_cursor(record: models.AuditLogRecord) -> str:
+    """다음 페이지 커서 (created_at|id)"""
+    return f"{record.created_at.isoformat()}|{record.id}"
+
+
+def decode_audit_cursor(cursor: str) -> Tuple[datetime, str]:
+    try:
+        created_at, record_id = cursor.split("|", 1)
+        return datetime.fromisoformat(created_at), record_id
+    except ValueError:
+        raise BadRequestError("유효하지 않은 커서입니다.")
+
+
+def list_audit_logs(
+    db: Session,
+    user_id: Optional[str] = None,
+    resource_type: Optional[str] = None,
+    resource_id: Optional[str] = None,
+    action: Optional[str] = None,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    cursor: Optional[str] = None,
+    limit: int = 50,
+) -> Tuple[List[models.AuditLogRecord], Optional[str]]:
+    """감사 로그 조회 (최신순, 커서 기반 페이지네이션)
+
+    기간을 지정하지 않으면 최근 7일만 조회하여 파티션 범위를 제한합니다.
+    """
+    end = end or datetime.utcnow()
+    start = start or end - timedelta(days=AUDIT_LOG_DEFAULT_DAYS)
+    if start > end:
+        raise BadRequestError("조회 시작일이 종료일보다 늦습니다.")
+
+    record = models.AuditLogRecord
+    query = db.query(record).filter(record.created_at >= start, record.created_at < end)
     if user_id:
-        query = query.filter(models.UserPoints.user_id == user_id)
-    
-    query = query.order_by(models.UserPoints.created_at.desc())
-    total = query.with_entities(func.count(models.UserPoints.id)).scalar() or 0
-    history = query.limit(100).all()
-    
-    return history, total
+        query = query.filter(record.user_id == user_id)
+    if resource_type:
+        query = query.filter(record.resource_type == resource_type)
+    if resource_id:
+        query = query.filter(record.resource_id == resource_id)
+    if action:
+        query = query.filter(record.action == action)
+    if cursor:
+        cursor_created_at, cursor_id = decode_audit_cursor(cursor)
+        query = query.filter(
+            or_(
+                record.created_at < cursor_created_at,
+                and_(record.created_at == cursor_created_at, record.id < cursor_id),
+            )
+        )
+
+    rows = query.order_by(record.created_at.desc(), record.id.desc()).limit(limit + 1).all()
+    next_cursor = encode_audit_cursor(rows[limit - 1]) if len(rows) > limit else None
+    return rows[:limit], next_cursor
+
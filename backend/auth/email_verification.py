@@ -5,7 +5,6 @@ SMTP 설정이 없으면 이메일 인증을 건너뜁니다.
 """
 from datetime import datetime, timedelta
 from typing import Optional
-from uuid import uuid4
 import secrets
 import hashlib
 
@@ -14,6 +13,7 @@ from sqlalchemy.orm import Session
 from backend.core import models
 from backend.core.config import get_settings
 from backend.core.exceptions import BadRequestError, NotFoundError
+from backend.core.ids import new_id
 from backend.core.logger import get_logger
 
 logger = get_logger(__name__)
@@ -53,7 +53,7 @@ def create_email_verification(
     
     # 새 인증 레코드 생성
     verification = models.EmailVerification(
-        id=str(uuid4()),
+        id=new_id(),
         user_id=user_id,
         email=email,
         token_hash=token_hash,
@@ -106,7 +106,7 @@ def verify_email_token(db: Session, token: str) -> models.User:
     db.commit()
     db.refresh(user)
     
-    logger.info(f"Email verified for user: {user.email}")
+    logger.info("Email verified for user: %s", user.email)
     return user
 
 
@@ -134,8 +134,8 @@ async def send_verification_email(
     
     # SMTP 설정 확인 (추후 추가 필요)
     # 현재는 로그만 출력
-    logger.info(f"Email verification requested for: {email}")
-    logger.info(f"Verification URL: {verify_url}")
+    logger.info("Email verification requested for: %s", email)
+    logger.info("Verification URL: %s", verify_url)
     
     # TODO: 실제 이메일 발송 로직 구현
     # SMTP 설정이 없으면 로그만 출력
@@ -143,8 +143,8 @@ async def send_verification_email(
     if settings.env in ("local", "dev"):
         logger.info("=" * 50)
         logger.info("EMAIL VERIFICATION (Development Mode)")
-        logger.info(f"To: {email}")
-        logger.info(f"Verify URL: {verify_url}")
+        logger.info("To: %s", email)
+        logger.info("Verify URL: %s", verify_url)
         logger.info("=" * 50)
         return True
     
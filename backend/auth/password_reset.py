@@ -3,16 +3,17 @@
 비밀번호 분실 시 재설정 이메일을 발송하고 처리하는 모듈입니다.
 """
 from datetime import datetime, timedelta
-from uuid import uuid4
 import secrets
 import hashlib
 
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 
 from backend.core import models
 from backend.core.config import get_settings
 from backend.core.exceptions import BadRequestError, NotFoundError
-from backend.core.security import hash_password
+from backend.core.ids import new_id
+from backend.core.security import hash_password_async
 from backend.core.logger import get_logger
 
 logger = get_logger(__name__)
@@ -44,7 +45,7 @@ def create_password_reset(
     user = db.query(models.User).filter(models.User.email == email).first()
     if not user:
         # 보안상 사용자가 없어도 같은 메시지 반환
-        logger.info(f"Password reset requested for non-existent email: {email}")
+        logger.info("Password reset requested for non-existent email: %s", email)
         raise NotFoundError("해당 이메일로 등록된 계정을 찾을 수 없습니다.")
     
     if not user.is_active:
@@ -61,7 +62,7 @@ def create_password_reset(
     
     # 새 재설정 레코드 생성
     reset = models.PasswordReset(
-        id=str(uuid4()),
+        id=new_id(),
         user_id=user.id,
         email=email,
         token_hash=token_hash,
@@ -107,12 +108,22 @@ def verify_reset_token(db: Session, token: str) -> models.User:
     return user
 
 
-def reset_password(db: Session, token: str, new_password: str) -> models.User:
+async def reset_password(db: Session, token: str, new_password: str) -> models.User:
     """토큰으로 비밀번호 재설정
     
+    DB 작업은 공용 스레드 풀, bcrypt 해시는 전용 스레드 풀에서 실행하며
+    해시를 기다리는 동안에는 DB 커넥션을 점유하지 않습니다.
+    
     Returns:
         비밀번호가 변경된 사용자
     """
+    reset_id, user_id = await run_in_threadpool(_get_reset_target, db, token)
+    password_hash = await hash_password_async(new_password)
+    return await run_in_threadpool(_apply_password_reset, db, reset_id, user_id, password_hash)
+
+
+def _get_reset_target(db: Session, token: str) -> tuple[str, str]:
+    """재설정 토큰 검증 후 (재설정 레코드 ID, 사용자 ID) 반환"""
     token_hash = hash_token(token)
     
     # 토큰으로 재설정 레코드 조회
@@ -129,24 +140,40 @@ def reset_password(db: Session, token: str, new_password: str) -> models.User:
         db.commit()
         raise BadRequestError("재설정 링크가 만료되었습니다. 새로운 재설정 이메일을 요청해주세요.")
     
-    # 사용자 조회 및 비밀번호 변경
-    user = db.query(models.User).filter(
+    # 사용자 확인
+    user_exists = db.query(models.User.id).filter(
         models.User.id == reset.user_id
     ).first()
     
-    if not user:
+    if not user_exists:
         raise NotFoundError("사용자를 찾을 수 없습니다.")
     
-    # 비밀번호 변경
-    user.password_hash = hash_password(new_password)
-    user.updated_at = datetime.utcnow()
+    reset_id, user_id = str(reset.id), str(reset.user_id)
+    db.rollback()  # 해시 계산 동안 커넥션을 풀에 반환
+    return reset_id, user_id
+
+
+def _apply_password_reset(db: Session, reset_id: str, user_id: str, password_hash: str) -> models.User:
+    # 재설정 레코드 삭제 (동시에 같은 토큰이 사용되면 하나만 성공)
+    deleted = db.query(models.PasswordReset).filter(
+        models.PasswordReset.id == reset_id
+    ).delete(synchronize_session=False)
+    if not deleted:
+        db.rollback()
+        raise NotFoundError("유효하지 않은 재설정 링크입니다.")
     
-    # 재설정 레코드 삭제
-    db.delete(reset)
+    # 비밀번호 변경
+    db.query(models.User).filter(models.User.id == user_id).update(
+        {
+            models.User.password_hash: password_hash,
+            models.User.updated_at: datetime.utcnow(),
+        },
+        synchronize_session=False,
+    )
     db.commit()
-    db.refresh(user)
     
-    logger.info(f"Password reset completed for user: {user.email}")
+    user = db.get(models.User, user_id)
+    logger.info("Password reset completed for user: %s", user.email)
     return user
 
 
@@ -170,15 +197,15 @@ async def send_password_reset_email(
     # 재설정 링크 생성
     reset_url = f"{base_url}/reset-password?token={reset_token}"
     
-    logger.info(f"Password reset requested for: {email}")
-    logger.info(f"Reset URL: {reset_url}")
+    logger.info("Password reset requested for: %s", email)
+    logger.info("Reset URL: %s", reset_url)
     
     # 개발 환경에서는 콘솔에 링크 출력
     if settings.env in ("local", "dev"):
         logger.info("=" * 50)
         logger.info("PASSWORD RESET (Development Mode)")
-        logger.info(f"To: {email}")
-        logger.info(f"Reset URL: {reset_url}")
+        logger.info("To: %s", email)
+        logger.info("Reset URL: %s", reset_url)
         logger.info("=" * 50)
         return True
     
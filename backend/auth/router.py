@@ -1,9 +1,12 @@
 from fastapi import APIRouter, Depends, Request, Response
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 
+from backend.core.audit import log_login
 from backend.core.database import get_db
+from backend.core.exceptions import UnauthorizedError
 from backend.core.security import get_current_user_id
-from backend.core.rate_limit import limiter, RATE_LIMITS
+from backend.core.rate_limit import get_client_ip, rate_limit
 from backend.core.config import get_settings
 from backend.core.cookies import set_auth_cookies, clear_auth_cookies
 
@@ -14,9 +17,12 @@ settings = get_settings()
 router = APIRouter(prefix="/auth", tags=["auth"])
 
 
-@router.post("/signup", response_model=schemas.AuthResponse)
-@limiter.limit(RATE_LIMITS["auth_signup"])
-def signup(
+@router.post(
+    "/signup",
+    response_model=schemas.AuthResponse,
+    dependencies=[Depends(rate_limit("auth_signup"))],
+)
+async def signup(
     request: Request,
     response: Response,
     payload: schemas.SignupRequest,
@@ -25,8 +31,9 @@ def signup(
     """회원가입 - 액세스 토큰과 리프레시 토큰 발급
     
     토큰은 httpOnly 쿠키와 JSON 응답 모두로 제공됩니다.
+    bcrypt 해시는 전용 스레드 풀에서 기다리므로 공용 스레드 풀을 점유하지 않습니다.
     """
-    user = service.create_user(
+    user = await service.create_user(
         db=db,
         email=payload.email,
         password=payload.password,
@@ -46,9 +53,12 @@ def signup(
     )
 
 
-@router.post("/login", response_model=schemas.AuthResponse)
-@limiter.limit(RATE_LIMITS["auth_login"])
-def login(
+@router.post(
+    "/login",
+    response_model=schemas.AuthResponse,
+    dependencies=[Depends(rate_limit("auth_login"))],
+)
+async def login(
     request: Request,
     response: Response,
     payload: schemas.LoginRequest,
@@ -57,8 +67,29 @@ def login(
     """로그인 - 액세스 토큰과 리프레시 토큰 발급
     
     토큰은 httpOnly 쿠키와 JSON 응답 모두로 제공됩니다.
+    bcrypt 검증은 전용 스레드 풀에서 기다리므로 로그인이 몰려도
+    다른 동기 라우트가 쓰는 공용 스레드 풀을 점유하지 않습니다.
     """
-    user = service.authenticate_user(db, email=payload.email, password=payload.password)
+    ip_address = get_client_ip(request)
+    user_agent = request.headers.get("User-Agent")
+    try:
+        user = await service.authenticate_user(db, email=payload.email, password=payload.password)
+    except UnauthorizedError as e:
+        existing = await run_in_threadpool(service.get_user_by_email, db, email=payload.email)
+        # 감사 로그 버퍼가 가득 차면 호출 스레드에서 DB에 직접 저장하므로 스레드 풀에서 실행
+        await run_in_threadpool(
+            log_login,
+            db,
+            user_id=str(existing.id) if existing else None,
+            success=False,
+            ip_address=ip_address,
+            user_agent=user_agent,
+            failure_reason=e.message,
+        )
+        raise
+    await run_in_threadpool(
+        log_login, db, user_id=str(user.id), success=True, ip_address=ip_address, user_agent=user_agent
+    )
     access_token, refresh_token = service.create_user_tokens(user)
     
     # httpOnly 쿠키로 토큰 설정
@@ -156,8 +187,11 @@ async def resend_verification(
 # 비밀번호 재설정
 # ==========================================
 
-@router.post("/forgot-password", response_model=schemas.ForgotPasswordResponse)
-@limiter.limit(RATE_LIMITS["auth_password_reset"])
+@router.post(
+    "/forgot-password",
+    response_model=schemas.ForgotPasswordResponse,
+    dependencies=[Depends(rate_limit("auth_password_reset"))],
+)
 async def forgot_password(
     request: Request,
     payload: schemas.ForgotPasswordRequest,
@@ -178,16 +212,19 @@ async def forgot_password(
     )
 
 
-@router.post("/reset-password", response_model=schemas.ResetPasswordResponse)
-@limiter.limit(RATE_LIMITS["auth_password_reset"])
-def reset_password_endpoint(
+@router.post(
+    "/reset-password",
+    response_model=schemas.ResetPasswordResponse,
+    dependencies=[Depends(rate_limit("auth_password_reset"))],
+)
+async def reset_password_endpoint(
     request: Request,
     payload: schemas.ResetPasswordRequest,
     db: Session = Depends(get_db),
 ) -> schemas.ResetPasswordResponse:
     """비밀번호 재설정"""
     from . import password_reset
-    password_reset.reset_password(db, payload.token, payload.new_password)
+    await password_reset.reset_password(db, payload.token, payload.new_password)
     return schemas.ResetPasswordResponse()
 
 
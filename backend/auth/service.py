@@ -1,5 +1,6 @@
 from typing import Optional
 
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 
 from backend.core import models
@@ -9,8 +10,9 @@ from backend.core.security import (
     create_access_token,
     create_refresh_token,
     decode_refresh_token,
-    hash_password,
-    verify_password,
+    hash_password_async,
+    verify_and_update_password_async,
+    verify_password_async,
 )
 from backend.core.logger import get_logger
 
@@ -21,7 +23,20 @@ def get_user_by_email(db: Session, email: str) -> Optional[models.User]:
     return db.query(models.User).filter(models.User.email == email).first()
 
 
-def create_user(
+def _get_user_and_release(db: Session, email: str) -> Optional[models.User]:
+    """이메일로 사용자 조회 후 읽기 트랜잭션 종료
+
+    bcrypt를 기다리는 동안 DB 커넥션을 점유하지 않도록 조회한 객체를 세션에서 분리하고
+    커넥션을 풀에 반환합니다.
+    """
+    user = get_user_by_email(db, email=email)
+    if user is not None:
+        db.expunge(user)
+    db.rollback()
+    return user
+
+
+async def create_user(
     db: Session,
     email: str,
     password: str,
@@ -29,82 +44,113 @@ def create_user(
     phone: str,
     marketing_agreed: bool,
 ) -> models.User:
-    existing = get_user_by_email(db, email=email)
+    """회원가입 (DB 작업은 공용 스레드 풀, bcrypt 해시는 전용 스레드 풀에서 실행)"""
+    existing = await run_in_threadpool(_get_user_and_release, db, email=email)
     if existing:
         raise ConflictError("이미 존재하는 이메일입니다.")
 
-    from uuid import uuid4
+    from backend.core.ids import new_id
     from datetime import datetime
     
     user = models.User(
-        id=str(uuid4()),
+        id=new_id(),
         email=email,
         name=name,
-        password_hash=hash_password(password),
+        password_hash=await hash_password_async(password),
         phone=phone,
         marketing_agreed=marketing_agreed,
         created_at=datetime.utcnow(),
         updated_at=datetime.utcnow(),
     )
+    return await run_in_threadpool(_save_user, db, user)
+
+
+def _save_user(db: Session, user: models.User) -> models.User:
     db.add(user)
     db.commit()
     db.refresh(user)
     return user
 
 
-def authenticate_user(db: Session, email: str, password: str) -> models.User:
-    """사용자 인증 (관리자 계정 및 일반 사용자 모두 지원)"""
+async def authenticate_user(db: Session, email: str, password: str) -> models.User:
+    """사용자 인증 (관리자 계정 및 일반 사용자 모두 지원)
+
+    bcrypt 검증은 전용 스레드 풀에서 기다리고(공용 스레드 풀과 DB 커넥션을 점유하지 않음),
+    DB 작업만 공용 스레드 풀에서 실행합니다. 저장된 해시의 cost factor가
+    현재 설정과 다르면 로그인 성공 시 새 해시로 교체합니다.
+    """
     settings = get_settings()
     
     # 관리자 계정 체크 (해시 비교 사용)
     if settings.admin_email and settings.admin_password_hash:
-        if email == settings.admin_email and verify_password(password, settings.admin_password_hash):
-            # 관리자 계정이 DB에 있는지 확인
-            admin_user = get_user_by_email(db, email=settings.admin_email)
-            if not admin_user:
-                # 관리자 계정이 없으면 생성
-                from uuid import uuid4
-                from datetime import datetime
-                admin_user = models.User(
-                    id=str(uuid4()),
-                    email=settings.admin_email,
-                    name="관리자",
-                    password_hash=settings.admin_password_hash,
-                    phone="000-0000-0000",
-                    marketing_agreed=False,
-                    is_active=True,
-                    is_admin=True,
-                    points=0,
-                    created_at=datetime.utcnow(),
-                    updated_at=datetime.utcnow(),
-                )
-                db.add(admin_user)
-                db.commit()
-                db.refresh(admin_user)
-            else:
-                # 기존 관리자 계정의 is_admin이 false인 경우 업데이트
-                if not admin_user.is_admin:
-                    from datetime import datetime
-                    admin_user.is_admin = True
-                    admin_user.updated_at = datetime.utcnow()
-                    db.commit()
-                    db.refresh(admin_user)
-            return admin_user
+        if email == settings.admin_email and await verify_password_async(password, settings.admin_password_hash):
+            return await run_in_threadpool(_get_or_create_admin_user, db)
     
     # 일반 사용자 로그인
-    user = get_user_by_email(db, email=email)
+    user = await run_in_threadpool(_get_user_and_release, db, email=email)
     if not user:
         raise UnauthorizedError("이메일 또는 비밀번호가 올바르지 않습니다.")
 
-    if not verify_password(password, user.password_hash):
+    valid, new_hash = await verify_and_update_password_async(password, user.password_hash)
+    if not valid:
         raise UnauthorizedError("이메일 또는 비밀번호가 올바르지 않습니다.")
 
     if not user.is_active:
         raise UnauthorizedError("비활성화된 계정입니다.")
 
+    if new_hash:
+        # cost factor 변경 -> 평문을 알고 있는 지금 재해시
+        await run_in_threadpool(_update_password_hash, db, user, new_hash)
+        logger.info("Password rehashed with updated cost factor: %s", user.id)
+
     return user
 
 
+def _get_or_create_admin_user(db: Session) -> models.User:
+    """관리자 계정 조회 (없으면 생성, is_admin이 false면 갱신)"""
+    settings = get_settings()
+    # 관리자 계정이 DB에 있는지 확인
+    admin_user = get_user_by_email(db, email=settings.admin_email)
+    if not admin_user:
+        # 관리자 계정이 없으면 생성
+        from backend.core.ids import new_id
+        from datetime import datetime
+        admin_user = models.User(
+            id=new_id(),
+            email=settings.admin_email,
+            name="관리자",
+            password_hash=settings.admin_password_hash,
+            phone="000-0000-0000",
+            marketing_agreed=False,
+            is_active=True,
+            is_admin=True,
+            points=0,
+            created_at=datetime.utcnow(),
+            updated_at=datetime.utcnow(),
+        )
+        db.add(admin_user)
+        db.commit()
+        db.refresh(admin_user)
+    else:
+        # 기존 관리자 계정의 is_admin이 false인 경우 업데이트
+        if not admin_user.is_admin:
+            from datetime import datetime
+            admin_user.is_admin = True
+            admin_user.updated_at = datetime.utcnow()
+            db.commit()
+            db.refresh(admin_user)
+    return admin_user
+
+
+def _update_password_hash(db: Session, user: models.User, password_hash: str) -> None:
+    # user는 세션에서 분리된 객체이므로 ID로 갱신
+    db.query(models.User).filter(models.User.id == user.id).update(
+        {models.User.password_hash: password_hash}, synchronize_session=False
+    )
+    db.commit()
+    user.password_hash = password_hash
+
+
 def create_user_token(user: models.User) -> str:
     """액세스 토큰 생성 (하위 호환성 유지)"""
     return create_access_token(
@@ -6,10 +6,9 @@ from typing import Optional
 from datetime import datetime
 from uuid import uuid4
 
-import httpx
-
 from backend.core.config import get_settings
 from backend.core.logger import get_logger
+from backend.core.metrics import instrumented_client
 from backend.core.exceptions import UnauthorizedError, BadRequestError
 
 logger = get_logger(__name__)
@@ -52,7 +51,7 @@ class GoogleProvider(SocialLoginProvider):
     
     async def get_tokens(self, code: str) -> dict:
         """인가 코드로 토큰 교환"""
-        async with httpx.AsyncClient() as client:
+        async with instrumented_client("google") as client:
             response = await client.post(
                 "https://oauth2.googleapis.com/token",
                 data={
@@ -72,7 +71,7 @@ class GoogleProvider(SocialLoginProvider):
     
     async def get_user_info(self, access_token: str) -> dict:
         """액세스 토큰으로 사용자 정보 조회"""
-        async with httpx.AsyncClient() as client:
+        async with instrumented_client("google") as client:
             response = await client.get(
                 "https://www.googleapis.com/oauth2/v2/userinfo",
                 headers={"Authorization": f"Bearer {access_token}"},
@@ -116,7 +115,7 @@ class NaverProvider(SocialLoginProvider):
     
     async def get_tokens(self, code: str, state: str = "") -> dict:
         """인가 코드로 토큰 교환"""
-        async with httpx.AsyncClient() as client:
+        async with instrumented_client("naver") as client:
             response = await client.get(
                 "https://nid.naver.com/oauth2.0/token",
                 params={
@@ -136,7 +135,7 @@ class NaverProvider(SocialLoginProvider):
     
     async def get_user_info(self, access_token: str) -> dict:
         """액세스 토큰으로 사용자 정보 조회"""
-        async with httpx.AsyncClient() as client:
+        async with instrumented_client("naver") as client:
             response = await client.get(
                 "https://openapi.naver.com/v1/nid/me",
                 headers={"Authorization": f"Bearer {access_token}"},
@@ -2,13 +2,13 @@ from __future__ import annotations
 
 from datetime import datetime
 from typing import List, Optional, Tuple
-from uuid import uuid4
 
 from sqlalchemy import func
 from sqlalchemy.orm import Session
 
 from backend.core import models
 from backend.core.exceptions import NotFoundError
+from backend.core.ids import new_id
 
 from . import schemas
 
@@ -42,7 +42,7 @@ def get_banner(db: Session, banner_id: str) -> models.Banner:
 def create_banner(db: Session, payload: schemas.CreateBannerRequest) -> models.Banner:
     """배너 생성"""
     banner = models.Banner(
-        id=str(uuid4()),
+        id=new_id(),
         title=payload.title,
         banner_image=payload.banner_image,
         content_blocks=[block.model_dump() for block in payload.content_blocks],
@@ -0,0 +1,161 @@
+"""장바구니/주문 금액 계산
+
+장바구니 견적(POST /cart/quote)과 주문 생성(orders.service.create_order)이 같은 계산을
+사용합니다. 상품 금액, 쿠폰 할인(최소 구매 금액/최대 할인 금액), 포인트 사용, 배송비를
+한 번에 계산하며, 할인 금액은 클라이언트 값을 받지 않고 서버에서 계산합니다.
+
+상품 정보는 호출자가 넘깁니다. 견적은 캐시된 상품 스냅샷을, 주문 생성은 재고 차감을 위해
+이미 조회한 상품 행을 사용하므로 가격 계산을 위한 추가 상품 조회가 없습니다.
+"""
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import List, Mapping, Optional, Sequence
+
+from sqlalchemy.orm import Session
+
+from backend.core import models
+from backend.core.config import get_settings
+from backend.core.exceptions import BadRequestError, NotFoundError
+from backend.points.service import get_balance
+from backend.products.service import ProductSnapshot
+
+
+@dataclass(frozen=True)
+class PricingItem:
+    """계산할 항목"""
+
+    product_id: int
+    quantity: int
+    color: str
+    size: str
+
+
+@dataclass
+class QuoteLine:
+    """항목별 금액"""
+
+    product_id: int
+    name: str
+    image_url: str
+    color: str
+    size: str
+    quantity: int
+    unit_price: int
+    line_total: int
+
+
+@dataclass
+class Quote:
+    """견적 결과"""
+
+    lines: List[QuoteLine] = field(default_factory=list)
+    subtotal: int = 0
+    coupon_discount: int = 0
+    points_used: int = 0
+    shipping_fee: int = 0
+    final_amount: int = 0
+    # 주문 생성 시 사용 처리할 쿠폰 (견적 응답에는 포함하지 않음)
+    user_coupon: Optional[models.UserCoupon] = None
+
+    @property
+    def discount_amount(self) -> int:
+        return self.coupon_discount + self.points_used
+
+
+def coupon_discount(coupon: models.Coupon, subtotal: int) -> int:
+    """쿠폰 할인 금액 (상품 금액을 넘지 않음)"""
+    if coupon.discount_type == "percentage":
+        discount = subtotal * coupon.discount_value // 100
+    else:
+        discount = coupon.discount_value
+    if coupon.max_discount_amount is not None:
+        discount = min(discount, coupon.max_discount_amount)
+    return max(min(discount, subtotal), 0)
+
+
+def _load_user_coupon(db: Session, user_id: str, user_coupon_id: str, subtotal: int) -> models.UserCoupon:
+    """사용 가능한 보유 쿠폰 조회 (쿠폰 정보와 함께 한 쿼리)"""
+    row = (
+        db.query(models.UserCoupon, models.Coupon)
+        .join(models.Coupon, models.Coupon.id == models.UserCoupon.coupon_id)
+        .filter(models.UserCoupon.id == user_coupon_id, models.UserCoupon.user_id == user_id)
+        .first()
+    )
+    if row is None:
+        raise NotFoundError("쿠폰을 찾을 수 없습니다.")
+    user_coupon, coupon = row
+
+    now = datetime.utcnow()
+    if user_coupon.is_used:
+        raise BadRequestError("이미 사용한 쿠폰입니다.")
+    if not coupon.is_active or now < coupon.valid_from or now > coupon.valid_until:
+        raise BadRequestError("사용할 수 없는 쿠폰입니다.")
+    if coupon.usage_limit is not None and (coupon.usage_count or 0) >= coupon.usage_limit:
+        raise BadRequestError("쿠폰 사용 한도가 소진되었습니다.")
+    if subtotal < (coupon.min_purchase_amount or 0):
+        raise BadRequestError(
+            f"{coupon.min_purchase_amount:,}원 이상 구매 시 사용할 수 있는 쿠폰입니다."
+        )
+    return user_coupon
+
+
+def calculate_quote(
+    db: Session,
+    user_id: str,
+    items: Sequence[PricingItem],
+    products: Mapping[int, ProductSnapshot],
+    user_coupon_id: Optional[str] = None,
+    use_points: int = 0,
+) -> Quote:
+    """견적 계산
+
+    Args:
+        items: 계산할 항목
+        products: 상품 ID -> 스냅샷 (items의 상품을 모두 포함해야 함)
+        user_coupon_id: 적용할 보유 쿠폰 ID
+        use_points: 사용할 포인트
+
+    Raises:
+        NotFoundError: 상품/쿠폰 없음
+        BadRequestError: 판매 중지 상품, 사용할 수 없는 쿠폰, 포인트 부족
+    """
+    if not items:
+        raise BadRequestError("주문 상품이 존재하지 않습니다.")
+
+    settings = get_settings()
+    quote = Quote()
+    for item in items:
+        product = products.get(item.product_id)
+        if product is None:
+            raise NotFoundError(f"상품 ID {item.product_id}를 찾을 수 없습니다.")
+        if not product.is_active:
+            raise BadRequestError(f"'{product.name}' 상품은 현재 판매하지 않습니다.")
+
+        line_total = product.price * item.quantity
+        quote.subtotal += line_total
+        quote.lines.append(QuoteLine(
+            product_id=product.id,
+            name=product.name,
+            image_url=product.image_url,
+            color=item.color,
+            size=item.size,
+            quantity=item.quantity,
+            unit_price=product.price,
+            line_total=line_total,
+        ))
+
+    if user_coupon_id:
+        quote.user_coupon = _load_user_coupon(db, user_id, user_coupon_id, quote.subtotal)
+        quote.coupon_discount = coupon_discount(quote.user_coupon.coupon, quote.subtotal)
+
+    if use_points > 0:
+        balance = get_balance(db, user_id)
+        if use_points > balance:
+            raise BadRequestError(f"포인트가 부족합니다. (보유: {balance:,}P)")
+        if use_points > quote.subtotal - quote.coupon_discount:
+            raise BadRequestError("포인트는 할인 후 상품 금액까지만 사용할 수 있습니다.")
+        quote.points_used = use_points
+
+    quote.shipping_fee = 0 if quote.subtotal >= settings.free_shipping_threshold else settings.shipping_fee
+    quote.final_amount = quote.subtotal - quote.discount_amount + quote.shipping_fee
+    return quote
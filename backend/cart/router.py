@@ -28,6 +28,15 @@ def add_cart_item(
     return schemas.CartItemWrapper(item=item)
 
 
+@router.post("/quote", response_model=schemas.QuoteResponse)
+def quote_cart(
+    payload: schemas.QuoteRequest,
+    user_id: str = Depends(get_current_user_id),
+    db: Session = Depends(get_db),
+) -> schemas.QuoteResponse:
+    return service.get_quote(db=db, user_id=user_id, payload=payload)
+
+
 @router.put("/{cart_id}", response_model=schemas.CartItemWrapper)
 def update_cart_item(
     cart_id: str,
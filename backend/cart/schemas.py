@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import List
+from typing import List, Optional
 
 from pydantic import BaseModel, Field
 
@@ -37,3 +37,35 @@ class CartItemWrapper(BaseModel):
     item: CartItem
 
 
+class QuoteItemPayload(BaseModel):
+    productId: int
+    quantity: int = Field(..., ge=1)
+    color: str
+    size: str
+
+
+class QuoteRequest(BaseModel):
+    items: Optional[List[QuoteItemPayload]] = None  # 없으면 현재 장바구니로 계산
+    userCouponId: Optional[str] = None
+    usePoints: int = Field(0, ge=0)
+
+
+class QuoteLine(BaseModel):
+    productId: int
+    name: str
+    imageUrl: str
+    color: str
+    size: str
+    quantity: int
+    unitPrice: int
+    lineTotal: int
+
+
+class QuoteResponse(BaseModel):
+    items: List[QuoteLine]
+    subtotal: int
+    couponDiscount: int
+    pointsUsed: int
+    shippingFee: int
+    freeShippingThreshold: int
+    finalAmount: int
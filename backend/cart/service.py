@@ -1,18 +1,69 @@
 from __future__ import annotations
 
+import hashlib
+import json
+from dataclasses import asdict
 from datetime import datetime
-from typing import List
-from uuid import uuid4
+from typing import List, Union
 
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.orm import Session, joinedload
 
 from backend.core import models
+from backend.core.config import get_settings
 from backend.core.exceptions import NotFoundError
+from backend.core.ids import new_id
+from backend.core.redis import cache_get, cache_set
+from backend.products.service import get_product_snapshots
 
 from . import schemas
+from .pricing import PricingItem, calculate_quote
+from .store import CartLine, cart_store
+
+QUOTE_CACHE_PREFIX = "cart:quote"
+
+
+def _use_redis() -> bool:
+    """Redis 장바구니 저장소 사용 여부 (CART_STORE=redis)"""
+    return get_settings().cart_store == "redis"
+
+
+def _to_item(cart: Union[models.Cart, CartLine], product: models.Product) -> schemas.CartItem:
+    return schemas.CartItem(
+        id=str(cart.id),
+        product_id=cart.product_id,
+        quantity=cart.quantity,
+        color=cart.color,
+        size=cart.size,
+        created_at=cart.created_at or datetime.utcnow(),
+        products=schemas.Product.from_orm(product),
+    )
+
+
+def _get_product(db: Session, product_id: int) -> models.Product:
+    product = db.query(models.Product).filter(models.Product.id == product_id).first()
+    if not product:
+        raise NotFoundError("상품을 찾을 수 없습니다.")
+    return product
+
+
+def _insert(db: Session):
+    """방언별 INSERT (ON CONFLICT 지원, 테스트는 SQLite)"""
+    if db.get_bind().dialect.name == "postgresql":
+        return postgresql.insert
+    return sqlite.insert
 
 
 def get_cart_items(db: Session, user_id: str) -> List[schemas.CartItem]:
+    if _use_redis():
+        lines = cart_store.lines(db, user_id)
+        product_ids = {line.product_id for line in lines}
+        products = {
+            product.id: product
+            for product in db.query(models.Product).filter(models.Product.id.in_(product_ids)).all()
+        } if product_ids else {}
+        return [_to_item(line, products[line.product_id]) for line in lines if line.product_id in products]
+
     carts = (
         db.query(models.Cart)
         .options(joinedload(models.Cart.product))
@@ -21,71 +72,59 @@ def get_cart_items(db: Session, user_id: str) -> List[schemas.CartItem]:
         .all()
     )
 
-    items: List[schemas.CartItem] = []
-    for cart in carts:
-        if cart.product is None:
-            continue
-        items.append(
-            schemas.CartItem(
-                id=str(cart.id),
-                product_id=cart.product_id,
-                quantity=cart.quantity,
-                color=cart.color,
-                size=cart.size,
-                created_at=cart.created_at or datetime.utcnow(),
-                products=schemas.Product.from_orm(cart.product),
-            )
-        )
-    return items
+    return [_to_item(cart, cart.product) for cart in carts if cart.product is not None]
 
 
 def add_to_cart(db: Session, user_id: str, payload: schemas.AddToCartRequest) -> schemas.CartItem:
-    product = db.query(models.Product).filter(models.Product.id == payload.productId).first()
-    if not product:
-        raise NotFoundError("상품을 찾을 수 없습니다.")
-
-    cart = (
-        db.query(models.Cart)
-        .filter(
-            models.Cart.user_id == user_id,
-            models.Cart.product_id == payload.productId,
-            models.Cart.color == payload.color,
-            models.Cart.size == payload.size,
-        )
-        .first()
+    """장바구니 담기 (같은 상품/옵션이 있으면 수량 증가)
+
+    DB 저장소는 INSERT ... ON CONFLICT DO UPDATE ... RETURNING 한 문장으로
+    조회-후-수정 없이 처리하므로 동시에 담아도 수량이 유실되지 않습니다.
+    """
+    product = _get_product(db, payload.productId)
+
+    if _use_redis():
+        line = cart_store.add(db, user_id, payload.productId, payload.color, payload.size, payload.quantity)
+        return _to_item(line, product)
+
+    now = datetime.utcnow()
+    stmt = _insert(db)(models.Cart).values(
+        id=new_id(),
+        user_id=user_id,
+        product_id=payload.productId,
+        quantity=payload.quantity,
+        color=payload.color,
+        size=payload.size,
+        created_at=now,
+        updated_at=now,
     )
-
-    if cart:
-        cart.quantity += payload.quantity
-        cart.updated_at = datetime.utcnow()
-    else:
-        cart = models.Cart(
-            id=str(uuid4()),
-            user_id=user_id,
-            product_id=payload.productId,
-            quantity=payload.quantity,
-            color=payload.color,
-            size=payload.size,
-            created_at=datetime.utcnow(),
-            updated_at=datetime.utcnow(),
-        )
-        db.add(cart)
-
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[models.Cart.user_id, models.Cart.product_id, models.Cart.color, models.Cart.size],
+        set_={
+            "quantity": models.Cart.quantity + stmt.excluded.quantity,
+            "updated_at": stmt.excluded.updated_at,
+        },
+    ).returning(
+        models.Cart.id,
+        models.Cart.product_id,
+        models.Cart.quantity,
+        models.Cart.color,
+        models.Cart.size,
+        models.Cart.created_at,
+    )
+    cart = db.execute(stmt).one()
     db.commit()
-    db.refresh(cart)
 
-    return schemas.CartItem(
-        id=str(cart.id),
-        product_id=cart.product_id,
-        quantity=cart.quantity,
-        color=cart.color,
-        size=cart.size,
-        created_at=cart.created_at or datetime.utcnow(),
-        products=schemas.Product.from_orm(product),
-    )
+    return _to_item(cart, product)
 
 
 def update_cart_quantity(db: Session, user_id: str, cart_id: str, quantity: int) -> schemas.CartItem:
+    if _use_redis():
+        line = cart_store.set_quantity(db, user_id, cart_id, quantity)
+        if line is None:
+            raise NotFoundError("장바구니 항목을 찾을 수 없습니다.")
+        return _to_item(line, _get_product(db, line.product_id))
+
     cart = (
         db.query(models.Cart)
         .options(joinedload(models.Cart.product))
@@ -103,18 +142,15 @@ def update_cart_quantity(db: Session, user_id: str, cart_id: str, quantity: int)
     if cart.product is None:
         raise NotFoundError("상품을 찾을 수 없습니다.")
 
-    return schemas.CartItem(
-        id=str(cart.id),
-        product_id=cart.product_id,
-        quantity=cart.quantity,
-        color=cart.color,
-        size=cart.size,
-        created_at=cart.created_at or datetime.utcnow(),
-        products=schemas.Product.from_orm(cart.product),
-    )
+    return _to_item(cart, cart.product)
 
 
 def remove_cart_item(db: Session, user_id: str, cart_id: str) -> None:
+    if _use_redis():
+        if not cart_store.remove(db, user_id, cart_id):
+            raise NotFoundError("장바구니 항목을 찾을 수 없습니다.")
+        return
+
     cart = (
         db.query(models.Cart)
         .filter(models.Cart.id == cart_id, models.Cart.user_id == user_id)
@@ -128,7 +164,81 @@ def remove_cart_item(db: Session, user_id: str, cart_id: str) -> None:
 
 
 def clear_cart(db: Session, user_id: str) -> None:
+    if _use_redis():
+        cart_store.clear(user_id)
+        return
+
     db.query(models.Cart).filter(models.Cart.user_id == user_id).delete()
     db.commit()
 
 
+def _current_pricing_items(db: Session, user_id: str) -> List[PricingItem]:
+    if _use_redis():
+        lines = cart_store.lines(db, user_id)
+    else:
+        lines = (
+            db.query(models.Cart.product_id, models.Cart.quantity, models.Cart.color, models.Cart.size)
+            .filter(models.Cart.user_id == user_id)
+            .order_by(models.Cart.created_at.desc())
+            .all()
+        )
+    return [PricingItem(line.product_id, line.quantity, line.color, line.size) for line in lines]
+
+
+def get_quote(db: Session, user_id: str, payload: schemas.QuoteRequest) -> schemas.QuoteResponse:
+    """장바구니 견적 (같은 항목/쿠폰/포인트 견적은 QUOTE_CACHE_TTL 동안 캐시)
+
+    최종 금액은 주문 생성 시 다시 계산하므로, 캐시된 견적이 잠시 오래되어도 결제 금액에는
+    영향이 없습니다.
+    """
+    if payload.items is not None:
+        items = [PricingItem(i.productId, i.quantity, i.color, i.size) for i in payload.items]
+    else:
+        items = _current_pricing_items(db, user_id)
+
+    fingerprint = hashlib.sha256(json.dumps(
+        {
+            "items": [asdict(item) for item in items],
+            "coupon": payload.userCouponId,
+            "points": payload.usePoints,
+        },
+        sort_keys=True,
+    ).encode()).hexdigest()
+    cache_key = f"{QUOTE_CACHE_PREFIX}:{user_id}:{fingerprint}"
+    cached = cache_get(cache_key)
+    if cached:
+        return schemas.QuoteResponse(**cached)
+
+    settings = get_settings()
+    products = get_product_snapshots(db, [item.product_id for item in items])
+    quote = calculate_quote(
+        db,
+        user_id,
+        items,
+        products,
+        user_coupon_id=payload.userCouponId,
+        use_points=payload.usePoints,
+    )
+    response = schemas.QuoteResponse(
+        items=[
+            schemas.QuoteLine(
+                productId=line.product_id,
+                name=line.name,
+                imageUrl=line.image_url,
+                color=line.color,
+                size=line.size,
+                quantity=line.quantity,
+                unitPrice=line.unit_price,
+                lineTotal=line.line_total,
+            )
+            for line in quote.lines
+        ],
+        subtotal=quote.subtotal,
+        couponDiscount=quote.coupon_discount,
+        pointsUsed=quote.points_used,
+        shippingFee=quote.shipping_fee,
+        freeShippingThreshold=settings.free_shipping_threshold,
+        finalAmount=quote.final_amount,
+    )
+    cache_set(cache_key, response.model_dump(), settings.quote_cache_ttl)
+    return response
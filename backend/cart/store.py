@@ -0,0 +1,248 @@
+"""Redis 장바구니 저장소 (write-behind)
+
+CART_STORE=redis이면 활성 사용자의 장바구니를 Redis 해시에 보관하고,
+변경된 사용자를 dirty 집합에 기록해 두었다가 Celery 태스크(flush_dirty_carts)가
+주기적으로 Postgres carts 테이블에 반영합니다.
+
+- cart:{user_id}:qty  — 항목 키(product_id|color|size) -> 수량
+- cart:{user_id}:meta — 항목 키 -> {"id", "created_at"}, __loaded__ 표시
+
+Redis에 장바구니가 없으면(첫 접근/만료) Postgres에서 한 번 읽어 채웁니다.
+마지막 변경 후 반영 주기(CART_FLUSH_INTERVAL) 안에 Redis 데이터가 유실되면
+그 사이 변경은 사라질 수 있습니다.
+"""
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from typing import List, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from backend.core import models
+from backend.core.ids import new_id
+from backend.core.redis import get_redis_client
+
+CART_KEY_PREFIX = "cart"
+DIRTY_SET_KEY = "cart:dirty"
+CART_TTL = 60 * 60 * 24 * 7  # 7일 (만료되면 다음 접근 시 DB에서 다시 로드)
+LOADED_FIELD = "__loaded__"
+
+# DB에서 읽은 항목을 Redis에 채움 (다른 요청이 먼저 채웠으면 건너뜀)
+HYDRATE_SCRIPT = """
+if redis.call('HEXISTS', KEYS[2], ARGV[1]) == 1 then
+    return 0
+end
+for i = 3, #ARGV, 3 do
+    redis.call('HSET', KEYS[1], ARGV[i], ARGV[i + 1])
+    redis.call('HSET', KEYS[2], ARGV[i], ARGV[i + 2])
+end
+redis.call('HSET', KEYS[2], ARGV[1], 1)
+redis.call('EXPIRE', KEYS[1], ARGV[2])
+redis.call('EXPIRE', KEYS[2], ARGV[2])
+return 1
+"""
+
+# 조회한 항목이 그대로 있을 때만 수량 변경 (삭제/재추가되었으면 nil)
+SET_QUANTITY_SCRIPT = """
+if redis.call('HGET', KEYS[2], ARGV[1]) ~= ARGV[2] then
+    return false
+end
+redis.call('HSET', KEYS[1], ARGV[1], ARGV[3])
+redis.call('EXPIRE', KEYS[1], ARGV[4])
+redis.call('EXPIRE', KEYS[2], ARGV[4])
+redis.call('SADD', KEYS[3], ARGV[5])
+return 1
+"""
+
+
+@dataclass
+class CartLine:
+    """장바구니 항목"""
+
+    id: str
+    product_id: int
+    color: str
+    size: str
+    quantity: int
+    created_at: datetime
+
+
+def _qty_key(user_id: str) -> str:
+    return f"{CART_KEY_PREFIX}:{user_id}:qty"
+
+
+def _meta_key(user_id: str) -> str:
+    return f"{CART_KEY_PREFIX}:{user_id}:meta"
+
+
+def _line_key(product_id: int, color: str, size: str) -> str:
+    return f"{product_id}|{color}|{size}"
+
+
+def _meta_value(line_id: str, created_at: datetime) -> str:
+    return json.dumps({"id": line_id, "created_at": created_at.isoformat()})
+
+
+def _to_line(field: str, quantity: str, meta: str) -> CartLine:
+    product_id, color, size = field.split("|", 2)
+    data = json.loads(meta)
+    return CartLine(
+        id=data["id"],
+        product_id=int(product_id),
+        color=color,
+        size=size,
+        quantity=int(quantity),
+        created_at=datetime.fromisoformat(data["created_at"]),
+    )
+
+
+class RedisCartStore:
+    """사용자별 장바구니를 Redis 해시로 관리"""
+
+    def __init__(self):
+        self._hydrate = None
+        self._set_quantity = None
+
+    def _client(self):
+        return get_redis_client()
+
+    def _ensure_loaded(self, db: Session, user_id: str) -> None:
+        client = self._client()
+        if client.hexists(_meta_key(user_id), LOADED_FIELD):
+            return
+
+        rows = db.query(models.Cart).filter(models.Cart.user_id == user_id).all()
+        args: List = [LOADED_FIELD, CART_TTL]
+        for row in rows:
+            args.extend([
+                _line_key(row.product_id, row.color, row.size),
+                row.quantity,
+                _meta_value(str(row.id), row.created_at or datetime.utcnow()),
+            ])
+        if self._hydrate is None:
+            self._hydrate = client.register_script(HYDRATE_SCRIPT)
+        self._hydrate(keys=[_qty_key(user_id), _meta_key(user_id)], args=args)
+
+    def _touch(self, pipe, user_id: str) -> None:
+        pipe.expire(_qty_key(user_id), CART_TTL)
+        pipe.expire(_meta_key(user_id), CART_TTL)
+        pipe.sadd(DIRTY_SET_KEY, user_id)
+
+    def lines(self, db: Session, user_id: str) -> List[CartLine]:
+        """장바구니 항목 목록 (최근 추가 순)"""
+        self._ensure_loaded(db, user_id)
+        pipe = self._client().pipeline(transaction=True)
+        pipe.hgetall(_qty_key(user_id))
+        pipe.hgetall(_meta_key(user_id))
+        quantities, metas = pipe.execute()
+        lines = [
+            _to_line(field, quantity, metas[field])
+            for field, quantity in quantities.items()
+            if field in metas
+        ]
+        return sorted(lines, key=lambda line: line.created_at, reverse=True)
+
+    def add(self, db: Session, user_id: str, product_id: int, color: str, size: str, quantity: int) -> CartLine:
+        """항목 추가 (같은 옵션이 있으면 수량 증가)"""
+        self._ensure_loaded(db, user_id)
+        field = _line_key(product_id, color, size)
+        pipe = self._client().pipeline(transaction=True)
+        pipe.hsetnx(_meta_key(user_id), field, _meta_value(new_id(), datetime.utcnow()))
+        pipe.hincrby(_qty_key(user_id), field, quantity)
+        pipe.hget(_meta_key(user_id), field)
+        self._touch(pipe, user_id)
+        _, new_quantity, meta = pipe.execute()[:3]
+        return _to_line(field, new_quantity, meta)
+
+    def _find(self, user_id: str, line_id: str) -> Optional[Tuple[str, str]]:
+        """항목 ID로 (항목 키, 메타) 조회"""
+        for field, meta in self._client().hgetall(_meta_key(user_id)).items():
+            if field != LOADED_FIELD and json.loads(meta)["id"] == line_id:
+                return field, meta
+        return None
+
+    def set_quantity(self, db: Session, user_id: str, line_id: str, quantity: int) -> Optional[CartLine]:
+        """항목 수량 변경 (항목이 없으면 None)
+
+        조회 후 다른 요청이 항목을 삭제했으면 수량을 다시 쓰지 않도록,
+        메타 확인과 수량 변경을 스크립트 하나로 처리합니다.
+        """
+        self._ensure_loaded(db, user_id)
+        found = self._find(user_id, line_id)
+        if found is None:
+            return None
+        field, meta = found
+        client = self._client()
+        if self._set_quantity is None:
+            self._set_quantity = client.register_script(SET_QUANTITY_SCRIPT)
+        updated = self._set_quantity(
+            keys=[_qty_key(user_id), _meta_key(user_id), DIRTY_SET_KEY],
+            args=[field, meta, quantity, CART_TTL, user_id],
+        )
+        if not updated:
+            return None
+        return _to_line(field, quantity, meta)
+
+    def remove(self, db: Session, user_id: str, line_id: str) -> bool:
+        """항목 삭제 (항목이 없으면 False)"""
+        self._ensure_loaded(db, user_id)
+        found = self._find(user_id, line_id)
+        if found is None:
+            return False
+        field = found[0]
+        pipe = self._client().pipeline(transaction=True)
+        pipe.hdel(_qty_key(user_id), field)
+        pipe.hdel(_meta_key(user_id), field)
+        self._touch(pipe, user_id)
+        pipe.execute()
+        return True
+
+    def clear(self, user_id: str) -> None:
+        """장바구니 비우기 (빈 장바구니도 로드된 상태로 유지)"""
+        pipe = self._client().pipeline(transaction=True)
+        pipe.delete(_qty_key(user_id), _meta_key(user_id))
+        pipe.hset(_meta_key(user_id), LOADED_FIELD, 1)
+        self._touch(pipe, user_id)
+        pipe.execute()
+
+    def flush(self, db: Session, user_id: str) -> int:
+        """사용자 장바구니를 Postgres에 반영 (기존 행을 지우고 현재 항목으로 교체)
+
+        Returns:
+            반영한 항목 수
+        """
+        if not self._client().hexists(_meta_key(user_id), LOADED_FIELD):
+            # 반영 전에 만료된 경우 (DB가 마지막으로 반영된 상태)
+            return 0
+        lines = self.lines(db, user_id)
+        now = datetime.utcnow()
+
+        db.query(models.Cart).filter(models.Cart.user_id == user_id).delete(synchronize_session=False)
+        if lines:
+            db.bulk_insert_mappings(models.Cart, [
+                {
+                    "id": line.id,
+                    "user_id": user_id,
+                    "product_id": line.product_id,
+                    "quantity": line.quantity,
+                    "color": line.color,
+                    "size": line.size,
+                    "created_at": line.created_at,
+                    "updated_at": now,
+                }
+                for line in lines
+            ])
+        db.commit()
+        return len(lines)
+
+    def pop_dirty(self, count: int) -> List[str]:
+        """반영할 사용자 ID 꺼내기"""
+        return self._client().spop(DIRTY_SET_KEY, count) or []
+
+    def mark_dirty(self, user_ids: List[str]) -> None:
+        if user_ids:
+            self._client().sadd(DIRTY_SET_KEY, *user_ids)
+
+
+# 싱글톤 인스턴스
+cart_store = RedisCartStore()
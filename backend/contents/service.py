@@ -2,13 +2,13 @@ from __future__ import annotations
 
 from datetime import datetime
 from typing import List, Optional, Tuple
-from uuid import uuid4
 
 from sqlalchemy import func
 from sqlalchemy.orm import Session
 
 from backend.core import models
 from backend.core.exceptions import NotFoundError
+from backend.core.ids import new_id
 
 from . import schemas
 
@@ -58,7 +58,7 @@ def create_content(
 ) -> models.Content:
     """콘텐츠 생성"""
     content = models.Content(
-        id=str(uuid4()),
+        id=new_id(),
         title=payload.title,
         content_type=payload.content_type,
         reference_id=payload.reference_id,
@@ -1,13 +1,22 @@
 """감사 로그 모듈
 
 중요 작업에 대한 감사 로그를 기록합니다.
+로그는 요청 경로에서 메모리 버퍼에 넣기만 하고, 백그라운드 스레드가
+모아서 다중 행 INSERT로 audit_logs(월 파티션) 테이블에 저장합니다.
 """
+import atexit
+import json
+import threading
+import time
+from collections import deque
 from datetime import datetime
-from typing import Any, Optional
-from uuid import uuid4
+from typing import Any, Deque, List, Optional
 
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 
+from .config import get_settings
+from .ids import new_id
 from .logger import get_logger
 
 logger = get_logger(__name__)
@@ -57,7 +66,7 @@ class AuditLog:
         ip_address: Optional[str] = None,
         user_agent: Optional[str] = None,
     ):
-        self.id = str(uuid4())
+        self.id = new_id()
         self.action = action
         self.user_id = user_id
         self.resource_type = resource_type
@@ -79,6 +88,136 @@ class AuditLog:
             "user_agent": self.user_agent,
             "created_at": self.created_at.isoformat(),
         }
+    
+    def to_row(self) -> dict:
+        """audit_logs INSERT용 딕셔너리"""
+        return {**self.to_dict(), "created_at": self.created_at}
+
+
+class AuditSink:
+    """감사 로그 배치 저장소
+    
+    - 버퍼가 batch_size에 도달하거나 flush_interval이 지나면 한 번의 INSERT로 저장
+    - 버퍼가 가득 차면 호출자가 block_timeout 동안 대기 (백프레셔),
+      그래도 자리가 없으면 호출자 스레드에서 직접 저장
+    - DB 장애 시 버퍼에 되돌려 지수 백오프로 재시도
+    """
+    
+    def __init__(
+        self,
+        batch_size: int = 500,
+        flush_interval: float = 1.0,
+        max_buffer: int = 10000,
+        block_timeout: float = 0.1,
+    ):
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_buffer = max_buffer
+        self.block_timeout = block_timeout
+        self._buffer: Deque[AuditLog] = deque()
+        self._cond = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._failures = 0
+    
+    def emit(self, entry: AuditLog) -> None:
+        """감사 로그를 버퍼에 추가"""
+        self._ensure_thread()
+        with self._cond:
+            if len(self._buffer) >= self.max_buffer:
+                # 백프레셔: 플러시 스레드가 버퍼를 비울 때까지 잠시 대기
+                self._cond.notify_all()
+                self._cond.wait_for(lambda: len(self._buffer) < self.max_buffer, timeout=self.block_timeout)
+            accepted = len(self._buffer) < self.max_buffer
+            if accepted:
+                self._buffer.append(entry)
+                if len(self._buffer) >= self.batch_size:
+                    self._cond.notify_all()
+        
+        if not accepted:
+            self._write_or_drop([entry])
+    
+    def flush(self) -> None:
+        """버퍼에 남은 로그를 모두 저장 (종료 시 호출)"""
+        while True:
+            with self._cond:
+                batch = self._take_batch()
+            if not batch:
+                return
+            self._write_or_drop(batch)
+    
+    def pending(self) -> int:
+        with self._cond:
+            return len(self._buffer)
+    
+    def _ensure_thread(self) -> None:
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name="audit-sink", daemon=True)
+            self._thread.start()
+    
+    def _take_batch(self) -> List[AuditLog]:
+        count = min(self.batch_size, len(self._buffer))
+        batch = [self._buffer.popleft() for _ in range(count)]
+        if batch:
+            self._cond.notify_all()
+        return batch
+    
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: len(self._buffer) >= self.batch_size, timeout=self.flush_interval)
+                batch = self._take_batch()
+            if not batch:
+                continue
+            
+            try:
+                self._write(batch)
+                self._failures = 0
+            except Exception as e:
+                self._failures += 1
+                logger.error("Audit log flush failed (%d entries): %s", len(batch), str(e))
+                self._requeue(batch)
+                time.sleep(min(2 ** self._failures, 30))
+    
+    def _requeue(self, batch: List[AuditLog]) -> None:
+        """실패한 배치를 버퍼 앞쪽에 되돌림 (자리가 없으면 로거로 남김)"""
+        with self._cond:
+            room = max(self.max_buffer - len(self._buffer), 0)
+            keep, dropped = batch[:room], batch[room:]
+            self._buffer.extendleft(reversed(keep))
+        if dropped:
+            self._log_dropped(dropped)
+    
+    def _write(self, batch: List[AuditLog]) -> None:
+        from . import models
+        from .database import SessionLocal
+        
+        with SessionLocal() as db:
+            db.execute(insert(models.AuditLogRecord), [entry.to_row() for entry in batch])
+            db.commit()
+    
+    def _write_or_drop(self, batch: List[AuditLog]) -> None:
+        try:
+            self._write(batch)
+        except Exception as e:
+            logger.error("Audit log write failed (%d entries): %s", len(batch), str(e))
+            self._log_dropped(batch)
+    
+    @staticmethod
+    def _log_dropped(batch: List[AuditLog]) -> None:
+        # DB에 저장하지 못한 로그는 로그 수집기에서라도 복구할 수 있도록 전체 내용을 남김
+        for entry in batch:
+            logger.error("AUDIT_DROPPED %s", json.dumps(entry.to_dict(), ensure_ascii=False, default=str))
+
+
+_settings = get_settings()
+
+# 싱글톤 인스턴스
+audit_sink = AuditSink(
+    batch_size=_settings.audit_batch_size,
+    flush_interval=_settings.audit_flush_interval,
+    max_buffer=_settings.audit_buffer_size,
+)
+atexit.register(audit_sink.flush)
 
 
 def log_audit(
@@ -94,7 +233,7 @@ def log_audit(
     """감사 로그 기록
     
     Args:
-        db: 데이터베이스 세션
+        db: 데이터베이스 세션 (하위 호환용, 저장은 audit_sink가 별도 세션으로 처리)
         action: 수행된 액션
         user_id: 수행한 사용자 ID
         resource_type: 대상 리소스 유형 (user, order, product 등)
@@ -126,16 +265,15 @@ def log_audit(
         ip_address or "-",
     )
     
-    # TODO: DB에 저장 (audit_logs 테이블 필요)
-    # db.add(audit_log_model)
-    # db.commit()
+    # DB 저장은 배치로 처리 (요청 트랜잭션과 분리)
+    audit_sink.emit(audit_log)
     
     return audit_log
 
 
 def log_login(
     db: Session,
-    user_id: str,
+    user_id: Optional[str],
     success: bool,
     ip_address: Optional[str] = None,
     user_agent: Optional[str] = None,
@@ -48,6 +48,10 @@ class BaseAppSettings(BaseSettings):
     admin_email: str = Field("admin", description="관리자 이메일")
     admin_password_hash: str = Field("", description="관리자 비밀번호 해시 (bcrypt)")
 
+    # 비밀번호 해시
+    bcrypt_rounds: int = Field(12, description="bcrypt cost factor (변경 시 로그인 때 재해시)")
+    password_hash_workers: int = Field(4, description="비밀번호 해시 전용 스레드 수")
+
     # Redis
     redis_url: str = Field("redis://localhost:6379", description="Redis 접속 URL")
 
@@ -55,6 +59,74 @@ class BaseAppSettings(BaseSettings):
     celery_broker_url: str = Field("", description="Celery 브로커 URL")
     celery_result_backend: str = Field("", description="Celery 결과 백엔드 URL")
 
+    # 이미지 처리
+    image_workers: int = Field(2, description="이미지 파생본 생성 프로세스 수")
+
+    # 배송 추적
+    shipping_api_key: str = Field("", description="배송 추적 API 키 (스마트택배)")
+    shipment_bulk_max_rows: int = Field(2000, description="송장 일괄 등록 1회당 최대 행 수")
+    shipment_csv_row_bytes: int = Field(128, description="송장 CSV 업로드 크기 제한 계산용 행당 최대 바이트 수")
+
+    # 로깅
+    log_json: bool = Field(False, description="JSON 구조화 로그 출력 여부")
+    log_queue: bool = Field(True, description="QueueHandler로 로그 I/O를 별도 스레드에서 처리")
+    log_access_sample_rate: float = Field(1.0, description="2xx 액세스 로그 기본 샘플링 비율 (0~1)")
+    log_slow_request_seconds: float = Field(1.0, description="샘플링과 무관하게 기록할 느린 요청 기준(초)")
+
+    # SQL 모니터링
+    slow_query_seconds: float = Field(0.5, description="느린 쿼리 경고 기준(초)")
+    n_plus_one_threshold: int = Field(5, description="한 요청에서 같은 쿼리가 반복되면 N+1 경고 (0이면 비활성화)")
+
+    # 프로파일링
+    profiling_enabled: bool = Field(True, description="관리자 요청별 프로파일링 허용 여부")
+    profiling_interval: float = Field(0.005, description="요청별 프로파일링 샘플링 간격(초)")
+    profiling_continuous_interval: float = Field(0.0, description="상시 샘플링 간격(초, 0이면 비활성화)")
+
+    # 감사 로그
+    audit_batch_size: int = Field(500, description="감사 로그 배치 INSERT 크기")
+    audit_flush_interval: float = Field(1.0, description="감사 로그 최대 저장 지연(초)")
+    audit_buffer_size: int = Field(10000, description="감사 로그 메모리 버퍼 크기 (초과 시 백프레셔)")
+
+    # 주문 금액
+    free_shipping_threshold: int = Field(50000, description="무료 배송 기준 상품 금액(원)")
+    shipping_fee: int = Field(3000, description="기본 배송비(원)")
+    quote_cache_ttl: int = Field(30, description="장바구니 견적 캐시 유지 시간(초)")
+
+    # 주문 내역
+    order_summary_cache_ttl: int = Field(600, description="주문 상태별 건수 캐시 TTL(초, 상태 변경 시 삭제)")
+
+    # 쿠폰
+    coupon_redis_counter: bool = Field(False, description="선착순 쿠폰 남은 수량을 Redis 카운터로 먼저 확인")
+    coupon_issue_chunk_size: int = Field(5000, description="쿠폰 일괄 발행 INSERT ... SELECT 1회당 사용자 수")
+    coupon_expiry_notice_days: int = Field(3, description="쿠폰 만료 며칠 전에 알림을 보낼지")
+
+    # 포인트
+    points_validity_days: int = Field(365, description="적립 포인트 유효 기간(일)")
+    points_expiry_batch_size: int = Field(5000, description="포인트 소멸 처리 1회당 적립 내역 수")
+    points_reconcile_batch_size: int = Field(1000, description="포인트 잔액 대사 1회당 보정 사용자 수")
+
+    # 장바구니
+    cart_store: Literal["db", "redis"] = Field("db", description="장바구니 저장소 (redis: Redis 해시 + Postgres write-behind)")
+    cart_flush_interval: float = Field(5.0, description="Redis 장바구니를 Postgres에 반영하는 간격(초)")
+
+    # 알림
+    notification_fanout_batch_size: int = Field(1000, description="캠페인 알림 다중 행 INSERT 배치 크기")
+    back_in_stock_email: bool = Field(False, description="재입고 알림을 이메일로도 발송 (마케팅 수신 동의 사용자)")
+    notification_stream_heartbeat: float = Field(15.0, description="알림 스트림(SSE) keep-alive 간격(초)")
+
+    # 아웃박스
+    outbox_relay_interval: float = Field(2.0, description="아웃박스 릴레이 실행 간격(초)")
+    outbox_relay_batch_size: int = Field(100, description="아웃박스 릴레이 배치 크기")
+    outbox_retention_days: int = Field(7, description="전달 완료된 아웃박스 이벤트 보관 기간(일)")
+
+    # Idempotency-Key
+    idempotency_ttl: int = Field(86400, description="완료된 요청 응답 보관 시간(초)")
+    idempotency_lock_ttl: int = Field(60, description="처리 중 표시 만료 시간(초, 워커 장애 시 해제)")
+    idempotency_wait_timeout: float = Field(10.0, description="같은 키의 처리 중 요청을 기다리는 최대 시간(초)")
+
+    # 메트릭
+    metrics_token: str = Field("", description="/metrics 접근용 Bearer 토큰 (비어 있으면 인증 없음)")
+
     # Sentry
     sentry_dsn: str = Field("", description="Sentry DSN")
 
@@ -113,6 +185,10 @@ class ProdSettings(BaseAppSettings):
     access_token_expire_minutes: int = 15
     refresh_token_expire_days: int = 7
 
+    # 로그 수집기용 JSON 출력, 정상 응답 액세스 로그는 20%만 기록
+    log_json: bool = True
+    log_access_sample_rate: float = 0.2
+
 
 # 환경별 설정 클래스 매핑
 _settings_map = {
@@ -6,6 +6,7 @@ from sqlalchemy.orm import Session, sessionmaker
 
 from .config import get_settings
 from .logger import get_logger
+from .query_stats import instrument_engine
 
 logger = get_logger(__name__)
 
@@ -37,6 +38,9 @@ engine = create_engine(
     future=True,
 )
 
+# 요청당 쿼리 수/시간 집계
+instrument_engine(engine)
+
 SessionLocal = sessionmaker(
     bind=engine,
     autocommit=False,
@@ -73,7 +77,7 @@ def transaction(db: Session):
         db.commit()
     except Exception as e:
         db.rollback()
-        logger.error(f"Transaction failed: {e}")
+        logger.error("Transaction failed: %s", e)
         raise
 
 
@@ -92,7 +96,7 @@ def atomic_transaction():
         db.commit()
     except Exception as e:
         db.rollback()
-        logger.error(f"Atomic transaction failed: {e}")
+        logger.error("Atomic transaction failed: %s", e)
         raise
     finally:
         db.close()
@@ -60,6 +60,10 @@ class RateLimitError(DomainError):
     status_code = status.HTTP_429_TOO_MANY_REQUESTS
     error_code = "rate_limit_exceeded"
 
+    def __init__(self, message: str = "Rate limit exceeded", retry_after: int | None = None) -> None:
+        self.retry_after = retry_after
+        super().__init__(message)
+
 
 class ServiceUnavailableError(DomainError):
     """외부 서비스 연결 실패"""
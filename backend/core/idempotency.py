@@ -0,0 +1,185 @@
+"""Idempotency-Key 기반 중복 요청 방지
+
+클라이언트가 Idempotency-Key 헤더를 붙여 보낸 변경 요청은 Redis에 처리 상태를 기록하고,
+같은 키로 다시 오면 실행하지 않고 저장된 응답(상태 코드/본문)을 그대로 돌려줍니다.
+첫 요청이 아직 처리 중이면 완료될 때까지 기다렸다가 그 응답을 돌려줍니다.
+
+라우트에 의존성을 추가하여 사용합니다 (응답 저장은 idempotency_middleware가 담당):
+
+    @router.post("", dependencies=[Depends(idempotent("orders.create"))])
+
+키는 라우트 범위(scope)와 사용자(비로그인 시 IP)별로 구분하며, 같은 키를 다른 본문에
+재사용하면 422를 반환합니다. Redis를 사용할 수 없으면 멱등성 없이 처리합니다.
+"""
+import asyncio
+import base64
+import hashlib
+import json
+import re
+import time
+from typing import Any, Callable, Coroutine, Optional
+
+from fastapi import Request
+from fastapi.responses import JSONResponse, Response
+
+from .config import get_settings
+from .exceptions import ConflictError, ValidationError
+from .logger import get_logger
+from .rate_limit import get_client_ip
+from .redis import get_async_redis_client
+from .security import get_request_auth_payload
+
+logger = get_logger(__name__)
+
+IDEMPOTENCY_HEADER = "Idempotency-Key"
+REPLAYED_HEADER = "Idempotent-Replayed"
+KEY_PREFIX = "idempotency"
+
+# 허용 키 형식 (UUID 등)
+KEY_PATTERN = re.compile(r"^[A-Za-z0-9._:-]{8,255}$")
+
+# 처리 중인 요청을 확인하는 간격 (초)
+POLL_INTERVAL = 0.1
+
+# 저장하지 않고 키를 해제할 응답 (재시도하면 결과가 달라질 수 있음)
+RETRYABLE_STATUS_CODES = {401, 403, 408, 429}
+
+STATE_IN_PROGRESS = "in_progress"
+STATE_COMPLETED = "completed"
+
+
+class IdempotentReplay(Exception):
+    """저장된 응답 재전송 (의존성에서 발생시켜 라우트 실행을 건너뜀)"""
+
+    def __init__(self, record: dict) -> None:
+        self.record = record
+        super().__init__("Idempotent replay")
+
+
+def _fingerprint(request: Request, body: bytes) -> str:
+    digest = hashlib.sha256()
+    digest.update(request.method.encode())
+    digest.update(request.url.path.encode())
+    digest.update(body)
+    return digest.hexdigest()
+
+
+def _redis_key(scope: str, request: Request, idempotency_key: str) -> str:
+    payload = get_request_auth_payload(request)
+    subject = f"user:{payload['sub']}" if payload and payload.get("sub") else f"ip:{get_client_ip(request)}"
+    key_hash = hashlib.sha256(idempotency_key.encode()).hexdigest()
+    return f"{KEY_PREFIX}:{scope}:{subject}:{key_hash}"
+
+
+def idempotent(scope: str) -> Callable[[Request], Coroutine[Any, Any, None]]:
+    """Idempotency-Key 헤더를 처리하는 라우트 의존성
+
+    Args:
+        scope: 키를 구분할 라우트 범위 (예: "orders.create")
+
+    Raises:
+        IdempotentReplay: 같은 키의 요청이 이미 완료됨
+        ValidationError: 키 형식 오류 또는 다른 요청 본문에 키 재사용
+        ConflictError: 같은 키의 요청이 대기 시간 내에 끝나지 않음
+    """
+
+    async def dependency(request: Request) -> None:
+        idempotency_key = request.headers.get(IDEMPOTENCY_HEADER)
+        if not idempotency_key:
+            return
+        if not KEY_PATTERN.match(idempotency_key):
+            raise ValidationError("Idempotency-Key 형식이 올바르지 않습니다.")
+
+        settings = get_settings()
+        redis_key = _redis_key(scope, request, idempotency_key)
+        fingerprint = _fingerprint(request, await request.body())
+        marker = json.dumps({"state": STATE_IN_PROGRESS, "fingerprint": fingerprint})
+
+        try:
+            client = get_async_redis_client()
+            deadline = time.monotonic() + settings.idempotency_wait_timeout
+            while True:
+                if await client.set(redis_key, marker, nx=True, ex=settings.idempotency_lock_ttl):
+                    # 첫 요청: 미들웨어가 응답을 저장하도록 표시
+                    request.state.idempotency = {"key": redis_key, "fingerprint": fingerprint}
+                    return
+
+                stored = await client.get(redis_key)
+                if stored is None:
+                    # 첫 요청이 실패하여 키가 해제됨 -> 다시 획득 시도
+                    continue
+                record = json.loads(stored)
+                if record.get("fingerprint") != fingerprint:
+                    raise ValidationError("Idempotency-Key가 다른 요청에 이미 사용되었습니다.")
+                if record.get("state") == STATE_COMPLETED:
+                    raise IdempotentReplay(record)
+
+                if time.monotonic() >= deadline:
+                    raise ConflictError("같은 Idempotency-Key의 요청이 아직 처리 중입니다.")
+                await asyncio.sleep(POLL_INTERVAL)
+        except (IdempotentReplay, ValidationError, ConflictError):
+            raise
+        except Exception as e:
+            logger.warning("Idempotency storage error, processing without key: %s", str(e))
+
+    return dependency
+
+
+async def idempotency_middleware(request: Request, call_next) -> Response:
+    """idempotent 의존성이 표시한 요청의 응답 저장"""
+    try:
+        response = await call_next(request)
+    except Exception:
+        await _release(request)
+        raise
+
+    state = getattr(request.state, "idempotency", None)
+    if state is None:
+        return response
+
+    if response.status_code >= 500 or response.status_code in RETRYABLE_STATUS_CODES:
+        await _release(request)
+        return response
+
+    body = b"".join([chunk async for chunk in response.body_iterator])
+    record = {
+        "state": STATE_COMPLETED,
+        "fingerprint": state["fingerprint"],
+        "status_code": response.status_code,
+        "media_type": response.headers.get("content-type"),
+        "body": base64.b64encode(body).decode(),
+    }
+    try:
+        await get_async_redis_client().set(
+            state["key"], json.dumps(record), ex=get_settings().idempotency_ttl
+        )
+    except Exception as e:
+        logger.warning("Idempotency response store error: %s", str(e))
+
+    return Response(
+        content=body,
+        status_code=response.status_code,
+        headers={k: v for k, v in response.headers.items() if k.lower() != "content-length"},
+    )
+
+
+async def _release(request: Request) -> None:
+    """처리 중 표시 해제 (같은 키로 다시 실행할 수 있도록)"""
+    state: Optional[dict] = getattr(request.state, "idempotency", None)
+    if state is None:
+        return
+    try:
+        await get_async_redis_client().delete(state["key"])
+    except Exception as e:
+        logger.warning("Idempotency key release error: %s", str(e))
+
+
+async def idempotent_replay_handler(request: Request, exc: IdempotentReplay) -> Response:
+    """저장된 응답 재전송"""
+    record = exc.record
+    return Response(
+        content=base64.b64decode(record["body"]),
+        status_code=record["status_code"],
+        media_type=record.get("media_type") or JSONResponse.media_type,
+        headers={REPLAYED_HEADER: "true"},
+    )
@@ -0,0 +1,87 @@
+"""시간순 ID 생성 (UUIDv7, RFC 9562)
+
+uuid4는 값이 무작위라 PK B-tree의 임의 위치에 삽입되어 페이지 분할과 인덱스 팽창이
+생깁니다. UUIDv7은 앞 48비트가 밀리초 타임스탬프라 새 행이 인덱스 끝에 추가되고,
+PK 순서가 생성 순서와 같아 "최신순" 조회를 PK로 정렬할 수 있습니다.
+
+같은 밀리초 안에서는 rand_a(12비트)를 순번으로 사용하여 프로세스 내 단조 증가를 보장합니다
+(RFC 9562 6.2 Method 1). 기존 UUID(as_uuid=False) 컬럼에 그대로 저장됩니다.
+"""
+import os
+import threading
+import time
+import uuid
+from datetime import datetime, timezone
+
+# Crockford Base32 (I, L, O, U 제외)
+_CROCKFORD_ALPHABET = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"
+
+_MAX_SEQUENCE = 0xFFF
+_MS_PER_DAY = 24 * 60 * 60 * 1000
+
+_lock = threading.Lock()
+_last_ms = 0
+_sequence = 0
+
+
+def _next_timestamp_and_sequence() -> tuple[int, int]:
+    global _last_ms, _sequence
+    with _lock:
+        now_ms = time.time_ns() // 1_000_000
+        if now_ms > _last_ms:
+            _last_ms = now_ms
+            # 순번 시작값을 무작위로 두어 프로세스 간 충돌 가능성 완화 (상위 1비트는 여유분)
+            _sequence = int.from_bytes(os.urandom(2), "big") & 0x7FF
+        else:
+            # 시계가 되돌아갔거나 같은 밀리초: 마지막 시각 기준으로 순번 증가
+            _sequence += 1
+            if _sequence > _MAX_SEQUENCE:
+                _last_ms += 1
+                _sequence = 0
+        return _last_ms, _sequence
+
+
+def uuid7() -> uuid.UUID:
+    """UUIDv7 생성"""
+    timestamp_ms, sequence = _next_timestamp_and_sequence()
+    rand_b = int.from_bytes(os.urandom(8), "big") & ((1 << 62) - 1)
+    value = (
+        (timestamp_ms & ((1 << 48) - 1)) << 80
+        | 0x7 << 76
+        | sequence << 64
+        | 0b10 << 62
+        | rand_b
+    )
+    return uuid.UUID(int=value)
+
+
+def new_id() -> str:
+    """새 PK 값 (UUIDv7 문자열)"""
+    return str(uuid7())
+
+
+def uuid7_timestamp(value: str | uuid.UUID) -> datetime:
+    """UUIDv7에 기록된 생성 시각 (UTC)"""
+    if not isinstance(value, uuid.UUID):
+        value = uuid.UUID(value)
+    return datetime.fromtimestamp((value.int >> 80) / 1000, tz=timezone.utc)
+
+
+def sortable_code(value: str | uuid.UUID, length: int = 10) -> str:
+    """UUIDv7에서 하루 안에서 시간순으로 정렬되는 짧은 코드 (Crockford Base32)
+
+    하루 중 밀리초(27비트) + 순번(12비트) + 무작위(11비트) = 50비트를 10자로 표현합니다.
+    날짜와 함께 사용하면 사람이 읽을 수 있는 시간순 번호가 됩니다 (예: 주문번호).
+    """
+    if not isinstance(value, uuid.UUID):
+        value = uuid.UUID(value)
+    ms_of_day = (value.int >> 80) % _MS_PER_DAY
+    sequence = (value.int >> 64) & _MAX_SEQUENCE
+    random_bits = value.int & 0x7FF
+    number = (ms_of_day << 23) | (sequence << 11) | random_bits
+
+    chars = []
+    for _ in range(length):
+        chars.append(_CROCKFORD_ALPHABET[number & 0x1F])
+        number >>= 5
+    return "".join(reversed(chars))
@@ -1,32 +1,150 @@
+"""로깅 설정 모듈
+
+로그 레코드는 요청 처리 스레드에서 큐에 넣기만 하고, 포맷팅과 출력(I/O)은
+QueueListener 스레드에서 처리합니다. 요청마다 X-Request-Id를 컨텍스트에 저장하여
+같은 요청에서 남긴 로그를 묶어볼 수 있습니다.
+"""
+import atexit
+import json
 import logging
-from typing import Optional
+import queue
+import random
+import sys
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, Optional
 
 from .config import get_settings
 
+# 현재 요청의 ID (요청 밖에서는 "-")
+request_id_var: ContextVar[str] = ContextVar("request_id", default="-")
+
+# 로그 큐 최대 크기 (가득 차면 요청을 막지 않고 버림)
+LOG_QUEUE_SIZE = 10000
+
+# 경로별 2xx 액세스 로그 샘플링 비율 (라우트 경로 템플릿 기준, 미지정 시 설정값)
+# 조회가 많은 공개 API는 정상 응답을 일부만 기록
+ACCESS_LOG_SAMPLE_RATES: Dict[str, float] = {
+    "/products": 0.05,
+    "/products/{product_id}": 0.05,
+    "/banners/active": 0.01,
+    "/instagram/media": 0.01,
+    "/contents/by-reference/{content_type}/{reference_id}": 0.05,
+    "/metrics": 0.0,
+}
+
+# LogRecord 기본 속성 (JSON 출력 시 extra 필드만 골라내기 위함)
+_RESERVED_ATTRS = set(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "request_id"}
+
+_listener: Optional[QueueListener] = None
+
+
+class RequestIdFilter(logging.Filter):
+    """레코드에 현재 요청 ID 추가 (요청 스레드에서 실행되어야 함)"""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.request_id = request_id_var.get()
+        return True
+
+
+class JsonFormatter(logging.Formatter):
+    """한 줄 JSON 로그 포맷 (extra로 전달한 필드 포함)"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "request_id": getattr(record, "request_id", "-"),
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RESERVED_ATTRS and not key.startswith("_"):
+                entry[key] = value
+        if record.exc_info:
+            entry["exc_info"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            entry["exc_info"] = record.exc_text
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class NonBlockingQueueHandler(QueueHandler):
+    """큐가 가득 차면 대기하지 않고 레코드를 버리는 QueueHandler
+
+    기본 prepare()는 요청 스레드에서 전체 포맷팅을 수행하므로,
+    메시지 인자 병합과 예외 문자열화만 하고 포맷팅은 리스너에 맡깁니다.
+    """
+
+    dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            # traceback 객체는 다른 스레드에서 포맷하기 전에 문자열로 고정
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            NonBlockingQueueHandler.dropped += 1
+
 
 def configure_logging(level: int | str | None = None) -> None:
     """애플리케이션 전역 로깅 설정."""
+    global _listener
     settings = get_settings()
     resolved_level: int = _resolve_level(level, settings.debug)
 
-    # 기존 핸들러가 있으면 제거하고 새로 설정
+    # 기존 핸들러/리스너가 있으면 제거하고 새로 설정
     root_logger = logging.getLogger()
     if root_logger.handlers:
         root_logger.handlers.clear()
-    
-    logging.basicConfig(
-        level=resolved_level,
-        format="%(asctime)s [%(levelname)s] %(name)s - %(message)s",
-        force=True,  # 기존 설정을 덮어씀
-    )
-    
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+    stream_handler = logging.StreamHandler(sys.stderr)
+    if settings.log_json:
+        stream_handler.setFormatter(JsonFormatter())
+    else:
+        stream_handler.setFormatter(logging.Formatter(
+            "%(asctime)s [%(levelname)s] %(name)s [%(request_id)s] - %(message)s"
+        ))
+
+    if settings.log_queue:
+        log_queue: queue.Queue = queue.Queue(maxsize=LOG_QUEUE_SIZE)
+        handler: logging.Handler = NonBlockingQueueHandler(log_queue)
+        _listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+        _listener.start()
+        atexit.register(_stop_listener)
+    else:
+        handler = stream_handler
+    handler.addFilter(RequestIdFilter())
+
+    root_logger.addHandler(handler)
+    root_logger.setLevel(resolved_level)
+
     # uvicorn 로거도 설정
     uvicorn_logger = logging.getLogger("uvicorn")
     uvicorn_logger.setLevel(resolved_level)
     uvicorn_error_logger = logging.getLogger("uvicorn.error")
     uvicorn_error_logger.setLevel(resolved_level)
+    # 액세스 로그는 log_requests 미들웨어에서 샘플링하여 남김
     uvicorn_access_logger = logging.getLogger("uvicorn.access")
-    uvicorn_access_logger.setLevel(resolved_level)
+    uvicorn_access_logger.setLevel(logging.WARNING)
+
+
+def _stop_listener() -> None:
+    """종료 시 큐에 남은 로그 출력"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
 
 
 def _resolve_level(level: int | str | None, debug: bool) -> int:
@@ -37,8 +155,21 @@ def _resolve_level(level: int | str | None, debug: bool) -> int:
     return logging.DEBUG if debug else logging.INFO
 
 
+def should_log_access(route_path: str, status_code: int, duration: float) -> bool:
+    """액세스 로그 기록 여부 (2xx/3xx 정상 응답만 샘플링)
+
+    route_path는 /api/v1 prefix를 제거한 라우트 템플릿입니다.
+    에러 응답과 느린 요청은 항상 기록합니다.
+    """
+    settings = get_settings()
+    if status_code >= 400 or duration >= settings.log_slow_request_seconds:
+        return True
+    rate = ACCESS_LOG_SAMPLE_RATES.get(route_path, settings.log_access_sample_rate)
+    if rate >= 1.0:
+        return True
+    return rate > 0.0 and random.random() < rate
+
+
 def get_logger(name: Optional[str] = None) -> logging.Logger:
     """모듈별 로거 생성 헬퍼."""
     return logging.getLogger(name or "lune")
-
-
@@ -0,0 +1,158 @@
+"""Prometheus 메트릭 레지스트리
+
+요청 지연 시간, 진행 중 요청 수, 요청당 DB 쿼리, 캐시 적중률,
+Celery 태스크 소요 시간, 외부 API 지연 시간을 수집하여 /metrics로 노출합니다.
+
+여러 워커(uvicorn --workers, Celery prefork)로 실행할 때는 PROMETHEUS_MULTIPROC_DIR에
+공유 디렉터리를 지정하면 워커별 값을 합산하여 노출합니다 (시작 전 디렉터리를 비워야 함).
+"""
+import os
+import time
+from typing import Optional, Tuple
+
+import httpx
+from fastapi import Request
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+
+from .query_stats import QueryStats
+
+# API 버전 prefix (/api/v1/products와 /products를 같은 라우트로 집계)
+API_PREFIX = "/api/v1"
+
+# 라우트에 매칭되지 않은 요청 (404 스캐닝 등으로 라벨이 늘어나지 않도록)
+UNMATCHED_ROUTE = "unmatched"
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+HTTP_REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "HTTP 요청 처리 시간",
+    ["method", "route", "status"],
+    buckets=LATENCY_BUCKETS,
+)
+HTTP_REQUESTS_IN_PROGRESS = Gauge(
+    "http_requests_in_progress",
+    "처리 중인 HTTP 요청 수",
+    multiprocess_mode="livesum",
+)
+DB_QUERIES_PER_REQUEST = Histogram(
+    "db_queries_per_request",
+    "요청당 SQL 쿼리 수",
+    ["route"],
+    buckets=(0, 1, 2, 5, 10, 20, 50, 100),
+)
+DB_TIME_PER_REQUEST = Histogram(
+    "db_query_seconds_per_request",
+    "요청당 SQL 쿼리 총 소요 시간",
+    ["route"],
+    buckets=LATENCY_BUCKETS,
+)
+CACHE_REQUESTS = Counter(
+    "cache_requests_total",
+    "Redis 캐시 조회 결과",
+    ["prefix", "result"],
+)
+CELERY_TASK_DURATION = Histogram(
+    "celery_task_duration_seconds",
+    "Celery 태스크 실행 시간",
+    ["task", "state"],
+    buckets=(0.1, 0.5, 1.0, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0),
+)
+OUTBOUND_HTTP_DURATION = Histogram(
+    "outbound_http_duration_seconds",
+    "외부 API 호출 시간 (응답 헤더 수신까지)",
+    ["integration", "method", "status"],
+    buckets=LATENCY_BUCKETS,
+)
+
+
+def is_multiprocess() -> bool:
+    return bool(os.environ.get("PROMETHEUS_MULTIPROC_DIR"))
+
+
+def render_metrics() -> Tuple[bytes, str]:
+    """노출 포맷으로 메트릭 직렬화 (멀티 프로세스면 워커별 값 합산)"""
+    if is_multiprocess():
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return generate_latest(registry), CONTENT_TYPE_LATEST
+
+
+def mark_process_dead(pid: Optional[int] = None) -> None:
+    """종료된 워커의 livesum 게이지 정리"""
+    if is_multiprocess():
+        multiprocess.mark_process_dead(pid or os.getpid())
+
+
+def route_label(request: Request) -> str:
+    """요청의 라우트 템플릿 (예: /products/{product_id})"""
+    route = request.scope.get("route")
+    path = getattr(route, "path", None)
+    if path is None:
+        return UNMATCHED_ROUTE
+    if path.startswith(API_PREFIX):
+        path = path[len(API_PREFIX):] or "/"
+    return path
+
+
+def observe_request(
+    method: str,
+    route: str,
+    status_code: int,
+    duration: float,
+    query_stats: Optional[QueryStats] = None,
+) -> None:
+    """요청 1건의 지연 시간 및 DB 사용량 기록"""
+    HTTP_REQUEST_DURATION.labels(method, route, str(status_code)).observe(duration)
+    if query_stats is not None:
+        DB_QUERIES_PER_REQUEST.labels(route).observe(query_stats.count)
+        DB_TIME_PER_REQUEST.labels(route).observe(query_stats.duration)
+
+
+def record_cache_lookup(key: str, hit: bool) -> None:
+    """캐시 조회 결과 기록 (키의 첫 구간을 prefix로 사용)"""
+    CACHE_REQUESTS.labels(key.split(":", 1)[0], "hit" if hit else "miss").inc()
+
+
+class InstrumentedTransport(httpx.AsyncBaseTransport):
+    """외부 API 호출 시간을 기록하는 httpx 전송 계층"""
+
+    def __init__(self, integration: str, transport: Optional[httpx.AsyncBaseTransport] = None):
+        self.integration = integration
+        self._transport = transport or httpx.AsyncHTTPTransport()
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        start = time.perf_counter()
+        status = "error"
+        try:
+            response = await self._transport.handle_async_request(request)
+            status = f"{response.status_code // 100}xx"
+            return response
+        finally:
+            OUTBOUND_HTTP_DURATION.labels(self.integration, request.method, status).observe(
+                time.perf_counter() - start
+            )
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+def instrumented_client(integration: str, **kwargs) -> httpx.AsyncClient:
+    """외부 API 호출 시간이 기록되는 AsyncClient 생성
+
+    Example:
+        async with instrumented_client("kakao", timeout=30.0) as client:
+            await client.post(...)
+    """
+    return httpx.AsyncClient(transport=InstrumentedTransport(integration), **kwargs)
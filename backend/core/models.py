@@ -1,7 +1,7 @@
 from datetime import datetime
 from typing import Any, List, Optional
 
-from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Integer, String, Text, UniqueConstraint
 from sqlalchemy.dialects.postgresql import ARRAY, JSONB, UUID
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 
@@ -71,6 +71,7 @@ class Product(Base):
 
 class Cart(Base):
     __tablename__ = "carts"
+    __table_args__ = (UniqueConstraint("user_id", "product_id", "color", "size"),)
 
     id: Mapped[str] = mapped_column(UUID(as_uuid=False), primary_key=True)
     user_id: Mapped[str] = mapped_column(UUID(as_uuid=False), ForeignKey("users.id"), nullable=False)
@@ -94,6 +95,7 @@ class Order(Base):
     status: Mapped[str] = mapped_column(String(50), nullable=False, default="pending")
     total_amount: Mapped[int] = mapped_column(Integer, nullable=False)
     discount_amount: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    points_used: Mapped[int] = mapped_column(Integer, nullable=False, default=0)  # 취소 시 반환
     shipping_fee: Mapped[int] = mapped_column(Integer, nullable=False, default=3000)
     final_amount: Mapped[int] = mapped_column(Integer, nullable=False)
 
@@ -200,6 +202,7 @@ class Coupon(Base):
 
 class UserCoupon(Base):
     __tablename__ = "user_coupons"
+    __table_args__ = (UniqueConstraint("user_id", "coupon_id"),)
 
     id: Mapped[str] = mapped_column(UUID(as_uuid=False), primary_key=True)
     user_id: Mapped[str] = mapped_column(UUID(as_uuid=False), ForeignKey("users.id"), nullable=False)
@@ -221,6 +224,9 @@ class UserPoints(Base):
     points: Mapped[int] = mapped_column(Integer, nullable=False)
     reason: Mapped[str] = mapped_column(String(255), nullable=False)
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    # 적립 내역의 소멸 예정/처리 시각 (사용/소멸 내역은 NULL)
+    expires_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    expired_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
 
     user: Mapped["User"] = relationship(back_populates="point_history")
 
@@ -298,3 +304,64 @@ class PasswordReset(Base):
     user: Mapped[User] = relationship()
 
 
+class UploadedFile(Base):
+    """Storage에 업로드된 파일과 이미지 파생본 매니페스트"""
+    __tablename__ = "uploaded_files"
+
+    id: Mapped[str] = mapped_column(UUID(as_uuid=False), primary_key=True)
+    bucket: Mapped[str] = mapped_column(String(100), nullable=False)
+    file_path: Mapped[str] = mapped_column(Text, unique=True, nullable=False)
+    url: Mapped[str] = mapped_column(Text, nullable=False)
+    content_type: Mapped[str] = mapped_column(String(100), nullable=False)
+    size: Mapped[int] = mapped_column(Integer, nullable=False)
+    content_hash: Mapped[Optional[str]] = mapped_column(String(64), nullable=True)  # SHA256 (bucket과 함께 유니크)
+    # [{name, format, width, height, url, size}, ...]
+    variants: Mapped[Any] = mapped_column(JSONB, default=list)
+    uploaded_by: Mapped[Optional[str]] = mapped_column(UUID(as_uuid=False), ForeignKey("users.id"), nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    # 마지막 업로드 시각 (중복 업로드로 기존 파일을 돌려줄 때도 갱신, 미참조 파일 정리 기준)
+    last_uploaded_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+
+
+class AuditLogRecord(Base):
+    """감사 로그 (created_at 기준 월 파티션 테이블)"""
+    __tablename__ = "audit_logs"
+
+    created_at: Mapped[datetime] = mapped_column(DateTime, primary_key=True, default=datetime.utcnow)
+    id: Mapped[str] = mapped_column(UUID(as_uuid=False), primary_key=True)
+    action: Mapped[str] = mapped_column(String(50), nullable=False)
+    user_id: Mapped[Optional[str]] = mapped_column(UUID(as_uuid=False), nullable=True)
+    resource_type: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)
+    resource_id: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
+    details: Mapped[Any] = mapped_column(JSONB, default=dict)
+    ip_address: Mapped[Optional[str]] = mapped_column(String(45), nullable=True)
+    user_agent: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+
+
+class Notification(Base):
+    """사용자 알림"""
+    __tablename__ = "notifications"
+
+    id: Mapped[str] = mapped_column(UUID(as_uuid=False), primary_key=True)
+    user_id: Mapped[str] = mapped_column(UUID(as_uuid=False), ForeignKey("users.id"), nullable=False)
+    type: Mapped[str] = mapped_column(String(50), nullable=False)  # order, review, promotion, system
+    title: Mapped[str] = mapped_column(String(255), nullable=False)
+    message: Mapped[str] = mapped_column(Text, nullable=False)
+    link: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
+    is_read: Mapped[bool] = mapped_column(Boolean, default=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+
+
+class OutboxEvent(Base):
+    """트랜잭셔널 아웃박스 (도메인 변경과 같은 트랜잭션에 기록, 릴레이가 Celery로 전달)"""
+    __tablename__ = "outbox_events"
+
+    id: Mapped[str] = mapped_column(UUID(as_uuid=False), primary_key=True)
+    event_type: Mapped[str] = mapped_column(String(100), nullable=False)
+    aggregate_type: Mapped[str] = mapped_column(String(50), nullable=False)
+    aggregate_id: Mapped[str] = mapped_column(String(100), nullable=False)
+    payload: Mapped[Any] = mapped_column(JSONB, default=dict)
+    attempts: Mapped[int] = mapped_column(Integer, default=0)
+    last_error: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    dispatched_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
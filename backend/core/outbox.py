@@ -0,0 +1,133 @@
+"""트랜잭셔널 아웃박스
+
+주문 변경 등 도메인 변경과 같은 트랜잭션에 outbox_events 행을 기록하고,
+릴레이(celery beat)가 미전달 행을 모아 Celery 태스크로 전달합니다.
+요청 처리는 이메일/알림/캐시 무효화 같은 부수 효과를 기다리지 않으며,
+커밋된 변경의 부수 효과는 브로커 장애가 있어도 유실되지 않습니다.
+
+전달은 at-least-once입니다. 전달 후 dispatched_at 기록 전에 실패하면 같은 이벤트가
+다시 전달될 수 있으므로, 소비자는 already_handled/mark_handled로 중복을 거릅니다.
+"""
+from datetime import datetime
+from typing import Callable, Dict, Optional
+
+from sqlalchemy.orm import Session
+
+from . import models
+from .ids import new_id
+from .logger import get_logger
+from .redis import get_redis_client
+
+logger = get_logger(__name__)
+
+HANDLED_KEY_PREFIX = "outbox:handled"
+HANDLED_TTL = 60 * 60 * 24 * 7  # 7일 (재전달 가능 기간보다 길게)
+
+# 전달 실패 사유 최대 길이
+MAX_ERROR_LENGTH = 1000
+
+
+class OutboxEventType:
+    """아웃박스 이벤트 유형"""
+    ORDER_CREATED = "order.created"
+    ORDER_STATUS_CHANGED = "order.status_changed"
+    ORDER_CANCELLED = "order.cancelled"
+    ORDER_SHIPMENTS_REGISTERED = "order.shipments_registered"
+
+
+# 이벤트 유형 -> 처리 태스크 이름
+EVENT_HANDLERS: Dict[str, str] = {
+    OutboxEventType.ORDER_CREATED: "backend.tasks.order_tasks.handle_order_created",
+    OutboxEventType.ORDER_STATUS_CHANGED: "backend.tasks.order_tasks.handle_order_status_changed",
+    OutboxEventType.ORDER_CANCELLED: "backend.tasks.order_tasks.handle_order_cancelled",
+    OutboxEventType.ORDER_SHIPMENTS_REGISTERED: "backend.tasks.order_tasks.handle_shipments_registered",
+}
+
+
+def add_outbox_event(
+    db: Session,
+    event_type: str,
+    aggregate_type: str,
+    aggregate_id: str,
+    payload: Optional[dict] = None,
+) -> models.OutboxEvent:
+    """세션에 아웃박스 이벤트 추가 (커밋은 호출자의 트랜잭션에서 함께 수행)"""
+    if event_type not in EVENT_HANDLERS:
+        raise ValueError(f"Unknown outbox event type: {event_type}")
+
+    event = models.OutboxEvent(
+        id=new_id(),
+        event_type=event_type,
+        aggregate_type=aggregate_type,
+        aggregate_id=str(aggregate_id),
+        payload=payload or {},
+        attempts=0,
+        created_at=datetime.utcnow(),
+    )
+    db.add(event)
+    return event
+
+
+def relay_pending_events(
+    db: Session,
+    send: Callable[[str, dict], None],
+    batch_size: int,
+) -> int:
+    """미전달 이벤트 한 배치를 전달하고 dispatched_at 기록
+
+    FOR UPDATE SKIP LOCKED로 행을 점유하므로 릴레이가 여러 개 실행되어도
+    같은 이벤트를 동시에 전달하지 않습니다. 전달에 실패하면 (브로커 장애로 보고)
+    해당 배치의 나머지는 다음 실행으로 미룹니다.
+
+    Args:
+        send: (태스크 이름, kwargs)를 받아 전달하는 함수
+        batch_size: 한 번에 처리할 최대 이벤트 수
+
+    Returns:
+        전달한 이벤트 수
+    """
+    events = (
+        db.query(models.OutboxEvent)
+        .filter(models.OutboxEvent.dispatched_at.is_(None))
+        .order_by(models.OutboxEvent.created_at)
+        .limit(batch_size)
+        .with_for_update(skip_locked=True)
+        .all()
+    )
+
+    dispatched = 0
+    now = datetime.utcnow()
+    for event in events:
+        try:
+            send(EVENT_HANDLERS[event.event_type], {"event_id": str(event.id), **(event.payload or {})})
+        except Exception as e:
+            event.attempts = (event.attempts or 0) + 1
+            event.last_error = str(e)[:MAX_ERROR_LENGTH]
+            logger.warning("Outbox dispatch failed for %s (%s): %s", event.id, event.event_type, str(e))
+            break
+        event.dispatched_at = now
+        event.attempts = (event.attempts or 0) + 1
+        dispatched += 1
+
+    db.commit()
+    return dispatched
+
+
+def already_handled(event_id: Optional[str]) -> bool:
+    """이미 처리한 이벤트인지 확인 (Redis를 사용할 수 없으면 False)"""
+    if not event_id:
+        return False
+    try:
+        return bool(get_redis_client().exists(f"{HANDLED_KEY_PREFIX}:{event_id}"))
+    except Exception:
+        return False
+
+
+def mark_handled(event_id: Optional[str]) -> None:
+    """이벤트 처리 완료 기록"""
+    if not event_id:
+        return
+    try:
+        get_redis_client().set(f"{HANDLED_KEY_PREFIX}:{event_id}", 1, ex=HANDLED_TTL)
+    except Exception as e:
+        logger.warning("Outbox handled marker write error: %s", str(e))
@@ -0,0 +1,318 @@
+"""요청 프로파일링
+
+백그라운드 스레드가 sys._current_frames()로 모든 스레드의 스택을 주기적으로 샘플링합니다.
+각 스택은 엔드포인트 함수의 코드 객체로 라우트를 판별하므로, 이벤트 루프에서 실행되는
+async 라우트와 스레드 풀에서 실행되는 동기 라우트를 모두 프로파일링할 수 있습니다.
+
+- 요청별 프로파일: 관리자가 X-Profile 헤더(또는 ?__profile=1)를 붙여 요청하면
+  해당 라우트의 샘플을 speedscope 형식으로 Redis에 저장하고 X-Profile-Id로 알려줍니다.
+- 상시 샘플링: PROFILING_CONTINUOUS_INTERVAL을 설정하면 낮은 빈도로 샘플링하여
+  라우트별 핫 스택을 Redis에 누적합니다 (워커 간 합산).
+
+같은 라우트에 동시 요청이 있으면 요청별 프로파일에 다른 요청의 샘플이 섞일 수 있습니다.
+"""
+import sys
+import threading
+import time
+import uuid
+from collections import Counter
+from types import CodeType, FrameType
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from fastapi import Request
+
+from .config import get_settings
+from .exceptions import UnauthorizedError
+from .logger import get_logger
+from .redis import cache_get, cache_set, get_redis_client
+from .security import get_admin_user_id, get_request_auth_payload
+
+logger = get_logger(__name__)
+
+PROFILE_HEADER = "X-Profile"
+PROFILE_QUERY_PARAM = "__profile"
+
+PROFILE_KEY_PREFIX = "profile"
+PROFILE_TTL = 60 * 60 * 24  # 1일
+HOT_STACKS_PREFIX = "profile:stacks"
+HOT_STACKS_TTL = 60 * 60 * 24 * 7  # 7일
+HOT_STACKS_FLUSH_INTERVAL = 30.0  # 초
+
+# API 버전 prefix (같은 엔드포인트를 하나의 라우트로 집계)
+API_PREFIX = "/api/v1"
+
+# 한 스택에 보관할 최대 프레임 수 (리프 쪽 우선)
+MAX_STACK_DEPTH = 64
+
+Stack = Tuple[CodeType, ...]
+
+
+def _frame_name(code: CodeType) -> str:
+    return f"{code.co_name} ({code.co_filename}:{code.co_firstlineno})"
+
+
+def _collapse(stack: Stack) -> str:
+    """flamegraph collapsed 형식 (root;...;leaf)"""
+    return ";".join(_frame_name(code) for code in stack)
+
+
+class ProfileSession:
+    """한 요청 동안 수집한 스택 샘플"""
+
+    def __init__(self):
+        self.id = uuid.uuid4().hex
+        self.started_at = time.perf_counter()
+        self.ended_at: Optional[float] = None
+        self.samples: List[Tuple[Optional[str], Stack, float]] = []
+
+    def add(self, route: Optional[str], stack: Stack, weight: float) -> None:
+        self.samples.append((route, stack, weight))
+
+    def to_speedscope(self, route: str) -> dict:
+        """speedscope sampled 프로파일 (https://www.speedscope.app)"""
+        frame_index: Dict[CodeType, int] = {}
+        frames: List[dict] = []
+        samples: List[List[int]] = []
+        weights: List[float] = []
+
+        for sample_route, stack, weight in self.samples:
+            if sample_route != route:
+                continue
+            indices = []
+            for code in stack:
+                if code not in frame_index:
+                    frame_index[code] = len(frames)
+                    frames.append({
+                        "name": code.co_name,
+                        "file": code.co_filename,
+                        "line": code.co_firstlineno,
+                    })
+                indices.append(frame_index[code])
+            samples.append(indices)
+            weights.append(weight)
+
+        duration = (self.ended_at or time.perf_counter()) - self.started_at
+        return {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "shared": {"frames": frames},
+            "profiles": [{
+                "type": "sampled",
+                "name": route,
+                "unit": "seconds",
+                "startValue": 0,
+                "endValue": duration,
+                "samples": samples,
+                "weights": weights,
+            }],
+            "name": route,
+            "exporter": "lune-profiler",
+        }
+
+
+class StackSampler:
+    """sys._current_frames() 기반 샘플링 프로파일러"""
+
+    def __init__(self):
+        self._endpoints: Dict[CodeType, str] = {}
+        self._sessions: Set[ProfileSession] = set()
+        self._hot_stacks: Dict[str, Counter] = {}
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._wakeup = threading.Event()
+        self._last_flush = time.monotonic()
+
+    # ------------------------------------------
+    # 라우트 등록
+    # ------------------------------------------
+
+    def register_routes(self, routes: Iterable[Any]) -> None:
+        """엔드포인트 함수 코드 객체 -> 라우트 템플릿 매핑"""
+        for route in routes:
+            endpoint = getattr(route, "endpoint", None)
+            code = getattr(endpoint, "__code__", None)
+            path = getattr(route, "path", None)
+            if code is None or path is None:
+                continue
+            if path.startswith(API_PREFIX):
+                path = path[len(API_PREFIX):] or "/"
+            self._endpoints.setdefault(code, path)
+
+    def _attribute(self, stack: Stack) -> Optional[str]:
+        for code in reversed(stack):
+            route = self._endpoints.get(code)
+            if route is not None:
+                return route
+        return None
+
+    # ------------------------------------------
+    # 세션
+    # ------------------------------------------
+
+    def start_session(self) -> ProfileSession:
+        session = ProfileSession()
+        with self._lock:
+            self._sessions.add(session)
+        self._ensure_thread()
+        self._wakeup.set()
+        return session
+
+    def stop_session(self, session: ProfileSession) -> None:
+        session.ended_at = time.perf_counter()
+        with self._lock:
+            self._sessions.discard(session)
+
+    # ------------------------------------------
+    # 샘플링 루프
+    # ------------------------------------------
+
+    def _ensure_thread(self) -> None:
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+            self._thread.start()
+
+    def start_continuous(self) -> None:
+        """상시 샘플링 시작 (설정된 경우)"""
+        if get_settings().profiling_continuous_interval > 0:
+            self._ensure_thread()
+
+    def _current_interval(self) -> Optional[float]:
+        settings = get_settings()
+        if self._sessions:
+            return settings.profiling_interval
+        if settings.profiling_continuous_interval > 0:
+            return settings.profiling_continuous_interval
+        return None
+
+    def _run(self) -> None:
+        last_sample = time.perf_counter()
+        while True:
+            interval = self._current_interval()
+            if interval is None:
+                # 세션이 없고 상시 샘플링도 꺼져 있으면 대기
+                self._wakeup.wait()
+                self._wakeup.clear()
+                last_sample = time.perf_counter()
+                continue
+
+            time.sleep(interval)
+            now = time.perf_counter()
+            try:
+                self._sample(now - last_sample)
+                self._maybe_flush()
+            except Exception as e:
+                logger.warning("Profiler sampling error: %s", str(e))
+            last_sample = now
+
+    def _sample(self, weight: float) -> None:
+        own_ident = threading.get_ident()
+        with self._lock:
+            sessions = list(self._sessions)
+        continuous = get_settings().profiling_continuous_interval > 0
+
+        for ident, frame in sys._current_frames().items():
+            if ident == own_ident:
+                continue
+            stack = self._extract(frame)
+            route = self._attribute(stack)
+            if route is None:
+                # 엔드포인트 밖(유휴 스레드, 미들웨어 등)은 기록하지 않음
+                continue
+            for session in sessions:
+                session.add(route, stack, weight)
+            if continuous:
+                with self._lock:
+                    self._hot_stacks.setdefault(route, Counter())[_collapse(stack)] += 1
+
+    @staticmethod
+    def _extract(frame: Optional[FrameType]) -> Stack:
+        codes: List[CodeType] = []
+        while frame is not None and len(codes) < MAX_STACK_DEPTH:
+            codes.append(frame.f_code)
+            frame = frame.f_back
+        codes.reverse()
+        return tuple(codes)
+
+    # ------------------------------------------
+    # 핫 스택 집계
+    # ------------------------------------------
+
+    def _maybe_flush(self) -> None:
+        if time.monotonic() - self._last_flush < HOT_STACKS_FLUSH_INTERVAL:
+            return
+        self.flush_hot_stacks()
+
+    def flush_hot_stacks(self) -> None:
+        """로컬 집계를 Redis에 합산 (Redis가 없으면 로컬에 유지)"""
+        self._last_flush = time.monotonic()
+        with self._lock:
+            pending, self._hot_stacks = self._hot_stacks, {}
+        if not pending:
+            return
+
+        try:
+            pipe = get_redis_client().pipeline(transaction=False)
+            for route, stacks in pending.items():
+                key = f"{HOT_STACKS_PREFIX}:{route}"
+                for stack, count in stacks.items():
+                    pipe.hincrby(key, stack, count)
+                pipe.expire(key, HOT_STACKS_TTL)
+            pipe.execute()
+        except Exception as e:
+            logger.warning("Hot stack flush failed, keeping local: %s", str(e))
+            with self._lock:
+                for route, stacks in pending.items():
+                    self._hot_stacks.setdefault(route, Counter()).update(stacks)
+
+    def get_hot_stacks(self, route: str, limit: int = 20) -> List[Tuple[str, int]]:
+        """라우트의 핫 스택 (샘플 수 많은 순)"""
+        totals: Counter = Counter()
+        with self._lock:
+            totals.update(self._hot_stacks.get(route, {}))
+        try:
+            stored = get_redis_client().hgetall(f"{HOT_STACKS_PREFIX}:{route}")
+            totals.update({stack: int(count) for stack, count in stored.items()})
+        except Exception:
+            pass
+        return totals.most_common(limit)
+
+
+# 싱글톤 인스턴스
+stack_sampler = StackSampler()
+
+
+def profile_requested(request: Request) -> bool:
+    """관리자가 프로파일링을 요청했는지 확인 (get_admin_user_id로 권한 검사)"""
+    if not get_settings().profiling_enabled:
+        return False
+    if not request.headers.get(PROFILE_HEADER) and PROFILE_QUERY_PARAM not in request.query_params:
+        return False
+
+    payload = get_request_auth_payload(request)
+    if payload is None:
+        return False
+    try:
+        get_admin_user_id(payload)
+    except UnauthorizedError:
+        return False
+    return True
+
+
+def store_profile(session: ProfileSession, route: str) -> str:
+    """speedscope 프로파일 저장 후 ID 반환"""
+    cache_set(f"{PROFILE_KEY_PREFIX}:{session.id}", session.to_speedscope(route), PROFILE_TTL)
+    return session.id
+
+
+def get_profile(profile_id: str) -> Optional[dict]:
+    return cache_get(f"{PROFILE_KEY_PREFIX}:{profile_id}")
+
+
+def speedscope_to_collapsed(profile: dict) -> str:
+    """speedscope 프로파일을 flamegraph collapsed 텍스트로 변환"""
+    frames = profile["shared"]["frames"]
+    counts: Counter = Counter()
+    for data in profile["profiles"]:
+        for sample, weight in zip(data["samples"], data["weights"]):
+            stack = ";".join(f"{frames[i]['name']} ({frames[i]['file']}:{frames[i]['line']})" for i in sample)
+            counts[stack] += weight
+    return "\n".join(f"{stack} {round(weight * 1000)}" for stack, weight in counts.most_common())
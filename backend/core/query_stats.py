@@ -0,0 +1,152 @@
+"""요청 단위 SQL 쿼리 통계 및 N+1 감지
+
+SQLAlchemy 엔진 이벤트로 실행된 쿼리 수와 소요 시간을 현재 요청의 컨텍스트에 누적합니다.
+쿼리는 파라미터/리터럴을 제거한 지문(fingerprint)으로 정규화하여, 한 요청에서
+같은 지문이 반복되면 N+1 패턴으로 보고합니다.
+
+테스트에서는 assert_max_queries로 엔드포인트의 쿼리 예산을 고정할 수 있습니다:
+
+    with assert_max_queries(3):
+        client.get("/admin/orders")
+"""
+import re
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Iterator, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from .config import get_settings
+from .logger import get_logger
+
+logger = get_logger(__name__)
+
+# 로그에 남길 SQL 최대 길이
+MAX_LOGGED_SQL_LENGTH = 500
+
+_PLACEHOLDER_PATTERN = re.compile(r"%\(\w+\)s|%s|\?|:\w+|\$\d+")
+_STRING_PATTERN = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_PATTERN = re.compile(r"\b\d+(?:\.\d+)?\b")
+_IN_LIST_PATTERN = re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)")
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+
+
+@dataclass
+class QueryStats:
+    """한 요청(또는 작업)에서 실행된 쿼리 통계"""
+
+    count: int = 0
+    duration: float = 0.0
+    fingerprints: Counter = field(default_factory=Counter)
+
+    def record(self, fingerprint: str, elapsed: float) -> None:
+        self.count += 1
+        self.duration += elapsed
+        self.fingerprints[fingerprint] += 1
+
+    def repeated(self, threshold: int) -> List[Tuple[str, int]]:
+        """threshold 이상 반복된 지문 목록 (많은 순)"""
+        return [(fp, n) for fp, n in self.fingerprints.most_common() if n >= threshold]
+
+
+# 현재 요청의 쿼리 통계 (요청 밖에서는 None -> 집계하지 않음)
+query_stats_var: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+
+# 테스트용 전역 수집기 (TestClient는 앱을 다른 스레드에서 실행하므로 컨텍스트와 별도로 수집)
+_captures: List[QueryStats] = []
+
+
+@lru_cache(maxsize=2048)
+def fingerprint(statement: str) -> str:
+    """SQL 지문 생성 (파라미터/리터럴/IN 목록 길이 차이를 제거)
+
+    SQLAlchemy는 같은 쿼리에 같은 SQL 문자열을 재사용하므로 결과를 캐시합니다.
+    """
+    normalized = _STRING_PATTERN.sub("?", statement)
+    normalized = _PLACEHOLDER_PATTERN.sub("?", normalized)
+    normalized = _NUMBER_PATTERN.sub("?", normalized)
+    normalized = _IN_LIST_PATTERN.sub("(...)", normalized)
+    return _WHITESPACE_PATTERN.sub(" ", normalized).strip()
+
+
+def _truncate(sql: str) -> str:
+    return sql if len(sql) <= MAX_LOGGED_SQL_LENGTH else sql[:MAX_LOGGED_SQL_LENGTH] + "..."
+
+
+def start_query_stats() -> QueryStats:
+    """현재 컨텍스트에서 쿼리 집계 시작"""
+    stats = QueryStats()
+    query_stats_var.set(stats)
+    return stats
+
+
+def report_repeated_queries(stats: QueryStats, route: str) -> None:
+    """같은 지문이 임계값 이상 반복된 경우 N+1 의심 경고"""
+    threshold = get_settings().n_plus_one_threshold
+    if threshold <= 0 or stats.count < threshold:
+        return
+    for sql, times in stats.repeated(threshold):
+        logger.warning(
+            "Possible N+1 query on %s: %d x %s",
+            route,
+            times,
+            _truncate(sql),
+            extra={"route": route, "repeat": times, "fingerprint": _truncate(sql)},
+        )
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - conn.info["query_start_time"].pop()
+    stats = query_stats_var.get()
+    if stats is None and not _captures:
+        return
+
+    sql = fingerprint(statement)
+    if stats is not None:
+        stats.record(sql, elapsed)
+    for capture in _captures:
+        capture.record(sql, elapsed)
+
+    if elapsed >= get_settings().slow_query_seconds:
+        logger.warning(
+            "Slow query (%.3fs): %s",
+            elapsed,
+            _truncate(sql),
+            extra={"duration_ms": round(elapsed * 1000, 1), "fingerprint": _truncate(sql)},
+        )
+
+
+def instrument_engine(engine: Engine) -> None:
+    """엔진에 쿼리 집계 이벤트 등록"""
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+@contextmanager
+def capture_queries() -> Iterator[QueryStats]:
+    """블록 안에서 실행된 모든 쿼리 수집 (스레드 무관, 테스트용)"""
+    stats = QueryStats()
+    _captures.append(stats)
+    try:
+        yield stats
+    finally:
+        _captures.remove(stats)
+
+
+@contextmanager
+def assert_max_queries(limit: int) -> Iterator[QueryStats]:
+    """블록 안의 쿼리 수가 limit을 넘으면 AssertionError (쿼리 예산 테스트용)"""
+    with capture_queries() as stats:
+        yield stats
+    if stats.count > limit:
+        details = "\n".join(f"  {n} x {_truncate(sql)}" for sql, n in stats.fingerprints.most_common())
+        raise AssertionError(f"Expected at most {limit} queries, got {stats.count}:\n{details}")
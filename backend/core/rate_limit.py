@@ -2,8 +2,12 @@
 
 API 요청 속도 제한을 구현합니다.
 Redis를 사용한 분산 환경에서의 속도 제한을 지원합니다.
+
+라우트별 제한은 rate_limit() 의존성으로 적용하며,
+sliding-window-log 엔진(rate_limit_engine)을 사용합니다.
 """
 import warnings
+from typing import Callable
 
 from slowapi import Limiter
 from slowapi.util import get_remote_address
@@ -14,7 +18,9 @@ from fastapi import Request
 from fastapi.responses import JSONResponse
 
 from .config import get_settings
+from .exceptions import RateLimitError
 from .logger import get_logger
+from . import rate_limit_engine
 
 logger = get_logger(__name__)
 settings = get_settings()
@@ -42,18 +48,13 @@ def get_rate_limit_key(request: Request) -> str:
     
     인증된 사용자는 user_id 기반, 미인증은 IP 기반
     """
-    # Authorization 헤더에서 사용자 ID 추출 시도
-    auth_header = request.headers.get("Authorization")
-    if auth_header and auth_header.startswith("Bearer "):
-        try:
-            from .security import decode_access_token
-            token = auth_header.split(" ")[1]
-            payload = decode_access_token(token)
-            user_id = payload.get("sub")
-            if user_id:
-                return f"user:{user_id}"
-        except Exception:
-            pass
+    # 요청 단위 인증 컨텍스트 (인증 의존성과 디코드 결과 공유)
+    from .security import get_request_auth_payload
+    payload = get_request_auth_payload(request)
+    if payload:
+        user_id = payload.get("sub")
+        if user_id:
+            return f"user:{user_id}"
     
     # 미인증 사용자는 IP 기반
     return f"ip:{get_client_ip(request)}"
@@ -127,3 +128,35 @@ def get_limit(limit_name: str) -> str:
     """이름으로 제한 규칙 가져오기"""
     return RATE_LIMITS.get(limit_name, RATE_LIMITS["api_default"])
 
+
+
+def rate_limit(limit_name: str) -> Callable[[Request], None]:
+    """이름이 붙은 RATE_LIMITS 정책을 적용하는 라우트 의존성
+    
+    사용 예:
+        @router.post("/login", dependencies=[Depends(rate_limit("auth_login"))])
+    
+    Raises:
+        RateLimitError: 제한 초과 (Retry-After 포함)
+    """
+    rate = get_limit(limit_name)
+    # 잘못된 정책은 라우터 등록 시점에 실패하도록 미리 파싱
+    rate_limit_engine.get_policy(rate)
+
+    def dependency(request: Request) -> None:
+        key = f"{limit_name}:{get_rate_limit_key(request)}"
+        result = rate_limit_engine.hit(key, rate)
+        if not result.allowed:
+            logger.warning(
+                "Rate limit exceeded: %s %s from %s - Limit: %s",
+                request.method,
+                request.url.path,
+                get_client_ip(request),
+                rate,
+            )
+            raise RateLimitError(
+                "요청이 너무 많습니다. 잠시 후 다시 시도해주세요.",
+                retry_after=rate_limit_engine.get_retry_after(result),
+            )
+
+    return dependency
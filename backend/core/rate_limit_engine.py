@@ -0,0 +1,312 @@
+"""Sliding-window-log 기반 Rate Limit 엔진
+
+고정 윈도우(slowapi fixed-window)는 윈도우 경계에서 최대 2배의 요청을 허용합니다.
+이 엔진은 Redis Sorted Set에 요청 시각을 기록하는 sliding-window-log를
+단일 Lua 스크립트로 원자적으로 실행하여, 임의의 윈도우 구간에서도 제한을 넘지 않습니다.
+
+제한이 큰 정책은 Redis에서 여러 개의 토큰을 한 번에 임대(lease)하여
+프로세스 로컬 토큰 버킷에서 소비하므로 대부분의 요청이 Redis 왕복 없이 처리됩니다.
+임대한 토큰은 이미 Redis 로그에 기록되어 있으므로 전체 제한을 초과하지 않습니다.
+
+로그인(5/minute)처럼 제한이 작은 정책은 임대하면 다른 프로세스에 남은 토큰 때문에
+정상 요청이 거부될 수 있어 허용 요청은 매번 Redis로 판정합니다. 대신 Redis가 거부하면
+재시도 가능 시각까지 로컬에서 바로 거부합니다. 거부된 요청은 Redis 로그에 기록되지 않고
+다른 프로세스의 요청은 로그를 늘리기만 하므로, 그 시각 전에는 Redis도 반드시 거부합니다
+(판정 결과가 같음). 제한을 넘겨 반복되는 요청(무차별 대입 등)이 Redis 왕복 없이 처리됩니다.
+"""
+import re
+import threading
+import time
+import uuid
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from typing import Deque, Dict, Optional, Tuple
+
+from .logger import get_logger
+from .redis import get_redis_client
+
+logger = get_logger(__name__)
+
+# 단위별 윈도우 길이 (초)
+_PERIODS = {
+    "second": 1,
+    "minute": 60,
+    "hour": 60 * 60,
+    "day": 60 * 60 * 24,
+}
+
+_RATE_PATTERN = re.compile(r"^\s*(\d+)\s*/\s*(\d*)\s*(second|minute|hour|day)s?\s*$")
+
+# 로컬 임대를 사용할 최소 제한 (작은 제한은 요청마다 Redis로 정확히 판정)
+LEASE_MIN_LIMIT = 50
+# 한 번에 임대할 토큰 비율 (제한의 1/10)
+LEASE_DIVISOR = 10
+# 로컬 버킷/폴백 로그에 보관할 최대 키 수
+LOCAL_MAX_KEYS = 10000
+# Redis 장애 후 재시도까지 대기 시간 (초) - 요청마다 연결 타임아웃을 기다리지 않도록
+REDIS_RETRY_INTERVAL = 30.0
+
+KEY_PREFIX = "rl"
+
+# KEYS[1]: 로그 키
+# ARGV[1]: 윈도우(ms), ARGV[2]: 제한, ARGV[3]: 기록할 요청 수, ARGV[4]: 멤버 prefix
+# 반환: {허용 여부(1/0), 재시도까지 남은 ms, 남은 요청 수}
+SLIDING_WINDOW_SCRIPT = """
+local t = redis.call('TIME')
+local now = tonumber(t[1]) * 1000 + math.floor(tonumber(t[2]) / 1000)
+local window = tonumber(ARGV[1])
+local limit = tonumber(ARGV[2])
+local quantity = tonumber(ARGV[3])
+
+redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', now - window)
+local count = redis.call('ZCARD', KEYS[1])
+
+if count + quantity > limit then
+    local retry = window
+    local index = count + quantity - limit - 1
+    local entry = redis.call('ZRANGE', KEYS[1], index, index, 'WITHSCORES')
+    if entry[2] then
+        retry = tonumber(entry[2]) + window - now
+    end
+    return {0, retry, limit - count}
+end
+
+for i = 1, quantity do
+    redis.call('ZADD', KEYS[1], now, ARGV[4] .. ':' .. i)
+end
+redis.call('PEXPIRE', KEYS[1], window)
+return {1, 0, limit - count - quantity}
+"""
+
+
+@dataclass(frozen=True)
+class RatePolicy:
+    """요청 제한 정책 (예: "5/minute" -> limit=5, window=60)"""
+
+    limit: int
+    window: float
+
+    @property
+    def lease_size(self) -> int:
+        """로컬로 임대할 토큰 수 (1이면 임대하지 않음)"""
+        if self.limit < LEASE_MIN_LIMIT:
+            return 1
+        return max(self.limit // LEASE_DIVISOR, 1)
+
+
+@dataclass(frozen=True)
+class RateLimitResult:
+    allowed: bool
+    retry_after: float = 0.0
+    remaining: int = 0
+
+
+def parse_rate(rate: str) -> RatePolicy:
+    """ "5/minute", "100/hour", "10/5 seconds" 형식의 제한 문자열 파싱"""
+    match = _RATE_PATTERN.match(rate)
+    if not match:
+        raise ValueError(f"Invalid rate limit: {rate}")
+    limit, multiplier, unit = match.groups()
+    return RatePolicy(limit=int(limit), window=_PERIODS[unit] * int(multiplier or 1))
+
+
+class LocalTokenBucket:
+    """Redis에서 임대한 토큰을 보관하는 프로세스 로컬 버킷
+
+    키별로 (남은 토큰, 만료 시각)을 보관하며, 토큰은 Redis 로그에서
+    만료되는 시점(임대 시각 + 윈도우)까지만 사용할 수 있습니다.
+    """
+
+    def __init__(self, max_keys: int = LOCAL_MAX_KEYS):
+        self._buckets: "OrderedDict[str, Tuple[int, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._max_keys = max_keys
+
+    def take(self, key: str) -> bool:
+        """토큰 하나 소비 (없거나 만료되었으면 False)"""
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                return False
+            tokens, expires_at = bucket
+            if tokens <= 0 or expires_at <= now:
+                del self._buckets[key]
+                return False
+            self._buckets[key] = (tokens - 1, expires_at)
+            self._buckets.move_to_end(key)
+            return True
+
+    def put(self, key: str, tokens: int, ttl: float) -> None:
+        """임대한 토큰 저장"""
+        if tokens <= 0:
+            return
+        with self._lock:
+            self._buckets[key] = (tokens, time.monotonic() + ttl)
+            self._buckets.move_to_end(key)
+            while len(self._buckets) > self._max_keys:
+                self._buckets.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._buckets.clear()
+
+
+class LocalDenyCache:
+    """Redis가 거부한 키의 재시도 가능 시각을 보관하는 프로세스 로컬 캐시"""
+
+    def __init__(self, max_keys: int = LOCAL_MAX_KEYS):
+        self._until: "OrderedDict[str, float]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._max_keys = max_keys
+
+    def check(self, key: str) -> Optional[RateLimitResult]:
+        """재시도 가능 시각 전이면 거부 결과 반환 (아니면 None)"""
+        now = time.monotonic()
+        with self._lock:
+            until = self._until.get(key)
+            if until is None:
+                return None
+            if until <= now:
+                del self._until[key]
+                return None
+            return RateLimitResult(False, until - now, 0)
+
+    def put(self, key: str, until: float) -> None:
+        """거부 기록 (monotonic 시각 until까지 로컬에서 거부)"""
+        if until <= time.monotonic():
+            return
+        with self._lock:
+            self._until[key] = until
+            self._until.move_to_end(key)
+            while len(self._until) > self._max_keys:
+                self._until.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._until.clear()
+
+
+class MemorySlidingWindow:
+    """Redis를 사용할 수 없을 때의 프로세스 로컬 sliding-window-log"""
+
+    def __init__(self, max_keys: int = LOCAL_MAX_KEYS):
+        self._logs: "OrderedDict[str, Deque[float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._max_keys = max_keys
+
+    def hit(self, key: str, policy: RatePolicy, quantity: int = 1) -> RateLimitResult:
+        now = time.monotonic()
+        with self._lock:
+            log = self._logs.setdefault(key, deque())
+            self._logs.move_to_end(key)
+            while log and log[0] <= now - policy.window:
+                log.popleft()
+
+            if len(log) + quantity > policy.limit:
+                index = len(log) + quantity - policy.limit - 1
+                retry_after = log[index] + policy.window - now if index < len(log) else policy.window
+                return RateLimitResult(False, retry_after, policy.limit - len(log))
+
+            log.extend([now] * quantity)
+            while len(self._logs) > self._max_keys:
+                self._logs.popitem(last=False)
+            return RateLimitResult(True, 0.0, policy.limit - len(log))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._logs.clear()
+
+
+class SlidingWindowLimiter:
+    """Redis Lua 스크립트 + 로컬 토큰 버킷 기반 Rate Limiter"""
+
+    def __init__(self):
+        self.local = LocalTokenBucket()
+        self.denied = LocalDenyCache()
+        self.fallback = MemorySlidingWindow()
+        self._script = None
+        self._redis_retry_at = 0.0
+
+    def _get_script(self):
+        if self._script is None:
+            self._script = get_redis_client().register_script(SLIDING_WINDOW_SCRIPT)
+        return self._script
+
+    def _hit_redis(self, key: str, policy: RatePolicy, quantity: int) -> RateLimitResult:
+        allowed, retry_ms, remaining = self._get_script()(
+            keys=[key],
+            args=[int(policy.window * 1000), policy.limit, quantity, uuid.uuid4().hex],
+        )
+        return RateLimitResult(bool(allowed), int(retry_ms) / 1000, int(remaining))
+
+    def hit(self, key: str, policy: RatePolicy) -> RateLimitResult:
+        """요청 1건 기록 후 허용 여부 반환"""
+        redis_key = f"{KEY_PREFIX}:{key}"
+
+        # 1) 로컬 버킷에 임대한 토큰이 있으면 Redis 왕복 없이 허용
+        if self.local.take(redis_key):
+            return RateLimitResult(True)
+
+        # 2) Redis가 거부한 키는 재시도 가능 시각까지 Redis 왕복 없이 거부
+        denied = self.denied.check(redis_key)
+        if denied is not None:
+            return denied
+
+        if time.monotonic() < self._redis_retry_at:
+            return self.fallback.hit(redis_key, policy)
+
+        try:
+            # 3) 임대 단위로 기록 시도, 여유가 부족하면 1건만 기록
+            lease = policy.lease_size
+            started = time.monotonic()
+            result = self._hit_redis(redis_key, policy, lease)
+            if result.allowed:
+                self.local.put(redis_key, lease - 1, policy.window)
+                return result
+            if lease > 1:
+                started = time.monotonic()
+                result = self._hit_redis(redis_key, policy, 1)
+            if not result.allowed:
+                # 요청 전 시각 기준으로 저장해 왕복 지연만큼 더 오래 거부하지 않도록 함
+                self.denied.put(redis_key, started + result.retry_after)
+            return result
+        except Exception as e:
+            # 4) Redis 장애 시 프로세스 로컬 로그로 제한 (워커별 제한)
+            logger.warning("Rate limit storage error, using memory fallback: %s", str(e))
+            self._script = None
+            self._redis_retry_at = time.monotonic() + REDIS_RETRY_INTERVAL
+            return self.fallback.hit(redis_key, policy)
+
+    def reset(self) -> None:
+        """로컬 상태 초기화 (테스트용)"""
+        self.local.clear()
+        self.denied.clear()
+        self.fallback.clear()
+        self._redis_retry_at = 0.0
+
+
+# 싱글톤 인스턴스
+sliding_window_limiter = SlidingWindowLimiter()
+
+_policy_cache: Dict[str, RatePolicy] = {}
+
+
+def get_policy(rate: str) -> RatePolicy:
+    """제한 문자열 -> 정책 (파싱 결과 캐시)"""
+    policy = _policy_cache.get(rate)
+    if policy is None:
+        policy = _policy_cache[rate] = parse_rate(rate)
+    return policy
+
+
+def hit(key: str, rate: str) -> RateLimitResult:
+    """요청 1건 기록 (헬퍼 함수)"""
+    return sliding_window_limiter.hit(key, get_policy(rate))
+
+
+def get_retry_after(result: RateLimitResult) -> Optional[int]:
+    """Retry-After 헤더 값 (초, 올림)"""
+    if result.allowed:
+        return None
+    return max(int(result.retry_after + 0.999), 1)
@@ -2,20 +2,25 @@
 
 Redis 클라이언트 설정과 캐싱 데코레이터를 제공합니다.
 """
+import asyncio
 import json
+import weakref
 from functools import wraps
-from typing import Any, Callable, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 import redis
+import redis.asyncio as aioredis
 from redis.exceptions import ConnectionError, TimeoutError
 
 from .config import get_settings
 from .logger import get_logger
+from .metrics import record_cache_lookup
 
 logger = get_logger(__name__)
 
 # Redis 클라이언트 (지연 초기화)
 _redis_client: Optional[redis.Redis] = None
+_async_redis_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, aioredis.Redis]" = weakref.WeakKeyDictionary()
 
 
 def get_redis_client() -> redis.Redis:
@@ -41,6 +46,24 @@ def get_redis_client() -> redis.Redis:
     return _redis_client
 
 
+def get_async_redis_client() -> aioredis.Redis:
+    """현재 이벤트 루프의 asyncio Redis 클라이언트 반환 (Pub/Sub 구독 등 이벤트 루프에서 대기하는 작업용)
+
+    asyncio 연결은 생성한 이벤트 루프에서만 사용할 수 있으므로 루프별로 만듭니다.
+    구독은 응답을 기다리는 동안 연결을 점유하므로 socket_timeout을 두지 않습니다.
+    """
+    loop = asyncio.get_running_loop()
+    client = _async_redis_clients.get(loop)
+    if client is None:
+        client = aioredis.from_url(
+            get_settings().redis_url,
+            decode_responses=True,
+            socket_connect_timeout=5,
+        )
+        _async_redis_clients[loop] = client
+    return client
+
+
 def is_redis_available() -> bool:
     """Redis 연결 가능 여부 확인"""
     try:
@@ -87,6 +110,7 @@ def cache(
             # 캐시 조회
             try:
                 cached = client.get(cache_key)
+                record_cache_lookup(cache_key, bool(cached))
                 if cached:
                     logger.debug("Cache hit: %s", cache_key)
                     return json.loads(cached)
@@ -135,11 +159,39 @@ def cache_get(key: str) -> Optional[Any]:
     try:
         client = get_redis_client()
         cached = client.get(key)
+        record_cache_lookup(key, bool(cached))
         return json.loads(cached) if cached else None
     except Exception:
         return None
 
 
+def cache_get_many(keys: List[str]) -> List[Optional[Any]]:
+    """여러 캐시 값을 한 번에 조회 (MGET, 실패 시 모두 None)"""
+    if not keys:
+        return []
+    try:
+        values = get_redis_client().mget(keys)
+    except Exception:
+        return [None] * len(keys)
+    for key, cached in zip(keys, values):
+        record_cache_lookup(key, bool(cached))
+    return [json.loads(cached) if cached else None for cached in values]
+
+
+def cache_set_many(values: Dict[str, Any], ttl: int = 300) -> bool:
+    """여러 캐시 값을 파이프라인으로 저장"""
+    if not values:
+        return True
+    try:
+        pipe = get_redis_client().pipeline(transaction=False)
+        for key, value in values.items():
+            pipe.setex(key, ttl, json.dumps(value, default=str))
+        pipe.execute()
+        return True
+    except Exception:
+        return False
+
+
 def cache_set(key: str, value: Any, ttl: int = 300) -> bool:
     """단일 캐시 값 저장"""
     try:
@@ -159,3 +211,13 @@ def cache_delete(key: str) -> bool:
     except Exception:
         return False
 
+
+def cache_delete_many(keys: List[str]) -> bool:
+    """여러 캐시 값 삭제"""
+    if not keys:
+        return True
+    try:
+        get_redis_client().delete(*keys)
+        return True
+    except Exception:
+        return False
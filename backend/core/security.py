@@ -1,8 +1,11 @@
 
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
-from typing import Any, Optional
+from functools import lru_cache
+from typing import Any, Optional, Tuple
 
-from fastapi import Depends
+from fastapi import Depends, Request
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from jose import JWTError, jwt
 from passlib.context import CryptContext
@@ -10,16 +13,20 @@ from passlib.context import CryptContext
 from .config import get_settings
 from .exceptions import UnauthorizedError
 
-# passlib의 bcrypt 사용
+# passlib의 bcrypt 사용 (cost factor가 다른 해시는 needs_update 대상)
 pwd_context = CryptContext(
     schemes=["bcrypt"],
     bcrypt__ident="2b",
+    bcrypt__rounds=get_settings().bcrypt_rounds,
     deprecated="auto"
 )
 security_scheme = HTTPBearer(auto_error=True)
 # 리프레시 토큰용 (자동 에러 없이)
 security_scheme_optional = HTTPBearer(auto_error=False)
 
+# 서명 검증을 마친 토큰 캐시 크기 (같은 토큰의 반복 요청은 HMAC 검증 생략)
+VERIFIED_TOKEN_CACHE_SIZE = 4096
+
 
 def hash_password(plain_password: str) -> str:
     return pwd_context.hash(plain_password)
@@ -29,6 +36,58 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
 
+def verify_and_update_password(plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+    """비밀번호 검증 + cost factor가 바뀐 경우 새 해시 반환
+
+    Returns:
+        (검증 결과, 새 해시 또는 None)
+    """
+    return pwd_context.verify_and_update(plain_password, hashed_password)
+
+
+# bcrypt 전용 스레드 풀
+# bcrypt는 해시 계산 중 GIL을 해제하므로 스레드로 충분하며, 동시 해시 계산 수를
+# password_hash_workers로 제한해 로그인이 몰려도 CPU를 다른 요청과 나눠 씁니다.
+# 인증 라우트는 async 라우트에서 *_async로 결과를 기다리므로 해시 계산 동안
+# 공용 스레드 풀(Starlette run_in_threadpool)을 점유하지 않습니다.
+_password_executor: Optional[ThreadPoolExecutor] = None
+
+
+def _get_password_executor() -> ThreadPoolExecutor:
+    global _password_executor
+    if _password_executor is None:
+        _password_executor = ThreadPoolExecutor(
+            max_workers=get_settings().password_hash_workers,
+            thread_name_prefix="password-hash",
+        )
+    return _password_executor
+
+
+async def hash_password_async(plain_password: str) -> str:
+    """비밀번호 해시 (전용 스레드 풀에서 실행)"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_password_executor(), hash_password, plain_password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """비밀번호 검증 (전용 스레드 풀에서 실행)"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _get_password_executor(), verify_password, plain_password, hashed_password
+    )
+
+
+async def verify_and_update_password_async(
+    plain_password: str,
+    hashed_password: str,
+) -> Tuple[bool, Optional[str]]:
+    """비밀번호 검증 + 재해시 (전용 스레드 풀에서 실행)"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _get_password_executor(), verify_and_update_password, plain_password, hashed_password
+    )
+
+
 def create_access_token(
     subject: str,
     expires_minutes: Optional[int] = None,
@@ -78,10 +137,37 @@ def create_refresh_token(
     return encoded_jwt
 
 
+@lru_cache(maxsize=VERIFIED_TOKEN_CACHE_SIZE)
+def _verify_token_signature(token: str) -> dict[str, Any]:
+    """서명 검증 후 페이로드 반환 (키 회전 지원, 결과는 LRU 캐시)
+    
+    현재 키로 검증 실패 시 이전 키로 재시도합니다.
+    검증에 실패한 토큰은 예외가 발생하므로 캐시되지 않습니다.
+    
+    Raises:
+        JWTError: 모든 키로 검증 실패
+    """
+    settings = get_settings()
+    keys_to_try = [settings.jwt_secret_key]
+    
+    # 이전 키가 설정되어 있으면 폴백으로 사용
+    if settings.jwt_previous_key:
+        keys_to_try.append(settings.jwt_previous_key)
+    
+    for key in keys_to_try[:-1]:
+        try:
+            return jwt.decode(token, key, algorithms=[settings.jwt_algorithm])
+        except JWTError:
+            continue
+    
+    # 마지막 키의 검증 오류는 그대로 전달
+    return jwt.decode(token, keys_to_try[-1], algorithms=[settings.jwt_algorithm])
+
+
 def _decode_token_with_rotation(token: str, expected_type: str | None = None) -> dict[str, Any]:
     """키 회전을 지원하는 토큰 디코드
     
-    현재 키로 디코드 실패 시 이전 키로 재시도합니다.
+    서명 검증 결과는 캐시되므로 만료 시간은 매번 다시 확인합니다.
     
     Args:
         token: JWT 토큰
@@ -93,39 +179,28 @@ def _decode_token_with_rotation(token: str, expected_type: str | None = None) ->
     Raises:
         UnauthorizedError: 디코드 실패
     """
-    settings = get_settings()
-    keys_to_try = [settings.jwt_secret_key]
+    error_msg = "유효하지 않은 토큰입니다." if expected_type != "refresh" else "유효하지 않은 리프레시 토큰입니다."
     
-    # 이전 키가 설정되어 있으면 폴백으로 사용
-    if settings.jwt_previous_key:
-        keys_to_try.append(settings.jwt_previous_key)
+    try:
+        payload = _verify_token_signature(token)
+    except JWTError as e:
+        raise UnauthorizedError(error_msg) from e
     
-    last_error = None
-    for key in keys_to_try:
-        try:
-            payload = jwt.decode(
-                token,
-                key,
-                algorithms=[settings.jwt_algorithm],
-            )
-            
-            # 토큰 타입 검증
-            token_type = payload.get("type")
-            if expected_type and token_type != expected_type:
-                if expected_type == "access" and token_type == "refresh":
-                    raise UnauthorizedError("리프레시 토큰은 인증에 사용할 수 없습니다.")
-                elif expected_type == "refresh" and token_type != "refresh":
-                    raise UnauthorizedError("유효하지 않은 리프레시 토큰입니다.")
-            
-            return payload
-            
-        except JWTError as e:
-            last_error = e
-            continue
+    # 캐시된 토큰도 만료되면 거부
+    exp = payload.get("exp")
+    if exp is not None and exp < datetime.now(timezone.utc).timestamp():
+        raise UnauthorizedError(error_msg)
     
-    # 모든 키로 실패
-    error_msg = "유효하지 않은 토큰입니다." if expected_type != "refresh" else "유효하지 않은 리프레시 토큰입니다."
-    raise UnauthorizedError(error_msg) from last_error
+    # 토큰 타입 검증
+    token_type = payload.get("type")
+    if expected_type and token_type != expected_type:
+        if expected_type == "access" and token_type == "refresh":
+            raise UnauthorizedError("리프레시 토큰은 인증에 사용할 수 없습니다.")
+        elif expected_type == "refresh" and token_type != "refresh":
+            raise UnauthorizedError("유효하지 않은 리프레시 토큰입니다.")
+    
+    # 캐시된 원본이 변경되지 않도록 복사본 반환
+    return dict(payload)
 
 
 def decode_access_token(token: str) -> dict[str, Any]:
@@ -138,11 +213,39 @@ def decode_refresh_token(token: str) -> dict[str, Any]:
     return _decode_token_with_rotation(token, expected_type="refresh")
 
 
+def get_request_auth_payload(request: Request) -> Optional[dict[str, Any]]:
+    """요청 단위 인증 컨텍스트
+    
+    Authorization 헤더의 액세스 토큰을 요청당 한 번만 디코드하여
+    request.state에 보관합니다. Rate limiter와 인증 의존성이 공유합니다.
+    
+    Returns:
+        유효한 토큰이면 페이로드, 없거나 유효하지 않으면 None
+    """
+    if hasattr(request.state, "auth_payload"):
+        return request.state.auth_payload
+    
+    payload = None
+    auth_header = request.headers.get("Authorization")
+    if auth_header and auth_header.startswith("Bearer "):
+        try:
+            payload = decode_access_token(auth_header.split(" ", 1)[1])
+        except UnauthorizedError:
+            payload = None
+    
+    request.state.auth_payload = payload
+    return payload
+
+
 def get_current_user_payload(
+    request: Request,
     credentials: HTTPAuthorizationCredentials = Depends(security_scheme),
 ) -> dict[str, Any]:
-    token = credentials.credentials
-    return decode_access_token(token)
+    payload = get_request_auth_payload(request)
+    if payload is None:
+        # 실패 사유(리프레시 토큰 사용 등)를 그대로 전달하기 위해 다시 디코드
+        return decode_access_token(credentials.credentials)
+    return payload
 
 
 def get_current_user_id(payload: dict[str, Any] = Depends(get_current_user_payload)) -> str:
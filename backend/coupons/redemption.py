@@ -0,0 +1,144 @@
+"""쿠폰 사용 처리 (동시 주문에서도 사용 한도를 넘지 않음)
+
+선착순 쿠폰은 캠페인 중 같은 순간에 주문이 몰리므로, 조회 후 증가(read-then-increment)로는
+사용 한도를 넘겨 사용될 수 있습니다. 주문 트랜잭션 안에서 두 개의 조건부 UPDATE로 처리합니다.
+
+- user_coupons: is_used = false인 행만 사용 처리 (같은 쿠폰을 두 주문에 동시 사용 방지)
+- coupons: usage_count < usage_limit인 경우만 usage_count 증가 (한도 초과 방지)
+
+COUPON_REDIS_COUNTER=true이면 Redis 남은 수량 카운터(DECR)를 앞단에 두어, 한도가 소진된
+인기 쿠폰의 요청은 coupons 행 잠금을 기다리지 않고 바로 거절합니다. 카운터는 보조 수단이며
+최종 판단은 항상 DB 조건부 UPDATE입니다.
+"""
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import or_, update
+from sqlalchemy.orm import Session
+
+from backend.core import models
+from backend.core.config import get_settings
+from backend.core.exceptions import BadRequestError
+from backend.core.logger import get_logger
+from backend.core.redis import get_redis_client
+
+logger = get_logger(__name__)
+
+REMAINING_KEY_PREFIX = "coupons:remaining"
+REMAINING_TTL = 600  # 10분 (만료되면 DB 사용 횟수로 다시 채움)
+
+# 카운터가 있을 때만 반환 (만료된 카운터는 다음 예약 시 DB 기준으로 다시 채움)
+RELEASE_SCRIPT = """
+if redis.call('EXISTS', KEYS[1]) == 1 then
+    return redis.call('INCR', KEYS[1])
+end
+return nil
+"""
+
+
+def _remaining_key(coupon_id: str) -> str:
+    return f"{REMAINING_KEY_PREFIX}:{coupon_id}"
+
+
+def _reserve(coupon: models.Coupon) -> bool:
+    """Redis 카운터에서 1개 예약
+
+    Returns:
+        예약 여부 (카운터를 사용하지 않거나 Redis 오류면 False)
+
+    Raises:
+        BadRequestError: 남은 수량 없음
+    """
+    if not get_settings().coupon_redis_counter or coupon.usage_limit is None:
+        return False
+    key = _remaining_key(coupon.id)
+    try:
+        client = get_redis_client()
+        client.set(key, max(coupon.usage_limit - (coupon.usage_count or 0), 0), nx=True, ex=REMAINING_TTL)
+        remaining = client.decr(key)
+        if remaining < 0:
+            client.incr(key)
+    except Exception as e:
+        logger.warning("Coupon counter error, using database only: %s", str(e))
+        return False
+    if remaining < 0:
+        raise BadRequestError("쿠폰 사용 한도가 소진되었습니다.")
+    return True
+
+
+def release_coupon_reservation(coupon_id: str) -> None:
+    """예약 반환 (주문 트랜잭션이 커밋되지 않았거나 주문이 취소된 경우)"""
+    try:
+        get_redis_client().eval(RELEASE_SCRIPT, 1, _remaining_key(coupon_id))
+    except Exception as e:
+        logger.warning("Coupon counter release error: %s", str(e))
+
+
+def _mark_exhausted(coupon_id: str) -> None:
+    try:
+        get_redis_client().set(_remaining_key(coupon_id), 0, ex=REMAINING_TTL)
+    except Exception:
+        pass
+
+
+def redeem_coupon(db: Session, user_coupon: models.UserCoupon, order_id: Optional[str]) -> bool:
+    """보유 쿠폰 사용 처리 (커밋은 호출자의 주문 트랜잭션에서 수행)
+
+    실패하면 트랜잭션을 롤백하고 BadRequestError를 발생시킵니다.
+
+    Returns:
+        Redis 카운터 예약 여부 (True이면 커밋 실패 시 release_coupon_reservation 호출)
+    """
+    coupon = user_coupon.coupon
+    reserved = _reserve(coupon)
+
+    result = db.execute(
+        update(models.UserCoupon)
+        .where(models.UserCoupon.id == user_coupon.id, models.UserCoupon.is_used.is_(False))
+        .values(is_used=True, used_at=datetime.utcnow(), order_id=order_id)
+    )
+    if result.rowcount == 0:
+        db.rollback()
+        if reserved:
+            release_coupon_reservation(coupon.id)
+        raise BadRequestError("이미 사용한 쿠폰입니다.")
+
+    result = db.execute(
+        update(models.Coupon)
+        .where(
+            models.Coupon.id == coupon.id,
+            or_(models.Coupon.usage_limit.is_(None), models.Coupon.usage_count < models.Coupon.usage_limit),
+        )
+        .values(usage_count=models.Coupon.usage_count + 1)
+    )
+    if result.rowcount == 0:
+        db.rollback()
+        if reserved:
+            _mark_exhausted(coupon.id)
+        raise BadRequestError("쿠폰 사용 한도가 소진되었습니다.")
+
+    return reserved
+
+
+def restore_coupon(db: Session, order_id: str) -> Optional[str]:
+    """주문 취소 시 사용한 쿠폰 반환 (커밋은 호출자의 취소 트랜잭션에서 수행)
+
+    Returns:
+        반환한 쿠폰 ID (없으면 None). 커밋 후 release_coupon_reservation으로
+        Redis 남은 수량도 돌려줍니다.
+    """
+    coupon_id = db.execute(
+        update(models.UserCoupon)
+        .where(models.UserCoupon.order_id == order_id, models.UserCoupon.is_used.is_(True))
+        .values(is_used=False, used_at=None, order_id=None)
+        .returning(models.UserCoupon.coupon_id)
+    ).scalar()
+    if coupon_id is None:
+        return None
+
+    db.execute(
+        update(models.Coupon)
+        .where(models.Coupon.id == coupon_id, models.Coupon.usage_count > 0)
+        .values(usage_count=models.Coupon.usage_count - 1)
+    )
+    return coupon_id
@@ -2,6 +2,7 @@ from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
 
 from backend.core.database import get_db
+from backend.core.idempotency import idempotent
 from backend.core.security import get_admin_user_id, get_current_user_id
 
 from . import schemas, service
@@ -104,7 +105,7 @@ def delete_coupon(
     return {"success": True}
 
 
-@router.post("/{coupon_id}/issue/{user_id}")
+@router.post("/{coupon_id}/issue/{user_id}", dependencies=[Depends(idempotent("coupons.issue"))])
 def issue_coupon(
     coupon_id: str,
     user_id: str,
@@ -116,6 +117,26 @@ def issue_coupon(
     return {"success": True, "message": "쿠폰이 발행되었습니다."}
 
 
+@router.post("/{coupon_id}/issue-bulk", response_model=schemas.BulkIssueJobResponse)
+def issue_coupon_bulk(
+    coupon_id: str,
+    payload: schemas.CouponSegment,
+    admin_id: str = Depends(get_admin_user_id),
+    db: Session = Depends(get_db),
+) -> schemas.BulkIssueJobResponse:
+    """세그먼트 사용자에게 쿠폰 일괄 발행 (관리자 전용, Celery에서 구간 단위로 처리)"""
+    return service.start_bulk_issue(db=db, coupon_id=coupon_id, segment=payload)
+
+
+@router.get("/issue-jobs/{job_id}", response_model=schemas.BulkIssueJobResponse)
+def get_issue_job(
+    job_id: str,
+    admin_id: str = Depends(get_admin_user_id),
+) -> schemas.BulkIssueJobResponse:
+    """일괄 발행 진행 상황 조회 (관리자 전용)"""
+    return service.get_bulk_issue_job(job_id)
+
+
 @router.get("/my", response_model=schemas.UserCouponsListResponse)
 def get_my_coupons(
     user_id: str = Depends(get_current_user_id),
@@ -73,3 +73,19 @@ class UserCouponsListResponse(BaseModel):
     coupons: List[UserCouponResponse]
     total: int
 
+
+
+class CouponSegment(BaseModel):
+    """일괄 발행 대상 사용자 조건 (지정한 조건을 모두 만족하는 활성 사용자)"""
+    marketing_agreed: Optional[bool] = None
+    joined_after: Optional[datetime] = None
+    purchased_category: Optional[str] = None  # 해당 카테고리 상품을 구매한 사용자
+
+
+class BulkIssueJobResponse(BaseModel):
+    job_id: str
+    coupon_id: str
+    status: str  # queued, running, completed, failed
+    total: int
+    processed: int = 0
+    issued: int = 0
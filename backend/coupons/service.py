@@ -1,17 +1,22 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import List, Tuple
-from uuid import uuid4
+from typing import List, Optional, Tuple
 
-from sqlalchemy import func
+from sqlalchemy import String, cast, func, literal, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
 
 from backend.core import models
 from backend.core.exceptions import NotFoundError, BadRequestError
+from backend.core.ids import new_id
+from backend.core.redis import get_redis_client
 
 from . import schemas
 
+BULK_ISSUE_KEY_PREFIX = "coupons:bulk_issue"
+BULK_ISSUE_TTL = 60 * 60 * 24 * 7  # 7일
+
 
 def list_coupons(db: Session) -> Tuple[List[models.Coupon], int]:
     """쿠폰 목록 조회"""
@@ -37,7 +42,7 @@ def create_coupon(db: Session, payload: schemas.CreateCouponRequest) -> models.C
         raise BadRequestError("이미 존재하는 쿠폰 코드입니다.")
     
     coupon = models.Coupon(
-        id=str(uuid4()),
+        id=new_id(),
         code=payload.code,
         name=payload.name,
         description=payload.description,
@@ -126,7 +131,7 @@ def issue_coupon_to_user(db: Session, coupon_id: str, user_id: str) -> models.Us
     
     # 사용자 쿠폰 발행
     user_coupon = models.UserCoupon(
-        id=str(uuid4()),
+        id=new_id(),
         user_id=user_id,
         coupon_id=coupon_id,
         is_used=False,
@@ -149,3 +154,131 @@ def get_user_coupons(db: Session, user_id: str) -> Tuple[List[models.UserCoupon]
     user_coupons = query.all()
     return user_coupons, total
 
+
+# ==========================================
+# 세그먼트 일괄 발행
+# ==========================================
+
+def segment_conditions(segment: schemas.CouponSegment) -> list:
+    """세그먼트 조건 (users 기준 WHERE 절)"""
+    conditions = [models.User.is_active.is_(True)]
+    if segment.marketing_agreed is not None:
+        conditions.append(models.User.marketing_agreed.is_(segment.marketing_agreed))
+    if segment.joined_after is not None:
+        conditions.append(models.User.created_at >= segment.joined_after)
+    if segment.purchased_category:
+        conditions.append(
+            select(models.Order.id)
+            .join(models.OrderItem, models.OrderItem.order_id == models.Order.id)
+            .join(models.Product, models.Product.id == models.OrderItem.product_id)
+            .where(
+                models.Order.user_id == models.User.id,
+                models.Order.status != "cancelled",
+                models.Product.category.any(segment.purchased_category),
+            )
+            .exists()
+        )
+    return conditions
+
+
+def count_segment(db: Session, segment: schemas.CouponSegment) -> int:
+    return db.query(func.count(models.User.id)).filter(*segment_conditions(segment)).scalar() or 0
+
+
+def issue_coupon_chunk(
+    db: Session,
+    coupon_id: str,
+    segment: schemas.CouponSegment,
+    after_user_id: Optional[str],
+    chunk_size: int,
+) -> Tuple[int, int, Optional[str]]:
+    """세그먼트 사용자 한 구간에 쿠폰 발행 (user_id 키셋 순서)
+
+    구간의 마지막 user_id를 먼저 구한 뒤 INSERT ... SELECT ... ON CONFLICT DO NOTHING으로
+    사용자 ID를 애플리케이션으로 가져오지 않고 발행합니다. 이미 보유한 사용자는 건너뜁니다.
+
+    Returns:
+        (구간 사용자 수, 발행 수, 마지막 user_id) — 남은 사용자가 없으면 (0, 0, None)
+    """
+    conditions = segment_conditions(segment)
+    if after_user_id is not None:
+        conditions.append(models.User.id > after_user_id)
+
+    chunk = (
+        select(models.User.id)
+        .where(*conditions)
+        .order_by(models.User.id)
+        .limit(chunk_size)
+        .subquery()
+    )
+    # PostgreSQL에는 uuid용 max()가 없으므로 텍스트로 비교 (UUID 텍스트 순서 = 값 순서)
+    scanned, last_user_id = db.execute(
+        select(func.count(), func.max(cast(chunk.c.id, String)))
+    ).one()
+    if not scanned:
+        return 0, 0, None
+
+    now = datetime.utcnow()
+    stmt = pg_insert(models.UserCoupon).from_select(
+        ["id", "user_id", "coupon_id", "is_used", "created_at"],
+        select(
+            func.uuid_generate_v7(),
+            models.User.id,
+            literal(coupon_id, type_=models.UserCoupon.coupon_id.type),
+            literal(False),
+            literal(now),
+        ).where(*conditions, models.User.id <= last_user_id),
+    ).on_conflict_do_nothing(index_elements=["user_id", "coupon_id"])
+    issued = db.execute(stmt).rowcount
+    db.commit()
+    return scanned, issued, last_user_id
+
+
+def _bulk_issue_key(job_id: str) -> str:
+    return f"{BULK_ISSUE_KEY_PREFIX}:{job_id}"
+
+
+def start_bulk_issue(
+    db: Session,
+    coupon_id: str,
+    segment: schemas.CouponSegment,
+) -> schemas.BulkIssueJobResponse:
+    """세그먼트 일괄 발행 작업 등록 (Celery에서 구간 단위로 처리)"""
+    from backend.tasks.coupon_tasks import issue_coupon_to_segment
+
+    coupon = get_coupon(db, coupon_id)
+    if not coupon.is_active:
+        raise BadRequestError("비활성화된 쿠폰입니다.")
+    if datetime.utcnow() > coupon.valid_until:
+        raise BadRequestError("유효하지 않은 쿠폰 기간입니다.")
+
+    job = schemas.BulkIssueJobResponse(
+        job_id=new_id(),
+        coupon_id=str(coupon.id),
+        status="queued",
+        total=count_segment(db, segment),
+    )
+    update_bulk_issue_job(job)
+    issue_coupon_to_segment.delay(
+        job_id=job.job_id,
+        coupon_id=job.coupon_id,
+        segment=segment.model_dump(mode="json"),
+    )
+    return job
+
+
+def update_bulk_issue_job(job: schemas.BulkIssueJobResponse) -> None:
+    """일괄 발행 진행 상황 기록 (Redis 해시)"""
+    key = _bulk_issue_key(job.job_id)
+    pipe = get_redis_client().pipeline()
+    pipe.hset(key, mapping={k: str(v) for k, v in job.model_dump().items()})
+    pipe.expire(key, BULK_ISSUE_TTL)
+    pipe.execute()
+
+
+def get_bulk_issue_job(job_id: str) -> schemas.BulkIssueJobResponse:
+    """일괄 발행 진행 상황 조회"""
+    data = get_redis_client().hgetall(_bulk_issue_key(job_id))
+    if not data:
+        raise NotFoundError("발행 작업을 찾을 수 없습니다.")
+    return schemas.BulkIssueJobResponse(**data)
@@ -1,13 +1,13 @@
 """위시리스트 서비스"""
 from datetime import datetime
 from typing import List, Optional, Tuple
-from uuid import uuid4
 
 from sqlalchemy import func
 from sqlalchemy.orm import Session, joinedload
 
 from backend.core import models
 from backend.core.exceptions import NotFoundError, BadRequestError
+from backend.core.ids import new_id
 
 
 def get_user_favorites(
@@ -82,7 +82,7 @@ def add_to_favorites(
         raise BadRequestError("이미 찜한 상품입니다.")
     
     favorite = models.Favorite(
-        id=str(uuid4()),
+        id=new_id(),
         user_id=user_id,
         product_id=product_id,
         created_at=datetime.utcnow(),
@@ -140,7 +140,7 @@ def toggle_favorite(
             raise NotFoundError("상품을 찾을 수 없습니다.")
         
         favorite = models.Favorite(
-            id=str(uuid4()),
+            id=new_id(),
             user_id=user_id,
             product_id=product_id,
             created_at=datetime.utcnow(),
@@ -5,6 +5,7 @@ from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
 
 from backend.core.database import get_db
+from backend.core.rate_limit import rate_limit
 from backend.core.security import get_current_user_id, get_admin_user_id
 
 from . import schemas, service
@@ -12,7 +13,7 @@ from . import schemas, service
 router = APIRouter(prefix="/inquiries", tags=["inquiries"])
 
 
-@router.post("", response_model=schemas.InquiryResponse)
+@router.post("", response_model=schemas.InquiryResponse, dependencies=[Depends(rate_limit("api_create"))])
 def create_inquiry(
     payload: schemas.InquiryCreate,
     user_id: str = Depends(get_current_user_id),
@@ -1,12 +1,12 @@
 """문의 서비스"""
 from datetime import datetime
 from typing import List, Optional, Tuple
-from uuid import uuid4
 
 from sqlalchemy import func
 from sqlalchemy.orm import Session
 
 from backend.core.exceptions import NotFoundError, BadRequestError
+from backend.core.ids import new_id
 from backend.core.logger import get_logger
 
 logger = get_logger(__name__)
@@ -30,7 +30,7 @@ def create_inquiry(
         raise BadRequestError(f"유효하지 않은 문의 유형입니다. ({', '.join(valid_types)})")
     
     inquiry = {
-        "id": str(uuid4()),
+        "id": new_id(),
         "user_id": user_id,
         "product_id": product_id,
         "type": inquiry_type,
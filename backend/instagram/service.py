@@ -1,8 +1,8 @@
 from typing import Optional
-import httpx
 from sqlalchemy.orm import Session
 
 from backend.core import models
+from backend.core.metrics import instrumented_client
 
 # Instagram 설정의 고정 ID
 INSTAGRAM_SETTINGS_ID = "00000000-0000-0000-0000-000000000001"
@@ -76,7 +76,7 @@ async def get_instagram_media(access_token: str) -> list[dict]:
     }
     
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
+        async with instrumented_client("instagram", timeout=30.0) as client:
             response = await client.get(api_url, params=params)
             
             if response.status_code == 200:
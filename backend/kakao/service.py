@@ -1,6 +1,5 @@
 from typing import Optional
 from datetime import datetime
-from uuid import uuid4
 import json
 import httpx
 from sqlalchemy.orm import Session
@@ -8,6 +7,8 @@ from sqlalchemy.orm import Session
 from backend.core import models
 from backend.core.config import get_settings
 from backend.core.exceptions import NotFoundError, UnauthorizedError
+from backend.core.ids import new_id
+from backend.core.metrics import instrumented_client
 from backend.core.security import create_access_token, create_refresh_token
 
 # 카카오톡 설정의 고정 ID
@@ -82,7 +83,7 @@ async def get_kakao_token_from_code(
         "Content-Type": "application/x-www-form-urlencoded",
     }
     
-    async with httpx.AsyncClient(timeout=30.0) as client:
+    async with instrumented_client("kakao", timeout=30.0) as client:
         response = await client.post(token_url, headers=headers, data=data)
         
         if response.status_code == 200:
@@ -149,7 +150,7 @@ async def get_kakao_user_info(access_token: str) -> dict:
         "Content-Type": "application/x-www-form-urlencoded;charset=utf-8",
     }
     
-    async with httpx.AsyncClient(timeout=30.0) as client:
+    async with instrumented_client("kakao", timeout=30.0) as client:
         response = await client.get(api_url, headers=headers)
         
         if response.status_code == 200:
@@ -243,7 +244,7 @@ async def kakao_login(db: Session, code: str, redirect_uri: str) -> tuple[models
         is_profile_complete = bool(name and phone_number)
         
         user = models.User(
-            id=str(uuid4()),
+            id=new_id(),
             email=email,
             name=name,
             password_hash="",  # 소셜 로그인은 비밀번호 없음
@@ -327,7 +328,7 @@ async def get_kakao_friends(access_token: str) -> list[dict]:
     }
     
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
+        async with instrumented_client("kakao", timeout=30.0) as client:
             response = await client.get(api_url, headers=headers)
             
             if response.status_code == 200:
@@ -419,7 +420,7 @@ async def send_kakao_message(
         },
     }
     
-    async with httpx.AsyncClient(timeout=30.0) as client:
+    async with instrumented_client("kakao", timeout=30.0) as client:
         try:
             # 카카오톡 친구 메시지 API 요청 형식
             # receiver_uuids: 친구의 카카오톡 UUID 배열 (JSON 문자열)
@@ -1,14 +1,22 @@
+import re
 import time
-from fastapi import FastAPI, Request
+import uuid
+
+from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from slowapi import _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
 
+from backend.core.audit import audit_sink
 from backend.core.config import get_settings
-from backend.core.exceptions import DomainError
-from backend.core.logger import configure_logging, get_logger
+from backend.core.exceptions import DomainError, UnauthorizedError
+from backend.core.idempotency import IdempotentReplay, idempotency_middleware, idempotent_replay_handler
+from backend.core.logger import configure_logging, get_logger, request_id_var, should_log_access
 from backend.core.database import engine
+from backend.core import metrics
+from backend.core.profiling import profile_requested, stack_sampler, store_profile
+from backend.core.query_stats import report_repeated_queries, start_query_stats
 from backend.core.rate_limit import limiter, rate_limit_exceeded_handler
 from backend.api.v1.router import api_router
 
@@ -68,6 +76,9 @@ app = FastAPI(
 app.state.limiter = limiter
 app.add_exception_handler(RateLimitExceeded, rate_limit_exceeded_handler)
 
+# Idempotency-Key 재전송
+app.add_exception_handler(IdempotentReplay, idempotent_replay_handler)
+
 # CORS 설정 (다른 미들웨어보다 먼저 추가되어야 함)
 # 개발 환경 포트 + 프로덕션 도메인
 cors_origins = [
@@ -93,6 +104,7 @@ cors_allowed_headers = [
     "Accept",
     "Origin",
     "Cache-Control",
+    "Idempotency-Key",
 ]
 
 # 노출할 헤더 명시적 지정
@@ -100,6 +112,8 @@ cors_expose_headers = [
     "Content-Length",
     "Content-Type",
     "X-Request-Id",
+    "X-Profile-Id",
+    "Idempotent-Replayed",
 ]
 
 app.add_middleware(
@@ -113,35 +127,68 @@ app.add_middleware(
 )
 
 
+# Idempotency-Key 요청의 응답 저장 (log_requests 안쪽에서 실행)
+app.middleware("http")(idempotency_middleware)
+
+
+# 클라이언트가 보낸 X-Request-Id 허용 형식 (로그 주입 방지)
+REQUEST_ID_PATTERN = re.compile(r"^[A-Za-z0-9._-]{1,64}$")
+
+
 @app.middleware("http")
 async def log_requests(request: Request, call_next):
-    """요청/응답 로깅 미들웨어"""
-    start_time = time.time()
-    
-    # 요청 로깅
-    logger.info(
-        "%s %s - Client: %s",
-        request.method,
-        request.url.path,
-        request.client.host if request.client else "unknown",
-    )
+    """요청/응답 로깅 및 메트릭 미들웨어
+
+    요청마다 X-Request-Id를 발급(또는 전달받은 값 사용)하여 로그와 응답 헤더에 남깁니다.
+    정상 응답의 액세스 로그는 경로별 비율로 샘플링합니다.
+    """
+    start_time = time.perf_counter()
+    request_id = request.headers.get("X-Request-Id", "")
+    if not REQUEST_ID_PATTERN.match(request_id):
+        request_id = uuid.uuid4().hex
+    token = request_id_var.set(request_id)
+    query_stats = start_query_stats()
+    metrics.HTTP_REQUESTS_IN_PROGRESS.inc()
+    profile_session = stack_sampler.start_session() if profile_requested(request) else None
     
     try:
         response = await call_next(request)
-        process_time = time.time() - start_time
+        process_time = time.perf_counter() - start_time
+        response.headers["X-Request-Id"] = request_id
         
-        # 응답 로깅
-        logger.info(
-            "%s %s - Status: %d - Time: %.3fs",
-            request.method,
-            request.url.path,
-            response.status_code,
-            process_time,
-        )
+        # 라우트 템플릿 기준 메트릭 기록
+        route_path = metrics.route_label(request)
+        metrics.observe_request(request.method, route_path, response.status_code, process_time, query_stats)
+        report_repeated_queries(query_stats, route_path)
+        
+        # 관리자 요청 프로파일 저장
+        if profile_session is not None:
+            stack_sampler.stop_session(profile_session)
+            response.headers["X-Profile-Id"] = store_profile(profile_session, route_path)
+        
+        # 응답 로깅 (라우트 템플릿 기준 샘플링)
+        if should_log_access(route_path, response.status_code, process_time):
+            logger.info(
+                "%s %s - Status: %d - Time: %.3fs",
+                request.method,
+                request.url.path,
+                response.status_code,
+                process_time,
+                extra={
+                    "method": request.method,
+                    "path": request.url.path,
+                    "route": route_path,
+                    "status": response.status_code,
+                    "duration_ms": round(process_time * 1000, 1),
+                    "db_queries": query_stats.count,
+                    "client": request.client.host if request.client else "unknown",
+                },
+            )
         
         return response
     except Exception as exc:
-        process_time = time.time() - start_time
+        process_time = time.perf_counter() - start_time
+        metrics.observe_request(request.method, metrics.route_label(request), 500, process_time, query_stats)
         logger.error(
             "%s %s - Exception: %s - Time: %.3fs",
             request.method,
@@ -151,14 +198,50 @@ async def log_requests(request: Request, call_next):
             exc_info=True,
         )
         raise
+    finally:
+        if profile_session is not None:
+            stack_sampler.stop_session(profile_session)
+        metrics.HTTP_REQUESTS_IN_PROGRESS.dec()
+        request_id_var.reset(token)
+
+
+@app.get("/metrics", include_in_schema=False)
+def get_metrics(request: Request) -> Response:
+    """Prometheus 메트릭 (METRICS_TOKEN 설정 시 Bearer 토큰 필요)"""
+    if settings.metrics_token and request.headers.get("Authorization") != f"Bearer {settings.metrics_token}":
+        raise UnauthorizedError("메트릭 조회 권한이 없습니다.")
+    content, content_type = metrics.render_metrics()
+    return Response(content=content, media_type=content_type)
+
+
+@app.on_event("shutdown")
+def mark_metrics_process_dead() -> None:
+    """워커 종료 시 멀티 프로세스 메트릭 정리"""
+    metrics.mark_process_dead()
+
+
+@app.on_event("shutdown")
+def flush_audit_logs() -> None:
+    """워커 종료 시 버퍼에 남은 감사 로그 저장"""
+    audit_sink.flush()
 
 
 @app.exception_handler(DomainError)
 async def handle_domain_error(request: Request, exc: DomainError) -> JSONResponse:  # type: ignore[override]
     logger.warning("Domain error: %s %s - Path: %s", exc.error_code, exc.message, request.url.path)
+    content = {"error": exc.message, "code": exc.error_code}
+    headers = None
+    
+    # 요청 제한 초과 시 재시도 시간 안내
+    retry_after = getattr(exc, "retry_after", None)
+    if retry_after:
+        content["retry_after"] = retry_after
+        headers = {"Retry-After": str(retry_after)}
+    
     return JSONResponse(
         status_code=exc.status_code,
-        content={"error": exc.message, "code": exc.error_code},
+        content=content,
+        headers=headers,
     )
 
 
@@ -188,4 +271,8 @@ app.include_router(api_router, prefix="/api/v1")
 # 향후 deprecated 예정
 app.include_router(api_router)
 
+# 프로파일러가 스택에서 라우트를 판별할 수 있도록 엔드포인트 등록
+stack_sampler.register_routes(app.routes)
+stack_sampler.start_continuous()
+
 
@@ -1,5 +1,7 @@
 """알림 라우터"""
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
 from backend.core.database import get_db
@@ -30,13 +32,13 @@ def get_my_notifications(
     return schemas.NotificationListResponse(
         notifications=[
             schemas.NotificationResponse(
-                id=n["id"],
-                type=n["type"],
-                title=n["title"],
-                message=n["message"],
-                link=n.get("link"),
-                is_read=n["is_read"],
-                created_at=n["created_at"],
+                id=str(n.id),
+                type=n.type,
+                title=n.title,
+                message=n.message,
+                link=n.link,
+                is_read=n.is_read,
+                created_at=n.created_at,
             )
             for n in notifications
         ],
@@ -45,6 +47,39 @@ def get_my_notifications(
     )
 
 
+@router.get("/unread-count", response_model=schemas.UnreadCountResponse)
+def get_unread_count(
+    user_id: str = Depends(get_current_user_id),
+    db: Session = Depends(get_db),
+) -> schemas.UnreadCountResponse:
+    """읽지 않은 알림 수 (배지용)"""
+    return schemas.UnreadCountResponse(unread_count=service.get_unread_count(db, user_id))
+
+
+@router.get("/stream")
+async def stream_notifications(
+    request: Request,
+    user_id: str = Depends(get_current_user_id),
+    db: Session = Depends(get_db),
+) -> StreamingResponse:
+    """실시간 알림 스트림 (Server-Sent Events)
+    
+    연결 시 unread_count 이벤트를 보내고, 이후 새 알림은 notification 이벤트로,
+    읽음/삭제로 바뀐 배지 수는 unread_count 이벤트로 전달합니다.
+    Authorization 헤더가 필요하므로 fetch 기반 EventSource 클라이언트를 사용합니다.
+    """
+    unread_count = await run_in_threadpool(service.get_unread_count, db, user_id)
+    return StreamingResponse(
+        service.stream_events(request, user_id, unread_count),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            # nginx 응답 버퍼링 비활성화
+            "X-Accel-Buffering": "no",
+        },
+    )
+
+
 @router.post("/{notification_id}/read", response_model=schemas.NotificationReadResponse)
 def mark_notification_as_read(
     notification_id: str,
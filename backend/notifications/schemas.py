@@ -31,6 +31,11 @@ class NotificationListResponse(BaseModel):
     unread_count: int
 
 
+class UnreadCountResponse(BaseModel):
+    """읽지 않은 알림 수 응답"""
+    unread_count: int
+
+
 class NotificationReadResponse(BaseModel):
     """알림 읽음 응답"""
     success: bool
@@ -1,18 +1,206 @@
-"""알림 서비스"""
+"""알림 서비스
+
+알림은 notifications 테이블에 저장하고, 사용자별 읽지 않은 알림 수는 Redis 카운터로
+관리하여 배지 조회를 O(1)로 처리합니다. 카운터가 없으면(만료/Redis 재시작) DB에서
+(user_id, is_read, created_at) 인덱스로 다시 세어 채웁니다.
+
+새 알림과 읽음 상태 변경은 사용자별 Redis 채널로 발행되며, /notifications/stream(SSE)
+구독자에게 바로 전달됩니다.
+"""
+import json
 from datetime import datetime
-from typing import List, Tuple
-from uuid import uuid4
+from typing import AsyncIterator, Dict, Iterable, List, Optional, Sequence, Tuple
 
-from sqlalchemy import func, and_
+from fastapi import Request
+from sqlalchemy import delete, func, insert
 from sqlalchemy.orm import Session
 
+from backend.core import models
+from backend.core.config import get_settings
+from backend.core.ids import new_id
 from backend.core.logger import get_logger
+from backend.core.metrics import record_cache_lookup
+from backend.core.redis import get_async_redis_client, get_redis_client
 
 logger = get_logger(__name__)
 
+UNREAD_KEY_PREFIX = "notifications:unread"
+UNREAD_TTL = 60 * 60 * 24  # 1일 (만료 시 DB에서 다시 집계하여 오차 보정)
+CHANNEL_PREFIX = "notifications:user"
+BACK_IN_STOCK_KEY_PREFIX = "notifications:back_in_stock"
+BACK_IN_STOCK_COOLDOWN = 60 * 60  # 1시간 (재고가 0과 양수를 오갈 때 중복 발송 방지)
+
+# SSE 연결이 끊겼을 때 브라우저 재연결 대기 시간 (밀리초)
+STREAM_RETRY_MS = 5000
+# Redis를 사용할 수 없을 때 재연결 대기 시간 (밀리초)
+STREAM_UNAVAILABLE_RETRY_MS = 30000
+
+# 카운터가 있을 때만 증감 (없는 키를 증가시키면 실제보다 작은 값이 캐시됨)
+ADJUST_UNREAD_SCRIPT = """
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    return nil
+end
+local value = redis.call('INCRBY', KEYS[1], ARGV[1])
+if value < 0 then
+    redis.call('SET', KEYS[1], 0, 'KEEPTTL')
+    value = 0
+end
+return value
+"""
+
+_adjust_script = None
+
+
+def _unread_key(user_id: str) -> str:
+    return f"{UNREAD_KEY_PREFIX}:{user_id}"
+
+
+def _channel(user_id: str) -> str:
+    return f"{CHANNEL_PREFIX}:{user_id}"
+
+
+def _get_adjust_script():
+    global _adjust_script
+    if _adjust_script is None:
+        _adjust_script = get_redis_client().register_script(ADJUST_UNREAD_SCRIPT)
+    return _adjust_script
+
+
+def _serialize(notification: models.Notification) -> dict:
+    return {
+        "id": str(notification.id),
+        "type": notification.type,
+        "title": notification.title,
+        "message": notification.message,
+        "link": notification.link,
+        "is_read": notification.is_read,
+        "created_at": notification.created_at.isoformat(),
+    }
+
+
+# ==========================================
+# 읽지 않은 알림 카운터
+# ==========================================
+
+def count_unread(db: Session, user_id: str) -> int:
+    """DB 기준 읽지 않은 알림 수"""
+    return db.query(func.count(models.Notification.id)).filter(
+        models.Notification.user_id == user_id,
+        models.Notification.is_read.is_(False),
+    ).scalar() or 0
+
+
+def get_unread_count(db: Session, user_id: str) -> int:
+    """읽지 않은 알림 수 (Redis 카운터, 없으면 DB에서 집계 후 저장)"""
+    key = _unread_key(user_id)
+    try:
+        client = get_redis_client()
+        cached = client.get(key)
+        record_cache_lookup(key, cached is not None)
+        if cached is not None:
+            return max(int(cached), 0)
+    except Exception:
+        return count_unread(db, user_id)
+
+    count = count_unread(db, user_id)
+    try:
+        # 집계하는 동안 다른 요청이 채웠다면 그 값을 유지
+        client.set(key, count, ex=UNREAD_TTL, nx=True)
+    except Exception as e:
+        logger.warning("Unread counter write error: %s", str(e))
+    return count
+
+
+def _adjust_unread(deltas: Dict[str, int]) -> None:
+    """사용자별 카운터 증감 (카운터가 없는 사용자는 다음 조회 시 DB에서 집계)"""
+    global _adjust_script
+    if not deltas:
+        return
+    try:
+        script = _get_adjust_script()
+        pipe = get_redis_client().pipeline(transaction=False)
+        for user_id, delta in deltas.items():
+            script(keys=[_unread_key(user_id)], args=[delta], client=pipe)
+        pipe.execute()
+    except Exception as e:
+        # 증감에 실패하면 카운터를 신뢰할 수 없으므로 삭제 시도
+        logger.warning("Unread counter update error: %s", str(e))
+        _adjust_script = None
+        _invalidate_unread(list(deltas))
+
+
+def _invalidate_unread(user_ids: Sequence[str]) -> None:
+    try:
+        get_redis_client().delete(*[_unread_key(user_id) for user_id in user_ids])
+    except Exception:
+        pass
+
+
+# ==========================================
+# 실시간 전달 (Redis Pub/Sub)
+# ==========================================
+
+def _publish(events: Dict[str, List[dict]]) -> None:
+    """사용자별 이벤트 발행 (구독자가 없으면 버려짐)"""
+    if not events:
+        return
+    try:
+        pipe = get_redis_client().pipeline(transaction=False)
+        for user_id, payloads in events.items():
+            for payload in payloads:
+                pipe.publish(_channel(user_id), json.dumps(payload, ensure_ascii=False, default=str))
+        pipe.execute()
+    except Exception as e:
+        logger.warning("Notification publish error: %s", str(e))
+
+
+def _publish_unread_count(db: Session, user_id: str) -> None:
+    _publish({user_id: [{"event": "unread_count", "unread_count": get_unread_count(db, user_id)}]})
 
-# Notification 모델이 없으므로 임시로 딕셔너리 기반 구현
-# 실제 구현 시 models.Notification 사용
+
+def _format_event(event: str, data: dict) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False, default=str)}\n\n"
+
+
+async def stream_events(request: Request, user_id: str, unread_count: int) -> AsyncIterator[str]:
+    """사용자 알림 SSE 스트림
+
+    연결 직후 현재 읽지 않은 알림 수를 보내고, 이후 새 알림(notification)과
+    읽지 않은 알림 수 변경(unread_count) 이벤트를 전달합니다.
+    """
+    yield f"retry: {STREAM_RETRY_MS}\n" + _format_event("unread_count", {"unread_count": unread_count})
+
+    try:
+        pubsub = get_async_redis_client().pubsub()
+        await pubsub.subscribe(_channel(user_id))
+    except Exception as e:
+        logger.warning("Notification stream unavailable: %s", str(e))
+        yield f"retry: {STREAM_UNAVAILABLE_RETRY_MS}\n\n"
+        return
+
+    heartbeat = get_settings().notification_stream_heartbeat
+    try:
+        while not await request.is_disconnected():
+            message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=heartbeat)
+            if message is None:
+                # 프록시 유휴 타임아웃 방지
+                yield ": keep-alive\n\n"
+                continue
+            data = json.loads(message["data"])
+            yield _format_event(data.pop("event"), data)
+    except Exception as e:
+        logger.warning("Notification stream error: %s", str(e))
+    finally:
+        try:
+            await pubsub.unsubscribe()
+            await pubsub.reset()
+        except Exception:
+            pass
+
+
+# ==========================================
+# 조회
+# ==========================================
 
 def get_user_notifications(
     db: Session,
@@ -20,21 +208,32 @@ def get_user_notifications(
     limit: int = 20,
     offset: int = 0,
     unread_only: bool = False,
-) -> Tuple[List[dict], int, int]:
+) -> Tuple[List[models.Notification], int, int]:
     """사용자 알림 목록 조회
-    
+
     Returns:
         (알림 목록, 전체 수, 읽지 않은 수)
     """
-    # TODO: 실제 Notification 모델 사용
-    # 임시 구현
-    notifications = []
-    total = 0
-    unread_count = 0
-    
+    query = db.query(models.Notification).filter(models.Notification.user_id == user_id)
+    if unread_only:
+        query = query.filter(models.Notification.is_read.is_(False))
+
+    total = query.with_entities(func.count(models.Notification.id)).scalar() or 0
+    notifications = (
+        query.order_by(models.Notification.created_at.desc())
+        .offset(offset)
+        .limit(limit)
+        .all()
+    )
+    unread_count = get_unread_count(db, user_id)
+
     return notifications, total, unread_count
 
 
+# ==========================================
+# 생성
+# ==========================================
+
 def create_notification(
     db: Session,
     user_id: str,
@@ -42,33 +241,160 @@ def create_notification(
     title: str,
     message: str,
     link: str = None,
-) -> dict:
-    """알림 생성"""
-    notification = {
-        "id": str(uuid4()),
-        "user_id": user_id,
-        "type": notification_type,
-        "title": title,
-        "message": message,
-        "link": link,
-        "is_read": False,
-        "created_at": datetime.utcnow(),
-    }
-    
-    # TODO: DB에 저장
+) -> models.Notification:
+    """알림 생성 후 카운터 증가 및 실시간 전달"""
+    notification = models.Notification(
+        id=new_id(),
+        user_id=user_id,
+        type=notification_type,
+        title=title,
+        message=message,
+        link=link,
+        is_read=False,
+        created_at=datetime.utcnow(),
+    )
+    payload = _serialize(notification)
+    db.add(notification)
+    db.commit()
+
+    _adjust_unread({user_id: 1})
+    _publish({user_id: [{"event": "notification", "notification": payload}]})
     logger.info("Notification created: %s for user %s", title, user_id)
-    
+
     return notification
 
 
+def _insert_notifications(db: Session, rows: List[dict]) -> None:
+    """알림 행을 다중 행 INSERT 한 번으로 저장 후 커밋, 카운터 증가와 이벤트 발행은 파이프라인 한 번"""
+    db.execute(insert(models.Notification), rows)
+    db.commit()
+
+    deltas: Dict[str, int] = {}
+    events: Dict[str, List[dict]] = {}
+    for row in rows:
+        deltas[row["user_id"]] = deltas.get(row["user_id"], 0) + 1
+        events.setdefault(row["user_id"], []).append({
+            "event": "notification",
+            "notification": {
+                "id": row["id"],
+                "type": row["type"],
+                "title": row["title"],
+                "message": row["message"],
+                "link": row["link"],
+                "is_read": False,
+                "created_at": row["created_at"].isoformat(),
+            },
+        })
+    _adjust_unread(deltas)
+    _publish(events)
+
+
+def create_notifications_bulk(
+    db: Session,
+    user_ids: Sequence[str],
+    notification_type: str,
+    title: str,
+    message: str,
+    link: Optional[str] = None,
+    batch_size: Optional[int] = None,
+) -> int:
+    """여러 사용자에게 같은 알림 생성 (캠페인 등)
+
+    batch_size 단위로 다중 행 INSERT 후 커밋하고, 카운터 증가와 이벤트 발행은
+    배치마다 Redis 파이프라인 한 번으로 처리합니다.
+
+    Returns:
+        생성된 알림 수
+    """
+    batch_size = batch_size or get_settings().notification_fanout_batch_size
+    created = 0
+
+    for start in range(0, len(user_ids), batch_size):
+        batch = list(dict.fromkeys(user_ids[start:start + batch_size]))
+        now = datetime.utcnow()
+        rows = [
+            {
+                "id": new_id(),
+                "user_id": user_id,
+                "type": notification_type,
+                "title": title,
+                "message": message,
+                "link": link,
+                "is_read": False,
+                "created_at": now,
+            }
+            for user_id in batch
+        ]
+        _insert_notifications(db, rows)
+        created += len(rows)
+
+    logger.info("Bulk notifications created: %s for %d users", title, created)
+    return created
+
+
+def create_notifications_each(db: Session, notifications: Sequence[dict]) -> int:
+    """사용자별로 내용이 다른 알림을 한 번에 생성 (한 번의 INSERT/커밋)
+
+    Args:
+        notifications: {"user_id", "notification_type", "title", "message", "link"} 목록
+
+    Returns:
+        생성된 알림 수
+    """
+    if not notifications:
+        return 0
+    now = datetime.utcnow()
+    rows = [
+        {
+            "id": new_id(),
+            "user_id": item["user_id"],
+            "type": item["notification_type"],
+            "title": item["title"],
+            "message": item["message"],
+            "link": item.get("link"),
+            "is_read": False,
+            "created_at": now,
+        }
+        for item in notifications
+    ]
+    _insert_notifications(db, rows)
+    logger.info("Notifications created for %d users", len(rows))
+    return len(rows)
+
+
+# ==========================================
+# 읽음/삭제
+# ==========================================
+
 def mark_as_read(
     db: Session,
     user_id: str,
     notification_id: str,
 ) -> bool:
-    """알림 읽음 처리"""
-    # TODO: 실제 DB 업데이트
-    return True
+    """알림 읽음 처리
+
+    안 읽은 알림일 때만 조건부 UPDATE로 바꾸므로, 동시에 같은 알림을 읽음 처리해도
+    안 읽은 알림 수는 한 번만 줄어듭니다.
+    """
+    updated = db.query(models.Notification).filter(
+        models.Notification.id == notification_id,
+        models.Notification.user_id == user_id,
+        models.Notification.is_read.is_(False),
+    ).update({models.Notification.is_read: True}, synchronize_session=False)
+    db.commit()
+
+    if updated:
+        _adjust_unread({user_id: -1})
+        _publish_unread_count(db, user_id)
+        return True
+
+    # 이미 읽은 알림이면 성공, 없는 알림이면 실패
+    return db.query(
+        db.query(models.Notification).filter(
+            models.Notification.id == notification_id,
+            models.Notification.user_id == user_id,
+        ).exists()
+    ).scalar()
 
 
 def mark_all_as_read(
@@ -76,12 +402,21 @@ def mark_all_as_read(
     user_id: str,
 ) -> int:
     """모든 알림 읽음 처리
-    
+
     Returns:
         업데이트된 알림 수
     """
-    # TODO: 실제 DB 업데이트
-    return 0
+    updated = db.query(models.Notification).filter(
+        models.Notification.user_id == user_id,
+        models.Notification.is_read.is_(False),
+    ).update({models.Notification.is_read: True}, synchronize_session=False)
+    db.commit()
+
+    if updated:
+        # 0으로 덮어쓰면 동시에 생성된 알림이 누락되므로 삭제 후 다음 조회 시 재집계
+        _invalidate_unread([user_id])
+        _publish_unread_count(db, user_id)
+    return updated
 
 
 def delete_notification(
@@ -89,20 +424,32 @@ def delete_notification(
     user_id: str,
     notification_id: str,
 ) -> bool:
-    """알림 삭제"""
-    # TODO: 실제 DB 삭제
+    """알림 삭제
+
+    DELETE ... RETURNING으로 실제로 삭제한 요청만 안 읽은 알림 수를 줄입니다.
+    """
+    was_read = db.execute(
+        delete(models.Notification)
+        .where(
+            models.Notification.id == notification_id,
+            models.Notification.user_id == user_id,
+        )
+        .returning(models.Notification.is_read)
+    ).scalar_one_or_none()
+    db.commit()
+    if was_read is None:
+        return False
+
+    if not was_read:
+        _adjust_unread({user_id: -1})
+        _publish_unread_count(db, user_id)
     return True
 
 
 # 알림 헬퍼 함수들
 
-def notify_order_status_changed(
-    db: Session,
-    user_id: str,
-    order_number: str,
-    new_status: str,
-) -> dict:
-    """주문 상태 변경 알림"""
+def order_status_content(order_number: str, new_status: str) -> dict:
+    """주문 상태 변경 알림 내용 (단건/일괄 발송 공용)"""
     status_messages = {
         "paid": "결제가 완료되었습니다",
         "preparing": "상품 준비 중입니다",
@@ -110,49 +457,92 @@ def notify_order_status_changed(
         "delivered": "배송이 완료되었습니다",
         "cancelled": "주문이 취소되었습니다",
     }
-    
-    message = status_messages.get(new_status, f"주문 상태가 {new_status}(으)로 변경되었습니다")
-    
+
+    return {
+        "notification_type": "order",
+        "title": f"주문 상태 변경 ({order_number})",
+        "message": status_messages.get(new_status, f"주문 상태가 {new_status}(으)로 변경되었습니다"),
+        "link": f"/orders/{order_number}",
+    }
+
+
+def notify_order_status_changed(
+    db: Session,
+    user_id: str,
+    order_number: str,
+    new_status: str,
+) -> models.Notification:
+    """주문 상태 변경 알림"""
     return create_notification(
         db=db,
         user_id=user_id,
-        notification_type="order",
-        title=f"주문 상태 변경 ({order_number})",
-        message=message,
-        link=f"/orders/{order_number}",
+        **order_status_content(order_number, new_status),
     )
 
 
+def back_in_stock_content(product_id: int, product_name: str) -> dict:
+    """재입고 알림 내용 (단건/일괄 발송 공용)"""
+    return {
+        "notification_type": "promotion",
+        "title": "찜한 상품 재입고",
+        "message": f"'{product_name}' 상품이 재입고되었습니다!",
+        "link": f"/products/{product_id}",
+    }
+
+
 def notify_product_back_in_stock(
     db: Session,
     user_id: str,
     product_id: int,
     product_name: str,
-) -> dict:
+) -> models.Notification:
     """찜한 상품 재입고 알림"""
     return create_notification(
         db=db,
         user_id=user_id,
-        notification_type="promotion",
-        title="찜한 상품 재입고",
-        message=f"'{product_name}' 상품이 재입고되었습니다!",
-        link=f"/products/{product_id}",
+        **back_in_stock_content(product_id, product_name),
     )
 
 
+def schedule_back_in_stock(product_ids: Iterable[int]) -> None:
+    """재고가 0에서 양수로 바뀐 상품의 재입고 알림 작업 등록
+
+    커밋 이후에 호출해야 합니다. 같은 상품은 BACK_IN_STOCK_COOLDOWN 동안 한 번만 등록하며,
+    Redis를 사용할 수 없으면 중복 방지 없이 등록합니다.
+    """
+    from backend.tasks.notification_tasks import notify_back_in_stock
+
+    for product_id in product_ids:
+        try:
+            acquired = get_redis_client().set(
+                f"{BACK_IN_STOCK_KEY_PREFIX}:{product_id}", 1, ex=BACK_IN_STOCK_COOLDOWN, nx=True
+            )
+            if not acquired:
+                continue
+        except Exception:
+            pass
+        try:
+            notify_back_in_stock.delay(product_id)
+        except Exception as e:
+            # 브로커 장애로 상품 수정/주문 취소가 실패하지 않도록 기록만 남김
+            logger.error("Back-in-stock task enqueue failed for product %s: %s", product_id, str(e))
+
+
+def coupon_expiring_content(coupon_name: str, days_left: int) -> dict:
+    """쿠폰 만료 임박 알림 내용 (단건/일괄 발송 공용)"""
+    return {
+        "notification_type": "promotion",
+        "title": "쿠폰 만료 임박",
+        "message": f"'{coupon_name}' 쿠폰이 {days_left}일 후 만료됩니다!",
+        "link": "/coupons",
+    }
+
+
 def notify_coupon_expiring(
     db: Session,
     user_id: str,
     coupon_name: str,
     days_left: int,
-) -> dict:
+) -> models.Notification:
     """쿠폰 만료 임박 알림"""
-    return create_notification(
-        db=db,
-        user_id=user_id,
-        notification_type="promotion",
-        title="쿠폰 만료 임박",
-        message=f"'{coupon_name}' 쿠폰이 {days_left}일 후 만료됩니다!",
-        link="/coupons",
-    )
-
+    return create_notification(db=db, user_id=user_id, **coupon_expiring_content(coupon_name, days_left))
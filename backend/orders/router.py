@@ -1,23 +1,43 @@
 from typing import Optional
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Request
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 
+from backend.core.audit import AuditAction, log_order_action
 from backend.core.database import get_db
+from backend.core.exceptions import NotFoundError
+from backend.core.idempotency import idempotent
+from backend.core.rate_limit import get_client_ip, rate_limit
 from backend.core.security import get_current_user_id
+from backend.shipping.tracker import get_tracking
 
 from . import schemas, service
 
 router = APIRouter(prefix="/orders", tags=["orders"])
 
 
-@router.post("", response_model=schemas.CreateOrderResponse)
+@router.post(
+    "",
+    response_model=schemas.CreateOrderResponse,
+    dependencies=[Depends(rate_limit("api_create")), Depends(idempotent("orders.create"))],
+)
 def create_order(
+    request: Request,
     payload: schemas.CreateOrderRequest,
     user_id: str = Depends(get_current_user_id),
     db: Session = Depends(get_db),
 ) -> schemas.CreateOrderResponse:
-    return service.create_order(db=db, user_id=user_id, payload=payload)
+    result = service.create_order(db=db, user_id=user_id, payload=payload)
+    log_order_action(
+        db=db,
+        action=AuditAction.ORDER_CREATED,
+        order_id=result.orderId,
+        user_id=user_id,
+        details={"order_number": result.orderNumber, "total_amount": result.totalAmount},
+        ip_address=get_client_ip(request),
+    )
+    return result
 
 
 @router.get("", response_model=schemas.OrdersResponse)
@@ -47,6 +67,37 @@ def get_orders(
     )
 
 
+@router.get("/history", response_model=schemas.OrderHistoryResponse)
+def get_order_history(
+    cursor: Optional[str] = Query(default=None, description="이전 응답의 nextCursor"),
+    limit: int = Query(10, ge=1, le=100),
+    status: Optional[str] = Query(default=None),
+    user_id: str = Depends(get_current_user_id),
+    db: Session = Depends(get_db),
+) -> schemas.OrderHistoryResponse:
+    """주문 내역 (커서 기반, 마이페이지 무한 스크롤)"""
+    orders, next_cursor = service.list_order_history(
+        db=db,
+        user_id=user_id,
+        cursor=cursor,
+        limit=limit,
+        status_filter=status,
+    )
+    return schemas.OrderHistoryResponse(
+        orders=[schemas.OrderSummary.from_orm(order) for order in orders],
+        nextCursor=next_cursor,
+    )
+
+
+@router.get("/summary", response_model=schemas.OrderStatusSummaryResponse)
+def get_order_status_summary(
+    user_id: str = Depends(get_current_user_id),
+    db: Session = Depends(get_db),
+) -> schemas.OrderStatusSummaryResponse:
+    """주문 상태별 건수 (마이페이지 상단)"""
+    return schemas.OrderStatusSummaryResponse(**service.get_status_summary(db=db, user_id=user_id))
+
+
 @router.get("/{order_id}", response_model=schemas.OrderDetail)
 def get_order(
     order_id: str,
@@ -75,8 +126,29 @@ def get_order(
     )
 
 
+@router.get("/{order_id}/tracking")
+async def get_order_tracking(
+    order_id: str,
+    user_id: str = Depends(get_current_user_id),
+    db: Session = Depends(get_db),
+) -> dict:
+    """주문 배송 추적 (폴링 태스크가 갱신한 캐시 우선)
+
+    주문 조회(동기 DB)는 스레드 풀에서 실행하고, 이벤트 루프에서는 추적 조회만 기다립니다.
+    """
+    order = await run_in_threadpool(service.get_order, db=db, user_id=user_id, order_id=order_id)
+    if not order.courier or not order.tracking_number:
+        raise NotFoundError("배송 정보가 아직 등록되지 않았습니다.")
+    
+    tracking = await get_tracking(order.courier, order.tracking_number)
+    if not tracking:
+        raise NotFoundError("배송 추적 정보를 조회할 수 없습니다.")
+    return tracking
+
+
 @router.put("/{order_id}/cancel")
 def cancel_order(
+    request: Request,
     order_id: str,
     payload: dict,
     user_id: str = Depends(get_current_user_id),
@@ -84,6 +156,14 @@ def cancel_order(
 ) -> dict:
     reason = str(payload.get("reason", ""))
     service.cancel_order(db=db, user_id=user_id, order_id=order_id, reason=reason)
+    log_order_action(
+        db=db,
+        action=AuditAction.ORDER_CANCELLED,
+        order_id=order_id,
+        user_id=user_id,
+        details={"reason": reason},
+        ip_address=get_client_ip(request),
+    )
     return {"success": True}
 
 
@@ -24,7 +24,9 @@ class CreateOrderRequest(BaseModel):
     items: List[OrderItemPayload]
     shippingAddress: ShippingAddressPayload
     paymentMethod: str
-    discountAmount: int = 0
+    userCouponId: Optional[str] = None
+    usePoints: int = Field(0, ge=0)
+    discountAmount: int = 0  # 사용하지 않음 (할인은 서버에서 계산, 기존 클라이언트 호환용)
 
 
 class OrderSummary(BaseModel):
@@ -65,3 +67,18 @@ class OrdersResponse(BaseModel):
     totalPages: int
 
 
+class OrderHistoryResponse(BaseModel):
+    orders: List[OrderSummary]
+    nextCursor: Optional[str] = None
+
+
+class OrderStatusSummaryResponse(BaseModel):
+    pending: int = 0
+    paid: int = 0
+    preparing: int = 0
+    shipped: int = 0
+    delivered: int = 0
+    cancelled: int = 0
+    refunded: int = 0
+
+
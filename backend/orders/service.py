@@ -1,21 +1,33 @@
 from __future__ import annotations
 
+import uuid
 from datetime import datetime
-from typing import List, Tuple
-from uuid import uuid4
+from typing import Dict, Iterable, List, Optional, Tuple
 
-from sqlalchemy import func
+from sqlalchemy import and_, func, or_, update
 from sqlalchemy.orm import Session, joinedload, selectinload
 
+from backend.cart.pricing import PricingItem, calculate_quote
 from backend.core import models
+from backend.coupons.redemption import redeem_coupon, release_coupon_reservation, restore_coupon
+from backend.core.config import get_settings
 from backend.core.exceptions import NotFoundError, BadRequestError
+from backend.core.ids import new_id, sortable_code, uuid7_timestamp
+from backend.core.outbox import OutboxEventType, add_outbox_event
+from backend.core.redis import cache_delete_many, cache_get, cache_set
+from backend.points.service import add_points
+from backend.products.service import ProductSnapshot
 
 from . import schemas
 
+CANCELLABLE_STATUSES = ("pending", "paid", "preparing")
+ORDER_STATUSES = ("pending", "paid", "preparing", "shipped", "delivered", "cancelled", "refunded")
+STATUS_SUMMARY_KEY_PREFIX = "orders:status_summary"
 
-def _generate_order_number() -> str:
-    now = datetime.utcnow()
-    return now.strftime("%Y%m%d") + "-" + uuid4().hex[:8].upper()
+
+def _generate_order_number(order_id: str) -> str:
+    """주문번호 (주문 ID의 생성 시각 기준, 생성 순서대로 정렬됨)"""
+    return uuid7_timestamp(order_id).strftime("%Y%m%d") + "-" + sortable_code(order_id)
 
 
 def create_order(
@@ -23,7 +35,11 @@ def create_order(
     user_id: str,
     payload: schemas.CreateOrderRequest,
 ) -> schemas.CreateOrderResponse:
-    """주문 생성 (재고 확인 및 차감 포함, 벌크 조회 적용)"""
+    """주문 생성 (재고 확인 및 차감 포함, 벌크 조회 적용)
+
+    금액은 장바구니 견적과 같은 계산(cart.pricing)으로 서버에서 계산하며,
+    재고 차감을 위해 조회한 상품 행을 그대로 사용합니다.
+    """
     if not payload.items:
         raise BadRequestError("주문 상품이 존재하지 않습니다.")
 
@@ -34,63 +50,56 @@ def create_order(
     ).all()
     products_map = {p.id: p for p in products}
 
-    total_amount = 0
+    # 1단계: 금액 계산 (상품 존재/판매 상태, 쿠폰, 포인트 확인 포함)
+    quote = calculate_quote(
+        db,
+        user_id,
+        [PricingItem(item.productId, item.quantity, item.color, item.size) for item in payload.items],
+        {p.id: ProductSnapshot.from_model(p) for p in products},
+        user_coupon_id=payload.userCouponId,
+        use_points=payload.usePoints,
+    )
+
+    # 2단계: 재고 확인 및 주문 아이템 준비
     order_items: List[models.OrderItem] = []
-    products_to_update: List[tuple[models.Product, int]] = []  # (상품, 차감 수량)
-
-    # 1단계: 재고 확인 및 주문 아이템 준비
-    for item in payload.items:
-        product = products_map.get(item.productId)
-        if not product:
-            raise NotFoundError(f"상품 ID {item.productId}를 찾을 수 없습니다.")
-        
-        # 상품 활성화 상태 확인
-        if not product.is_active:
-            raise BadRequestError(f"'{product.name}' 상품은 현재 판매하지 않습니다.")
-        
-        # 재고 확인
-        if product.stock_quantity < item.quantity:
+    for line in quote.lines:
+        product = products_map[line.product_id]
+        if product.stock_quantity < line.quantity:
             raise BadRequestError(
                 f"'{product.name}' 재고가 부족합니다. "
-                f"(요청: {item.quantity}개, 재고: {product.stock_quantity}개)"
+                f"(요청: {line.quantity}개, 재고: {product.stock_quantity}개)"
             )
-        
-        line_total = product.price * item.quantity
-        total_amount += line_total
 
-        order_item = models.OrderItem(
-            id=str(uuid4()),
+        order_items.append(models.OrderItem(
+            id=new_id(),
             product_id=product.id,
-            product_name=product.name,
-            product_image=product.image_url,
-            quantity=item.quantity,
-            color=item.color,
-            size=item.size,
-            price=product.price,
+            product_name=line.name,
+            product_image=line.image_url,
+            quantity=line.quantity,
+            color=line.color,
+            size=line.size,
+            price=line.unit_price,
             created_at=datetime.utcnow(),
-        )
-        order_items.append(order_item)
-        products_to_update.append((product, item.quantity))
+        ))
 
-    # 2단계: 재고 차감 (트랜잭션 내에서)
-    for product, quantity in products_to_update:
-        product.stock_quantity -= quantity
+    # 3단계: 재고 차감 (트랜잭션 내에서)
+    for line in quote.lines:
+        product = products_map[line.product_id]
+        product.stock_quantity -= line.quantity
         product.updated_at = datetime.utcnow()
 
-    shipping_fee = 0 if total_amount >= 50000 else 3000
-    discount_amount = max(payload.discountAmount, 0)
-    final_amount = total_amount + shipping_fee - discount_amount
-
-    # 3단계: 주문 생성
+    # 4단계: 주문 생성
+    order_id = new_id()
     order = models.Order(
-        id=str(uuid4()),
+        id=order_id,
         user_id=user_id,
-        order_number=_generate_order_number(),
+        order_number=_generate_order_number(order_id),
         status="pending",
-        total_amount=total_amount,
-        discount_amount=discount_amount,
-        shipping_fee=shipping_fee,
-        final_amount=final_amount,
+        total_amount=quote.subtotal,
+        discount_amount=quote.discount_amount,
+        points_used=quote.points_used,
+        shipping_fee=quote.shipping_fee,
+        final_amount=quote.final_amount,
         recipient_name=payload.shippingAddress.recipientName,
         recipient_phone=payload.shippingAddress.phone,
         postal_code=payload.shippingAddress.postalCode,
@@ -109,8 +118,29 @@ def create_order(
         order_item.order_id = order.id
         db.add(order_item)
 
-    db.commit()
+    reserved_coupon_id = None
+    if quote.user_coupon is not None and redeem_coupon(db, quote.user_coupon, order.id):
+        reserved_coupon_id = quote.user_coupon.coupon_id
+
+    try:
+        if quote.points_used:
+            add_points(db, user_id, -quote.points_used, f"주문 사용 ({order.order_number})")
+
+        # 확인 이메일/알림은 아웃박스를 통해 커밋 후 비동기 처리
+        add_outbox_event(
+            db,
+            OutboxEventType.ORDER_CREATED,
+            aggregate_type="order",
+            aggregate_id=order.id,
+            payload={"order_id": str(order.id)},
+        )
+        db.commit()
+    except Exception:
+        if reserved_coupon_id:
+            release_coupon_reservation(reserved_coupon_id)
+        raise
 
+    invalidate_status_summary([user_id])
     return schemas.CreateOrderResponse(
         orderId=str(order.id),
         orderNumber=order.order_number,
@@ -148,6 +178,86 @@ def list_orders(
     return orders, total, total_pages
 
 
+def encode_order_cursor(order: models.Order) -> str:
+    """다음 페이지 커서 (created_at|id)"""
+    return f"{order.created_at.isoformat()}|{order.id}"
+
+
+def decode_order_cursor(cursor: str) -> Tuple[datetime, str]:
+    try:
+        created_at, order_id = cursor.split("|", 1)
+        return datetime.fromisoformat(created_at), str(uuid.UUID(order_id))
+    except ValueError:
+        raise BadRequestError("유효하지 않은 커서입니다.")
+
+
+def list_order_history(
+    db: Session,
+    user_id: str,
+    cursor: Optional[str],
+    limit: int,
+    status_filter: Optional[str],
+) -> Tuple[List[models.Order], Optional[str]]:
+    """주문 내역 조회 (최신순, 커서 기반 페이지네이션)
+
+    (user_id, created_at DESC, id DESC) 인덱스를 따라 커서 다음 위치부터 읽으므로
+    페이지가 깊어져도 비용이 같고, 전체 건수를 세지 않습니다.
+    """
+    order = models.Order
+    query = db.query(order).filter(order.user_id == user_id)
+    if status_filter:
+        query = query.filter(order.status == status_filter)
+    if cursor:
+        cursor_created_at, cursor_id = decode_order_cursor(cursor)
+        query = query.filter(
+            or_(
+                order.created_at < cursor_created_at,
+                and_(order.created_at == cursor_created_at, order.id < cursor_id),
+            )
+        )
+
+    orders = (
+        query
+        .options(selectinload(order.items))
+        .order_by(order.created_at.desc(), order.id.desc())
+        .limit(limit + 1)
+        .all()
+    )
+    next_cursor = encode_order_cursor(orders[limit - 1]) if len(orders) > limit else None
+    return orders[:limit], next_cursor
+
+
+def _status_summary_key(user_id: str) -> str:
+    return f"{STATUS_SUMMARY_KEY_PREFIX}:{user_id}"
+
+
+def get_status_summary(db: Session, user_id: str) -> Dict[str, int]:
+    """주문 상태별 건수 (마이페이지 상단)
+
+    상태가 바뀔 때 invalidate_status_summary로 지우는 캐시를 사용하고,
+    캐시가 없을 때만 상태별 건수를 집계합니다.
+    """
+    key = _status_summary_key(user_id)
+    cached = cache_get(key)
+    if cached is not None:
+        return cached
+
+    counts = dict(
+        db.query(models.Order.status, func.count(models.Order.id))
+        .filter(models.Order.user_id == user_id)
+        .group_by(models.Order.status)
+        .all()
+    )
+    summary = {status: counts.get(status, 0) for status in ORDER_STATUSES}
+    cache_set(key, summary, ttl=get_settings().order_summary_cache_ttl)
+    return summary
+
+
+def invalidate_status_summary(user_ids: Iterable[str]) -> None:
+    """주문 상태별 건수 캐시 삭제 (주문 생성/상태 변경 커밋 후 호출)"""
+    cache_delete_many([_status_summary_key(str(user_id)) for user_id in set(user_ids)])
+
+
 def get_order(db: Session, user_id: str, order_id: str) -> models.Order:
     """주문 상세 조회 (N+1 쿼리 방지를 위한 eager loading 적용)"""
     order = (
@@ -164,9 +274,20 @@ def get_order(db: Session, user_id: str, order_id: str) -> models.Order:
 
 
 def cancel_order(db: Session, user_id: str, order_id: str, reason: str) -> None:
-    """주문 취소 (재고 복구 포함)"""
+    """주문 취소 (재고, 사용한 포인트/쿠폰 복구 포함)"""
     order = get_order(db=db, user_id=user_id, order_id=order_id)
-    if order.status not in {"pending", "paid", "preparing"}:
+    if order.status not in CANCELLABLE_STATUSES:
+        raise BadRequestError("취소할 수 없는 주문 상태입니다.")
+
+    # 상태 전환을 조건부 UPDATE로 먼저 처리 (동시 취소 요청의 중복 반환 방지)
+    now = datetime.utcnow()
+    result = db.execute(
+        update(models.Order)
+        .where(models.Order.id == order.id, models.Order.status.in_(CANCELLABLE_STATUSES))
+        .values(status="cancelled", cancel_reason=reason, cancelled_at=now, updated_at=now)
+    )
+    if result.rowcount == 0:
+        db.rollback()
         raise BadRequestError("취소할 수 없는 주문 상태입니다.")
 
     # 주문 아이템 조회
@@ -174,19 +295,37 @@ def cancel_order(db: Session, user_id: str, order_id: str, reason: str) -> None:
         models.OrderItem.order_id == order_id
     ).all()
     
-    # 재고 복구
+    # 재고 복구 (상품을 한 번에 조회)
+    product_ids = {item.product_id for item in order_items if item.product_id}
+    products = {
+        product.id: product
+        for product in db.query(models.Product).filter(models.Product.id.in_(product_ids)).all()
+    } if product_ids else {}
+    restocked = {
+        product.id for product in products.values()
+        if product.stock_quantity <= 0 and product.is_active
+    }
     for item in order_items:
-        product = db.query(models.Product).filter(
-            models.Product.id == item.product_id
-        ).first()
+        product = products.get(item.product_id)
         if product:
             product.stock_quantity += item.quantity
-            product.updated_at = datetime.utcnow()
+            product.updated_at = now
 
-    order.status = "cancelled"
-    order.cancel_reason = reason
-    order.cancelled_at = datetime.utcnow()
-    order.updated_at = datetime.utcnow()
+    if order.points_used:
+        add_points(db, user_id, order.points_used, f"주문 취소 반환 ({order.order_number})")
+    restored_coupon_id = restore_coupon(db, order.id)
+
+    # 품절 상태에서 재고가 복구된 상품은 찜한 사용자에게 재입고 알림
+    add_outbox_event(
+        db,
+        OutboxEventType.ORDER_CANCELLED,
+        aggregate_type="order",
+        aggregate_id=order.id,
+        payload={"order_id": str(order.id), "restocked_product_ids": sorted(restocked)},
+    )
     db.commit()
+    if restored_coupon_id:
+        release_coupon_reservation(restored_coupon_id)
+    invalidate_status_summary([user_id])
 
 
@@ -0,0 +1 @@
+# Points module
@@ -0,0 +1,269 @@
+"""포인트 원장 (적립/사용/소멸)
+
+user_points는 변경 내역 원장이고 users.points는 잔액입니다. 잔액은 원장 기록과 같은
+트랜잭션에서 조건부 UPDATE(points = points + :n)로 원자적으로 갱신하므로 동시 변경에도
+유실되지 않고, 잔액 조회는 users 행 하나만 읽습니다. 원장 합계와의 차이는
+reconcile_balances(주기 실행)로 확인/보정합니다.
+
+적립 내역(user_points, points > 0)은 적립 시점부터 POINTS_VALIDITY_DAYS 후 소멸합니다.
+사용은 오래된 적립부터 차감된 것으로 보고, 소멸 시점의 잔액 중 아직 유효한 적립분을
+넘는 금액만 소멸시킵니다 (이미 사용한 적립분은 소멸하지 않음).
+"""
+import uuid
+from datetime import datetime, timedelta
+from typing import List, Optional, Sequence, Tuple
+
+from sqlalchemy import and_, func, literal, or_, select, text, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from backend.core import models
+from backend.core.config import get_settings
+from backend.core.exceptions import BadRequestError, NotFoundError
+from backend.core.ids import new_id
+from backend.core.logger import get_logger
+
+logger = get_logger(__name__)
+
+EXPIRY_REASON = "포인트 소멸"
+
+# 소멸 대상 적립 내역 한 배치를 처리하고 사용자별 소멸 금액을 한 번에 반영
+# (데이터 변경 CTE는 같은 문장의 다른 CTE에 보이지 않으므로 still_valid는 변경 전 기준)
+EXPIRE_POINTS_SQL = text("""
+WITH expiring AS (
+    UPDATE user_points SET expired_at = :now
+    WHERE id IN (
+        SELECT id FROM user_points
+        WHERE points > 0 AND expired_at IS NULL AND expires_at <= :now
+        ORDER BY expires_at
+        LIMIT :batch_size
+        FOR UPDATE SKIP LOCKED
+    )
+    RETURNING user_id, points
+),
+per_user AS (
+    SELECT user_id, SUM(points) AS points FROM expiring GROUP BY user_id
+),
+still_valid AS (
+    SELECT up.user_id, SUM(up.points) AS points
+    FROM user_points up
+    JOIN per_user p ON p.user_id = up.user_id
+    WHERE up.points > 0
+      AND up.expired_at IS NULL
+      AND (up.expires_at IS NULL OR up.expires_at > :now)
+    GROUP BY up.user_id
+),
+deduct AS (
+    SELECT p.user_id,
+           LEAST(p.points, GREATEST(u.points - COALESCE(v.points, 0), 0)) AS amount
+    FROM per_user p
+    JOIN users u ON u.id = p.user_id
+    LEFT JOIN still_valid v ON v.user_id = p.user_id
+),
+updated AS (
+    UPDATE users u SET points = GREATEST(u.points - d.amount, 0)
+    FROM deduct d
+    WHERE u.id = d.user_id AND d.amount > 0
+    RETURNING u.id AS user_id, d.amount
+),
+inserted AS (
+    INSERT INTO user_points (id, user_id, points, reason, created_at)
+    SELECT uuid_generate_v7(), user_id, -amount, :reason, :now FROM updated
+    RETURNING points
+)
+SELECT
+    (SELECT COUNT(*) FROM expiring) AS expired_rows,
+    (SELECT COUNT(*) FROM inserted) AS users,
+    (SELECT COALESCE(-SUM(points), 0) FROM inserted) AS points
+""")
+
+
+def points_expiry_date(granted_at: datetime) -> datetime:
+    """적립 포인트 소멸 예정 시각"""
+    return granted_at + timedelta(days=get_settings().points_validity_days)
+
+
+def expire_points(db: Session, now: datetime, batch_size: int) -> Tuple[int, int, int]:
+    """소멸 예정 시각이 지난 적립 내역 한 배치 소멸 처리 (커밋 포함)
+
+    Returns:
+        (처리한 적립 내역 수, 포인트가 차감된 사용자 수, 소멸 포인트 합계)
+    """
+    row = db.execute(
+        EXPIRE_POINTS_SQL,
+        {"now": now, "batch_size": batch_size, "reason": EXPIRY_REASON},
+    ).one()
+    db.commit()
+    return row.expired_rows, row.users, row.points
+
+
+def get_balance(db: Session, user_id: str) -> int:
+    """포인트 잔액 (users 행 하나만 조회)"""
+    balance = db.query(models.User.points).filter(models.User.id == user_id).scalar()
+    if balance is None:
+        raise NotFoundError("사용자를 찾을 수 없습니다.")
+    return balance
+
+
+def add_points(db: Session, user_id: str, points: int, reason: str) -> models.UserPoints:
+    """포인트 적립/차감 (커밋은 호출자의 트랜잭션에서 수행)
+
+    잔액을 원자적으로 갱신하고 원장에 기록합니다. 차감은 잔액이 충분할 때만 반영되며,
+    실패하면 트랜잭션을 롤백합니다.
+
+    Raises:
+        NotFoundError: 사용자 없음
+        BadRequestError: 잔액 부족
+    """
+    conditions = [models.User.id == user_id]
+    if points < 0:
+        conditions.append(models.User.points >= -points)
+    result = db.execute(
+        update(models.User).where(*conditions).values(points=models.User.points + points)
+    )
+    if result.rowcount == 0:
+        db.rollback()
+        if points < 0 and db.query(models.User.id).filter(models.User.id == user_id).first():
+            raise BadRequestError("포인트가 부족합니다.")
+        raise NotFoundError("사용자를 찾을 수 없습니다.")
+
+    now = datetime.utcnow()
+    record = models.UserPoints(
+        id=new_id(),
+        user_id=user_id,
+        points=points,
+        reason=reason,
+        created_at=now,
+        expires_at=points_expiry_date(now) if points > 0 else None,
+    )
+    db.add(record)
+    return record
+
+
+def grant_points_bulk(db: Session, user_ids: Sequence[str], points: int, reason: str) -> int:
+    """여러 사용자에게 같은 포인트 적립 (한 문장, 커밋 포함)
+
+    활성 사용자의 잔액을 한 번에 증가시키고, 갱신된 사용자만 원장에 기록합니다
+    (UPDATE ... RETURNING을 CTE로 받아 INSERT ... SELECT).
+
+    Returns:
+        적립된 사용자 수
+    """
+    if points <= 0:
+        raise BadRequestError("일괄 지급 포인트는 0보다 커야 합니다.")
+    user_ids = list(dict.fromkeys(user_ids))
+    if not user_ids:
+        return 0
+
+    now = datetime.utcnow()
+    updated = (
+        update(models.User)
+        .where(models.User.id.in_(user_ids), models.User.is_active.is_(True))
+        .values(points=models.User.points + points)
+        .returning(models.User.id)
+        .cte("updated")
+    )
+    stmt = (
+        pg_insert(models.UserPoints)
+        .from_select(
+            ["id", "user_id", "points", "reason", "created_at", "expires_at"],
+            select(
+                func.uuid_generate_v7(),
+                updated.c.id,
+                literal(points),
+                literal(reason),
+                literal(now),
+                literal(points_expiry_date(now)),
+            ),
+        )
+        .add_cte(updated)
+    )
+    granted = db.execute(stmt).rowcount
+    db.commit()
+    return granted
+
+
+def encode_points_cursor(record: models.UserPoints) -> str:
+    """다음 페이지 커서 (created_at|id)"""
+    return f"{record.created_at.isoformat()}|{record.id}"
+
+
+def decode_points_cursor(cursor: str) -> Tuple[datetime, str]:
+    try:
+        created_at, record_id = cursor.split("|", 1)
+        return datetime.fromisoformat(created_at), str(uuid.UUID(record_id))
+    except ValueError:
+        raise BadRequestError("유효하지 않은 커서입니다.")
+
+
+def list_history(
+    db: Session,
+    user_id: Optional[str] = None,
+    cursor: Optional[str] = None,
+    limit: int = 50,
+) -> Tuple[List[models.UserPoints], Optional[str]]:
+    """포인트 내역 조회 (최신순, 커서 기반 페이지네이션)"""
+    record = models.UserPoints
+    query = db.query(record)
+    if user_id:
+        query = query.filter(record.user_id == user_id)
+    if cursor:
+        cursor_created_at, cursor_id = decode_points_cursor(cursor)
+        query = query.filter(
+            or_(
+                record.created_at < cursor_created_at,
+                and_(record.created_at == cursor_created_at, record.id < cursor_id),
+            )
+        )
+
+    rows = query.order_by(record.created_at.desc(), record.id.desc()).limit(limit + 1).all()
+    next_cursor = encode_points_cursor(rows[limit - 1]) if len(rows) > limit else None
+    return rows[:limit], next_cursor
+
+
+def reconcile_balances(db: Session, batch_size: int, fix: bool = True) -> int:
+    """잔액(users.points)과 원장 합계가 다른 사용자 확인/보정 (한 배치, 커밋 포함)
+
+    불일치 사용자를 찾은 뒤 해당 users 행을 잠그고 원장 합계를 다시 계산하여 보정합니다.
+    포인트 변경은 users 행을 먼저 갱신(잠금)한 뒤 원장을 기록하므로, 잠금을 얻은 후의
+    합계에는 진행 중이던 변경까지 반영되어 있습니다. 원장이 없는 사용자는 대상이 아닙니다.
+
+    Returns:
+        불일치(fix=True이면 보정한) 사용자 수
+    """
+    ledger = (
+        select(models.UserPoints.user_id, func.sum(models.UserPoints.points).label("total"))
+        .group_by(models.UserPoints.user_id)
+        .subquery()
+    )
+    user_ids = [
+        row.id
+        for row in db.query(models.User.id)
+        .join(ledger, ledger.c.user_id == models.User.id)
+        .filter(models.User.points != ledger.c.total)
+        .limit(batch_size)
+        .all()
+    ]
+    if not user_ids or not fix:
+        return len(user_ids)
+
+    db.query(models.User.id).filter(models.User.id.in_(user_ids)).with_for_update().all()
+    ledger = (
+        select(models.UserPoints.user_id, func.sum(models.UserPoints.points).label("total"))
+        .where(models.UserPoints.user_id.in_(user_ids))
+        .group_by(models.UserPoints.user_id)
+        .subquery()
+    )
+    fixed = db.execute(
+        update(models.User)
+        .where(
+            models.User.id == ledger.c.user_id,
+            models.User.points != ledger.c.total,
+        )
+        .values(points=ledger.c.total)
+        .execution_options(synchronize_session=False)
+    ).rowcount
+    db.commit()
+    if fixed:
+        logger.warning("Points balance reconciled for %d users", fixed)
+    return fixed
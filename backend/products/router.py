@@ -1,23 +1,30 @@
 from typing import Optional
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Request
 from sqlalchemy.orm import Session
 
 from backend.core.database import get_db
+from backend.core.rate_limit import rate_limit
 
 from . import schemas, service
 
 router = APIRouter(prefix="/products", tags=["products"])
 
+# 검색 요청에만 적용하는 제한
+search_rate_limit = rate_limit("api_search")
+
 
 @router.get("", response_model=schemas.ProductsResponse)
 def get_products(
+    request: Request,
     category: Optional[str] = Query(default=None),
     search: Optional[str] = Query(default=None),
     page: int = Query(1, ge=1),
     limit: int = Query(20, ge=1, le=100),
     db: Session = Depends(get_db),
 ) -> schemas.ProductsResponse:
+    if search:
+        search_rate_limit(request)
     products, total, total_pages = service.list_products(
         db=db,
         category=category,
@@ -1,13 +1,67 @@
-from typing import List, Optional, Tuple
+from dataclasses import asdict, dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
 
 from sqlalchemy import func
 from sqlalchemy.orm import Session, selectinload
 
 from backend.core import models
 from backend.core.exceptions import NotFoundError
+from backend.core.redis import cache_delete, cache_get_many, cache_set_many
+from backend.notifications.service import schedule_back_in_stock
 
 from . import schemas
 
+SNAPSHOT_KEY_PREFIX = "products:snapshot"
+SNAPSHOT_TTL = 600  # 10분 (상품 수정/삭제 시 무효화)
+
+
+@dataclass(frozen=True)
+class ProductSnapshot:
+    """가격 계산에 필요한 상품 정보 (재고는 자주 바뀌므로 포함하지 않음)"""
+
+    id: int
+    name: str
+    price: int
+    image_url: str
+    is_active: bool
+
+    @classmethod
+    def from_model(cls, product: models.Product) -> "ProductSnapshot":
+        return cls(
+            id=product.id,
+            name=product.name,
+            price=product.price,
+            image_url=product.image_url,
+            is_active=bool(product.is_active),
+        )
+
+
+def _snapshot_key(product_id: int) -> str:
+    return f"{SNAPSHOT_KEY_PREFIX}:{product_id}"
+
+
+def get_product_snapshots(db: Session, product_ids: Iterable[int]) -> Dict[int, ProductSnapshot]:
+    """상품 스냅샷 일괄 조회 (캐시 MGET 후 없는 상품만 한 쿼리로 조회)"""
+    ids = list(dict.fromkeys(product_ids))
+    snapshots: Dict[int, ProductSnapshot] = {}
+    for product_id, cached in zip(ids, cache_get_many([_snapshot_key(pid) for pid in ids])):
+        if cached:
+            snapshots[product_id] = ProductSnapshot(**cached)
+
+    missing = [pid for pid in ids if pid not in snapshots]
+    if missing:
+        loaded = {
+            product.id: ProductSnapshot.from_model(product)
+            for product in db.query(models.Product).filter(models.Product.id.in_(missing)).all()
+        }
+        cache_set_many({_snapshot_key(pid): asdict(snap) for pid, snap in loaded.items()}, SNAPSHOT_TTL)
+        snapshots.update(loaded)
+    return snapshots
+
+
+def invalidate_product_snapshot(product_id: int) -> None:
+    cache_delete(_snapshot_key(product_id))
+
 
 def list_products(
     db: Session,
@@ -78,12 +132,17 @@ def update_product(
     payload: schemas.UpdateProductRequest,
 ) -> models.Product:
     product = get_product(db, product_id)
+    previous_stock = product.stock_quantity or 0
 
     for field, value in payload.dict(exclude_unset=True).items():
         setattr(product, field, value)
 
     db.commit()
     db.refresh(product)
+    invalidate_product_snapshot(product.id)
+
+    if previous_stock <= 0 < product.stock_quantity and product.is_active:
+        schedule_back_in_stock([product.id])
     return product
 
 
@@ -91,5 +150,6 @@ def delete_product(db: Session, product_id: int) -> None:
     product = get_product(db, product_id)
     db.delete(product)
     db.commit()
+    invalidate_product_snapshot(product_id)
 
 
@@ -4,7 +4,7 @@
 """
 from typing import Generic, TypeVar, Type, Optional, List, Any
 
-from sqlalchemy import func
+from sqlalchemy import func, inspect
 from sqlalchemy.orm import Session
 
 from backend.core.models import Base
@@ -70,8 +70,10 @@ class BaseRepository(Generic[ModelType]):
         """여러 엔티티 일괄 생성"""
         self.db.add_all(entities)
         self.db.commit()
-        for entity in entities:
-            self.db.refresh(entity)
+        if entities:
+            # 커밋으로 만료된 엔티티를 한 번의 쿼리로 다시 로딩 (엔티티별 refresh는 N번 조회)
+            ids = [inspect(entity).identity[0] for entity in entities]
+            self.db.query(self.model).filter(self.model.id.in_(ids)).all()
         return entities
     
     def update(self, entity: ModelType) -> ModelType:
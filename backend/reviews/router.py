@@ -5,6 +5,7 @@ from sqlalchemy.orm import Session
 
 from backend.core import models
 from backend.core.database import get_db
+from backend.core.rate_limit import rate_limit
 from backend.core.security import get_current_user_id
 
 from . import schemas, service
@@ -53,7 +54,7 @@ def get_product_reviews(
     )
 
 
-@router.post("", response_model=schemas.Review)
+@router.post("", response_model=schemas.Review, dependencies=[Depends(rate_limit("api_create"))])
 def create_review(
     payload: schemas.CreateReviewRequest,
     user_id: str = Depends(get_current_user_id),
@@ -103,9 +103,9 @@ def create_review(
         from backend.core.exceptions import ConflictError
         raise ConflictError("이미 리뷰를 작성하셨습니다.")
 
-    import uuid
+    from backend.core.ids import new_id
     review = models.Review(
-        id=str(uuid.uuid4()),
+        id=new_id(),
         product_id=payload.product_id,
         user_id=user_id,
         order_item_id=order_item.id,
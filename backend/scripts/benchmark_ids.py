@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""PK 생성 방식별 INSERT 처리량/인덱스 크기 벤치마크 (uuid4 vs UUIDv7)
+
+--database-url을 지정하면 PostgreSQL 임시 테이블에 행을 넣어 INSERT 처리량과
+PK 인덱스 크기(pg_relation_size)를 측정합니다. 생략하면 B-tree 리프 페이지 분할을
+단순 모델로 시뮬레이션하여 인덱스 크기를 추정합니다.
+
+사용법:
+    python backend/scripts/benchmark_ids.py [--rows N] [--batch B] [--database-url URL]
+"""
+import argparse
+import bisect
+import os
+import sys
+import time
+import uuid
+from typing import Callable, List
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, project_root)
+
+# 시뮬레이션용 리프 페이지당 키 수 (8KB 페이지, UUID 인덱스 튜플 약 32바이트 기준)
+PAGE_CAPACITY = 240
+
+
+def simulate_leaf_pages(keys: List[uuid.UUID], capacity: int = PAGE_CAPACITY) -> int:
+    """B-tree 리프 페이지 수 추정
+
+    가득 찬 페이지에 삽입하면 분할합니다. PostgreSQL과 같이 가장 오른쪽 페이지는
+    fillfactor(90%)만큼 남기고 분할하고, 중간 페이지는 절반씩 나눕니다.
+    """
+    # 각 페이지의 최소 키와 키 수
+    page_mins: List[int] = []
+    page_sizes: List[int] = []
+    for key in keys:
+        value = key.int
+        if not page_mins:
+            page_mins.append(value)
+            page_sizes.append(1)
+            continue
+        index = max(bisect.bisect_right(page_mins, value) - 1, 0)
+        if value < page_mins[index]:
+            page_mins[index] = value
+        if page_sizes[index] < capacity:
+            page_sizes[index] += 1
+            continue
+        # 분할
+        rightmost = index == len(page_mins) - 1
+        keep = int(capacity * 0.9) if rightmost else capacity // 2
+        moved = capacity - keep + 1
+        page_sizes[index] = keep
+        # 새 페이지의 최소 키는 알 수 없으므로 삽입 키로 근사
+        page_mins.insert(index + 1, value)
+        page_sizes.insert(index + 1, moved)
+    return len(page_mins)
+
+
+def run_simulation(rows: int) -> None:
+    from backend.core.ids import uuid7
+
+    print(f"시뮬레이션: 행 수 {rows}, 페이지당 키 {PAGE_CAPACITY}")
+    print("-" * 70)
+    for name, generator in (("uuid4", uuid.uuid4), ("uuid7", uuid7)):
+        start = time.perf_counter()
+        keys = [generator() for _ in range(rows)]
+        elapsed = time.perf_counter() - start
+        pages = simulate_leaf_pages(keys)
+        ideal = rows / PAGE_CAPACITY
+        print(
+            f"{name:<6} 생성 {rows / elapsed:>12,.0f} ids/s  "
+            f"리프 페이지 {pages:>7,}  (밀집 대비 {pages / ideal:.2f}x, 약 {pages * 8 / 1024:.1f}MB)"
+        )
+
+
+def run_postgres(database_url: str, rows: int, batch: int) -> None:
+    from sqlalchemy import create_engine, text
+
+    from backend.core.ids import new_id
+
+    engine = create_engine(database_url)
+    generators: List[tuple[str, Callable[[], str]]] = [
+        ("uuid4", lambda: str(uuid.uuid4())),
+        ("uuid7", new_id),
+    ]
+
+    print(f"PostgreSQL: 행 수 {rows}, 배치 {batch}")
+    print("-" * 70)
+    with engine.connect() as conn:
+        for name, generator in generators:
+            table = f"bench_ids_{name}"
+            conn.execute(text(f"DROP TABLE IF EXISTS {table}"))
+            conn.execute(text(
+                f"CREATE TABLE {table} (id UUID PRIMARY KEY, created_at TIMESTAMP NOT NULL DEFAULT now(), payload TEXT)"
+            ))
+            conn.commit()
+
+            insert = text(f"INSERT INTO {table} (id, payload) VALUES (:id, :payload)")
+            start = time.perf_counter()
+            for offset in range(0, rows, batch):
+                conn.execute(insert, [
+                    {"id": generator(), "payload": "x" * 64}
+                    for _ in range(min(batch, rows - offset))
+                ])
+                conn.commit()
+            elapsed = time.perf_counter() - start
+
+            index_size = conn.execute(text(f"SELECT pg_relation_size('{table}_pkey')")).scalar()
+            print(
+                f"{name:<6} INSERT {rows / elapsed:>10,.0f} rows/s  "
+                f"PK 인덱스 {index_size / 1024 / 1024:>8.1f}MB"
+            )
+            conn.execute(text(f"DROP TABLE {table}"))
+            conn.commit()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="uuid4 vs UUIDv7 primary key benchmark")
+    parser.add_argument("--rows", type=int, default=200000, help="삽입할 행 수")
+    parser.add_argument("--batch", type=int, default=1000, help="INSERT 배치 크기 (PostgreSQL)")
+    parser.add_argument("--database-url", default="", help="PostgreSQL URL (생략 시 시뮬레이션)")
+    args = parser.parse_args()
+
+    if args.database_url:
+        run_postgres(args.database_url, args.rows, args.batch)
+    else:
+        run_simulation(args.rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,14 +1,18 @@
 """배송 추적 서비스
 
 외부 택배사 API를 통한 배송 추적을 제공합니다.
+조회 결과는 Redis에 캐싱되며, 주기 폴링 태스크가 캐시를 갱신합니다.
 """
-from typing import Optional, List
+import asyncio
+from typing import Dict, Iterable, Optional, List, Tuple
 from datetime import datetime
 
 import httpx
 
 from backend.core.logger import get_logger
 from backend.core.config import get_settings
+from backend.core.metrics import instrumented_client
+from backend.core.redis import cache_get, cache_set
 
 logger = get_logger(__name__)
 settings = get_settings()
@@ -39,6 +43,13 @@ COURIER_NAMES = {
     "kyungdong": "경동택배",
 }
 
+# 배송 추적 캐시 설정
+TRACKING_CACHE_PREFIX = "tracking"
+TRACKING_CACHE_TTL = 60 * 60  # 1시간 (폴링 주기보다 길게)
+
+# 배송 완료로 간주하는 상태값 (스마트택배 completeYN="Y" 포함)
+DELIVERED_STATUSES = {"Y", "delivered"}
+
 
 class TrackingInfo:
     """배송 추적 정보"""
@@ -68,6 +79,23 @@ class TrackingInfo:
             "estimated_delivery": self.estimated_delivery.isoformat() if self.estimated_delivery else None,
         }
 
+    @property
+    def is_delivered(self) -> bool:
+        """배송 완료 여부"""
+        return self.status in DELIVERED_STATUSES
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "TrackingInfo":
+        """캐시된 딕셔너리에서 복원"""
+        estimated = data.get("estimated_delivery")
+        return cls(
+            courier=data["courier"],
+            tracking_number=data["tracking_number"],
+            status=data.get("status", ""),
+            progress=data.get("progress", []),
+            estimated_delivery=datetime.fromisoformat(estimated) if estimated else None,
+        )
+
 
 class ShippingTracker:
     """배송 추적 클래스"""
@@ -80,12 +108,14 @@ class ShippingTracker:
         self,
         courier: str,
         tracking_number: str,
+        client: Optional[httpx.AsyncClient] = None,
     ) -> Optional[TrackingInfo]:
         """배송 추적 정보 조회
         
         Args:
             courier: 택배사 코드 (cj, hanjin, lotte 등)
             tracking_number: 운송장번호
+            client: 재사용할 HTTP 클라이언트 (배치 조회 시 커넥션 공유)
         
         Returns:
             TrackingInfo 또는 None
@@ -94,46 +124,85 @@ class ShippingTracker:
             logger.warning("Shipping API key not configured")
             return self._get_mock_tracking(courier, tracking_number)
         
+        if client is None:
+            async with instrumented_client("shipping_tracker") as own_client:
+                return await self._fetch_tracking(own_client, courier, tracking_number)
+        return await self._fetch_tracking(client, courier, tracking_number)
+    
+    async def _fetch_tracking(
+        self,
+        client: httpx.AsyncClient,
+        courier: str,
+        tracking_number: str,
+    ) -> Optional[TrackingInfo]:
+        """외부 API 호출"""
         try:
             courier_code = COURIER_CODES.get(courier, courier)
             
             # 스마트택배 API 예시 (실제 API에 맞게 수정 필요)
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    "https://info.sweettracker.co.kr/api/v1/trackingInfo",
-                    params={
-                        "t_key": self.api_key,
-                        "t_code": courier_code,
-                        "t_invoice": tracking_number,
-                    },
-                    timeout=10.0,
-                )
-                
-                if response.status_code != 200:
-                    logger.error("Tracking API error: %s", response.text)
-                    return None
-                
-                data = response.json()
-                
-                return TrackingInfo(
-                    courier=courier,
-                    tracking_number=tracking_number,
-                    status=data.get("completeYN", "N"),
-                    progress=[
-                        {
-                            "time": item.get("timeString"),
-                            "location": item.get("where"),
-                            "status": item.get("kind"),
-                            "description": item.get("telno", ""),
-                        }
-                        for item in data.get("trackingDetails", [])
-                    ],
-                )
+            response = await client.get(
+                "https://info.sweettracker.co.kr/api/v1/trackingInfo",
+                params={
+                    "t_key": self.api_key,
+                    "t_code": courier_code,
+                    "t_invoice": tracking_number,
+                },
+                timeout=10.0,
+            )
+            
+            if response.status_code != 200:
+                logger.error("Tracking API error: %s", response.text)
+                return None
+            
+            data = response.json()
+            
+            return TrackingInfo(
+                courier=courier,
+                tracking_number=tracking_number,
+                status=data.get("completeYN", "N"),
+                progress=[
+                    {
+                        "time": item.get("timeString"),
+                        "location": item.get("where"),
+                        "status": item.get("kind"),
+                        "description": item.get("telno", ""),
+                    }
+                    for item in data.get("trackingDetails", [])
+                ],
+            )
                 
         except Exception as e:
             logger.error("Tracking API error: %s", str(e))
             return None
     
+    async def track_many(
+        self,
+        shipments: Iterable[Tuple[str, str]],
+        concurrency: int = 10,
+    ) -> Dict[Tuple[str, str], Optional[TrackingInfo]]:
+        """여러 운송장을 동시에 조회 (동시 요청 수 제한)
+        
+        Args:
+            shipments: (택배사 코드, 운송장번호) 목록
+            concurrency: 최대 동시 요청 수
+        
+        Returns:
+            (택배사 코드, 운송장번호) -> TrackingInfo 매핑 (실패 시 None)
+        """
+        unique = list(dict.fromkeys(shipments))
+        semaphore = asyncio.Semaphore(max(concurrency, 1))
+        
+        async with instrumented_client("shipping_tracker") as client:
+            async def _track(courier: str, tracking_number: str) -> Optional[TrackingInfo]:
+                async with semaphore:
+                    return await self.get_tracking_info(courier, tracking_number, client=client)
+            
+            results = await asyncio.gather(
+                *(_track(courier, number) for courier, number in unique)
+            )
+        
+        return dict(zip(unique, results))
+    
     def _get_mock_tracking(
         self,
         courier: str,
@@ -166,8 +235,32 @@ class ShippingTracker:
 shipping_tracker = ShippingTracker()
 
 
+def tracking_cache_key(courier: str, tracking_number: str) -> str:
+    """배송 추적 캐시 키"""
+    return f"{TRACKING_CACHE_PREFIX}:{courier}:{tracking_number}"
+
+
+def cache_tracking(info: TrackingInfo, ttl: int = TRACKING_CACHE_TTL) -> bool:
+    """배송 추적 정보를 캐시에 저장"""
+    return cache_set(tracking_cache_key(info.courier, info.tracking_number), info.to_dict(), ttl)
+
+
+def get_cached_tracking(courier: str, tracking_number: str) -> Optional[TrackingInfo]:
+    """캐시된 배송 추적 정보 조회"""
+    cached = cache_get(tracking_cache_key(courier, tracking_number))
+    return TrackingInfo.from_dict(cached) if cached else None
+
+
 async def get_tracking(courier: str, tracking_number: str) -> Optional[dict]:
-    """배송 추적 정보 조회 (헬퍼 함수)"""
-    info = await shipping_tracker.get_tracking_info(courier, tracking_number)
+    """배송 추적 정보 조회 (헬퍼 함수)
+    
+    폴링 태스크가 갱신한 캐시를 우선 사용하고, 없을 때만 외부 API를 호출합니다.
+    Redis 클라이언트는 동기이므로 캐시 조회/저장은 스레드에서 실행합니다.
+    """
+    info = await asyncio.to_thread(get_cached_tracking, courier, tracking_number)
+    if info is None:
+        info = await shipping_tracker.get_tracking_info(courier, tracking_number)
+        if info is not None:
+            await asyncio.to_thread(cache_tracking, info)
     return info.to_dict() if info else None
 
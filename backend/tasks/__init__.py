@@ -2,8 +2,13 @@
 
 백그라운드 작업을 위한 Celery 설정과 태스크를 정의합니다.
 """
+import time
+
 from celery import Celery
+from celery.schedules import crontab
+from celery.signals import task_postrun, task_prerun, worker_process_shutdown
 
+from backend.core import metrics
 from backend.core.config import get_settings
 from backend.core.logger import get_logger
 
@@ -42,8 +47,85 @@ celery_app.conf.update(
     
     # 브로커 연결 재시도 (Celery 6.0 대비)
     broker_connection_retry_on_startup=True,
+    
+    # 태스크 모듈 (autodiscover는 tasks.py만 찾으므로 명시적으로 등록)
+    imports=(
+        "backend.tasks.analytics_tasks",
+        "backend.tasks.audit_tasks",
+        "backend.tasks.cart_tasks",
+        "backend.tasks.coupon_tasks",
+        "backend.tasks.email_tasks",
+        "backend.tasks.notification_tasks",
+        "backend.tasks.order_tasks",
+        "backend.tasks.points_tasks",
+        "backend.tasks.shipping_tasks",
+        "backend.tasks.upload_tasks",
+    ),
 )
 
+# 주기 실행 스케줄 (celery beat)
+celery_app.conf.beat_schedule = {
+    "poll-shipped-orders": {
+        "task": "backend.tasks.shipping_tasks.poll_shipped_orders",
+        "schedule": crontab(minute="*/30"),  # 30분마다
+    },
+    "cleanup-orphaned-uploads": {
+        "task": "backend.tasks.upload_tasks.cleanup_orphaned_uploads",
+        "schedule": crontab(hour=4, minute=0),  # 매일 새벽 4시
+    },
+    "relay-outbox-events": {
+        "task": "backend.tasks.order_tasks.relay_outbox_events",
+        "schedule": settings.outbox_relay_interval,  # 기본 2초마다
+    },
+    "cleanup-outbox-events": {
+        "task": "backend.tasks.order_tasks.cleanup_outbox_events",
+        "schedule": crontab(hour=4, minute=30),  # 매일 새벽 4시 30분
+    },
+    "flush-dirty-carts": {
+        "task": "backend.tasks.cart_tasks.flush_dirty_carts",
+        "schedule": settings.cart_flush_interval,  # 기본 5초마다 (CART_STORE=redis)
+    },
+    "notify-expiring-coupons": {
+        "task": "backend.tasks.notification_tasks.notify_expiring_coupons",
+        "schedule": crontab(hour=10, minute=0),  # 매일 오전 10시
+    },
+    "expire-points": {
+        "task": "backend.tasks.points_tasks.expire_points",
+        "schedule": crontab(hour=0, minute=10),  # 매일 0시 10분
+    },
+    "reconcile-point-balances": {
+        "task": "backend.tasks.points_tasks.reconcile_point_balances",
+        "schedule": crontab(hour=4, minute=30),  # 매일 새벽 4시 30분
+    },
+    "ensure-audit-log-partitions": {
+        "task": "backend.tasks.audit_tasks.ensure_audit_log_partitions",
+        "schedule": crontab(day_of_month=1, hour=3, minute=0),  # 매월 1일 새벽 3시
+    },
+}
+
+# 태스크 실행 시간 메트릭 (task_id -> 시작 시각)
+_task_started_at: dict = {}
+
+
+@task_prerun.connect
+def record_task_start(task_id=None, **kwargs) -> None:
+    _task_started_at[task_id] = time.perf_counter()
+
+
+@task_postrun.connect
+def record_task_duration(task_id=None, task=None, state=None, **kwargs) -> None:
+    started_at = _task_started_at.pop(task_id, None)
+    if started_at is not None and task is not None:
+        metrics.CELERY_TASK_DURATION.labels(task.name, state or "UNKNOWN").observe(
+            time.perf_counter() - started_at
+        )
+
+
+@worker_process_shutdown.connect
+def mark_worker_process_dead(pid=None, **kwargs) -> None:
+    metrics.mark_process_dead(pid)
+
+
 # 태스크 모듈 자동 발견
 celery_app.autodiscover_tasks(["backend.tasks"])
 
@@ -0,0 +1,37 @@
+"""감사 로그 관련 비동기 태스크"""
+from datetime import date
+
+from . import celery_app
+from backend.core.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+@celery_app.task
+def ensure_audit_log_partitions(months_ahead: int = 2):
+    """audit_logs 월 파티션 미리 생성
+    
+    파티션이 없는 기간의 로그는 기본(default) 파티션에 쌓이므로,
+    이번 달부터 months_ahead개월 뒤까지의 파티션을 미리 만들어 둡니다.
+    """
+    from sqlalchemy import text
+    from backend.core.database import SessionLocal
+    
+    db = SessionLocal()
+    try:
+        today = date.today()
+        created = []
+        for offset in range(months_ahead + 1):
+            month_index = today.month - 1 + offset
+            target = date(today.year + month_index // 12, month_index % 12 + 1, 1)
+            db.execute(text("SELECT create_audit_logs_partition(:target)"), {"target": target})
+            created.append(target.strftime("%Y-%m"))
+        db.commit()
+        logger.info("Audit log partitions ensured: %s", ", ".join(created))
+        return created
+    except Exception as e:
+        db.rollback()
+        logger.error("Audit log partition creation failed: %s", str(e))
+        raise
+    finally:
+        db.close()
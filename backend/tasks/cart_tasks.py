@@ -0,0 +1,48 @@
+"""장바구니 관련 비동기 태스크
+
+CART_STORE=redis일 때 Redis 장바구니의 변경분을 Postgres에 반영합니다 (write-behind).
+"""
+from . import celery_app
+from backend.core.logger import get_logger
+
+logger = get_logger(__name__)
+
+# 한 번에 꺼낼 변경 사용자 수
+FLUSH_BATCH_SIZE = 500
+
+
+@celery_app.task
+def flush_dirty_carts():
+    """변경된 사용자 장바구니를 Postgres에 반영
+
+    반영에 실패한 사용자는 dirty 집합에 되돌려 다음 실행에서 다시 시도합니다.
+    """
+    from backend.cart.store import cart_store
+    from backend.core.config import get_settings
+    from backend.core.database import SessionLocal
+
+    if get_settings().cart_store != "redis":
+        return 0
+
+    db = SessionLocal()
+    flushed = 0
+    failed = []
+    try:
+        while True:
+            user_ids = cart_store.pop_dirty(FLUSH_BATCH_SIZE)
+            for user_id in user_ids:
+                try:
+                    cart_store.flush(db, user_id)
+                    flushed += 1
+                except Exception as e:
+                    db.rollback()
+                    failed.append(user_id)
+                    logger.warning("Cart flush failed for user %s: %s", user_id, str(e))
+            if len(user_ids) < FLUSH_BATCH_SIZE:
+                break
+        if flushed:
+            logger.info("Carts flushed: %d", flushed)
+        return flushed
+    finally:
+        cart_store.mark_dirty(failed)
+        db.close()
@@ -0,0 +1,103 @@
+"""쿠폰 관련 비동기 태스크"""
+import time
+from typing import Optional
+
+from . import celery_app
+from backend.core.logger import get_logger
+
+logger = get_logger(__name__)
+
+# 한 태스크 실행 시간 (초과하면 커서와 함께 다음 태스크로 이어서 실행)
+TASK_TIME_BUDGET = 240
+
+
+@celery_app.task(bind=True, max_retries=3)
+def issue_coupon_to_segment(
+    self,
+    job_id: str,
+    coupon_id: str,
+    segment: dict,
+    after_user_id: Optional[str] = None,
+    processed: int = 0,
+    issued: int = 0,
+):
+    """세그먼트 사용자에게 쿠폰 일괄 발행
+
+    user_id 키셋 순서로 구간마다 INSERT ... SELECT ... ON CONFLICT DO NOTHING을 실행하고
+    구간마다 커밋/진행 상황을 기록합니다. 실패하면 마지막으로 커밋한 구간부터 재시도합니다.
+
+    Args:
+        job_id: 발행 작업 ID (진행 상황 조회용)
+        coupon_id: 발행할 쿠폰 ID
+        segment: 대상 조건 (CouponSegment)
+        after_user_id: 이전 구간의 마지막 사용자 ID (처음은 None)
+        processed: 이전 실행까지 처리한 사용자 수
+        issued: 이전 실행까지 발행한 수
+    """
+    from backend.core.config import get_settings
+    from backend.core.database import SessionLocal
+    from backend.coupons import schemas
+    from backend.coupons.service import get_bulk_issue_job, issue_coupon_chunk, update_bulk_issue_job
+
+    chunk_size = get_settings().coupon_issue_chunk_size
+    job = get_bulk_issue_job(job_id)
+    job.status = "running"
+    job.processed, job.issued = processed, issued
+    update_bulk_issue_job(job)
+
+    started_at = time.monotonic()
+    db = SessionLocal()
+    try:
+        while True:
+            scanned, count, last_user_id = issue_coupon_chunk(
+                db,
+                coupon_id,
+                schemas.CouponSegment(**segment),
+                after_user_id,
+                chunk_size,
+            )
+            if last_user_id is None:
+                break
+            after_user_id = last_user_id
+            job.processed += scanned
+            job.issued += count
+            update_bulk_issue_job(job)
+
+            if scanned < chunk_size:
+                break
+            if time.monotonic() - started_at > TASK_TIME_BUDGET:
+                issue_coupon_to_segment.delay(
+                    job_id=job_id,
+                    coupon_id=coupon_id,
+                    segment=segment,
+                    after_user_id=after_user_id,
+                    processed=job.processed,
+                    issued=job.issued,
+                )
+                return {"success": True, "continued": True, "issued": job.issued}
+
+        job.status = "completed"
+        update_bulk_issue_job(job)
+        logger.info("Coupon %s issued to %d users (job %s)", coupon_id, job.issued, job_id)
+        return {"success": True, "issued": job.issued}
+    except Exception as e:
+        db.rollback()
+        logger.error("Coupon bulk issue failed (job %s): %s", job_id, str(e))
+        if self.request.retries >= self.max_retries:
+            job.status = "failed"
+            update_bulk_issue_job(job)
+            raise
+        raise self.retry(
+            exc=e,
+            countdown=60,
+            kwargs={
+                "job_id": job_id,
+                "coupon_id": coupon_id,
+                "segment": segment,
+                "after_user_id": after_user_id,
+                "processed": job.processed,
+                "issued": job.issued,
+            },
+        )
+    finally:
+        db.close()
@@ -0,0 +1,266 @@
+"""알림 관련 비동기 태스크"""
+from typing import Optional
+
+from . import celery_app
+from backend.core.logger import get_logger
+
+logger = get_logger(__name__)
+
+# 일괄 발송 진행 상황(키셋 커서) 기록
+FANOUT_DONE = "done"
+FANOUT_CURSOR_TTL = 60 * 60 * 48
+
+
+def _get_fanout_cursor(key: str) -> Optional[str]:
+    """마지막으로 발송한 user_id 또는 FANOUT_DONE (기록이 없거나 Redis 오류 시 None)"""
+    from backend.core.redis import get_redis_client
+
+    try:
+        return get_redis_client().get(key)
+    except Exception as e:
+        logger.warning("Fan-out cursor read error: %s", str(e))
+        return None
+
+
+def _set_fanout_cursor(key: str, value: str) -> None:
+    """배치 커밋 후 진행 상황 기록"""
+    from backend.core.redis import get_redis_client
+
+    try:
+        get_redis_client().set(key, value, ex=FANOUT_CURSOR_TTL)
+    except Exception as e:
+        logger.warning("Fan-out cursor write error: %s", str(e))
+
+
+@celery_app.task
+def send_campaign_notification(
+    notification_type: str,
+    title: str,
+    message: str,
+    link: Optional[str] = None,
+    marketing_only: bool = True,
+):
+    """캠페인 알림 일괄 발송
+    
+    활성 사용자 ID를 키셋 방식으로 배치 단위 조회하여 다중 행 INSERT로 알림을 생성합니다.
+    
+    Args:
+        notification_type: 알림 유형 (promotion, system 등)
+        title: 제목
+        message: 본문
+        link: 이동 링크
+        marketing_only: 마케팅 수신 동의 사용자에게만 발송
+    """
+    from backend.core import models
+    from backend.core.config import get_settings
+    from backend.core.database import SessionLocal
+    from backend.notifications.service import create_notifications_bulk
+    
+    batch_size = get_settings().notification_fanout_batch_size
+    db = SessionLocal()
+    try:
+        total = 0
+        last_id = None
+        while True:
+            query = db.query(models.User.id).filter(models.User.is_active.is_(True))
+            if marketing_only:
+                query = query.filter(models.User.marketing_agreed.is_(True))
+            if last_id is not None:
+                query = query.filter(models.User.id > last_id)
+            user_ids = [str(row.id) for row in query.order_by(models.User.id).limit(batch_size).all()]
+            if not user_ids:
+                break
+            
+            total += create_notifications_bulk(
+                db,
+                user_ids,
+                notification_type=notification_type,
+                title=title,
+                message=message,
+                link=link,
+                batch_size=batch_size,
+            )
+            last_id = user_ids[-1]
+        
+        logger.info("Campaign notification sent: %s to %d users", title, total)
+        return {"success": True, "sent": total}
+    except Exception as e:
+        db.rollback()
+        logger.error("Campaign notification failed: %s", str(e))
+        raise
+    finally:
+        db.close()
+
+
+@celery_app.task(bind=True, max_retries=3)
+def notify_back_in_stock(self, product_id: int, after_user_id: Optional[str] = None):
+    """찜한 사용자에게 재입고 알림 발송 (배치 단위로 이어서 실행)
+    
+    favorites를 (product_id, user_id) 인덱스 순서로 한 배치씩 읽어 알림을 일괄 생성하고,
+    남은 사용자가 있으면 마지막 user_id를 커서로 다음 태스크를 등록합니다.
+    한 태스크가 시간 제한을 넘지 않고, 실패 시 해당 배치만 재시도됩니다.
+    
+    재시도 시 중복이 생기지 않도록 알림 저장과 다음 배치 등록은 단계별로 완료를 기록하고
+    (키: 태스크 ID, 재시도해도 유지됨), 이메일은 마지막에 group 하나로 발행합니다.
+    
+    Args:
+        product_id: 재입고된 상품 ID
+        after_user_id: 이전 배치의 마지막 사용자 ID (첫 배치는 None)
+    """
+    from celery import group
+    from backend.core import models
+    from backend.core.config import get_settings
+    from backend.core.database import SessionLocal
+    from backend.core.outbox import already_handled, mark_handled
+    from backend.notifications.service import back_in_stock_content, create_notifications_bulk
+    from backend.tasks.email_tasks import send_email_async
+    
+    task_id = self.request.id
+    if already_handled(task_id):
+        return {"success": True, "duplicate": True}
+    notified_marker = f"{task_id}:notifications" if task_id else None
+    next_marker = f"{task_id}:next" if task_id else None
+    
+    settings = get_settings()
+    db = SessionLocal()
+    try:
+        product = db.query(
+            models.Product.id,
+            models.Product.name,
+            models.Product.is_active,
+            models.Product.stock_quantity,
+        ).filter(models.Product.id == product_id).first()
+        if not product or not product.is_active or product.stock_quantity <= 0:
+            # 작업 대기 중 다시 품절되었거나 비활성화된 경우
+            logger.info("Back-in-stock skipped for product %s", product_id)
+            return {"success": True, "sent": 0}
+        
+        query = db.query(models.Favorite.user_id).filter(models.Favorite.product_id == product_id)
+        if after_user_id is not None:
+            query = query.filter(models.Favorite.user_id > after_user_id)
+        user_ids = [
+            str(row.user_id)
+            for row in query.order_by(models.Favorite.user_id).limit(settings.notification_fanout_batch_size).all()
+        ]
+        if not user_ids:
+            return {"success": True, "sent": 0}
+        
+        content = back_in_stock_content(product.id, product.name)
+        sent = 0
+        if not already_handled(notified_marker):
+            sent = create_notifications_bulk(db, user_ids, **content)
+            mark_handled(notified_marker)
+        
+        if len(user_ids) == settings.notification_fanout_batch_size and not already_handled(next_marker):
+            notify_back_in_stock.delay(product_id, after_user_id=user_ids[-1])
+            mark_handled(next_marker)
+        
+        emails = []
+        if settings.back_in_stock_email:
+            recipients = db.query(models.User.email).filter(
+                models.User.id.in_(user_ids),
+                models.User.is_active.is_(True),
+                models.User.marketing_agreed.is_(True),
+            ).all()
+            emails = [
+                send_email_async.s(
+                    to=row.email,
+                    subject=f"[LUNE] {content['title']}",
+                    body=content["message"],
+                )
+                for row in recipients
+            ]
+        if emails:
+            group(emails).apply_async()
+        mark_handled(task_id)
+        
+        logger.info("Back-in-stock notifications sent for product %s: %d", product_id, sent)
+        return {"success": True, "sent": sent, "emails": len(emails)}
+    except Exception as e:
+        db.rollback()
+        logger.error("Back-in-stock notification failed for product %s: %s", product_id, str(e))
+        self.retry(exc=e, countdown=60 * (self.request.retries + 1))
+    finally:
+        db.close()
+
+
+@celery_app.task
+def notify_expiring_coupons(days_left: Optional[int] = None):
+    """만료 임박 쿠폰 보유자에게 알림 일괄 발송 (매일 실행)
+
+    days_left일 뒤 같은 날 만료되는 쿠폰마다 미사용 보유자를 user_id 키셋으로 배치 조회하여
+    다중 행 INSERT로 알림을 생성합니다.
+
+    valid_until은 UTC(naive)로 저장되므로, beat 타임존(Asia/Seoul) 기준 하루를 UTC 구간으로
+    바꿔 조회합니다. 쿠폰/날짜별 Redis 키에 배치마다 마지막 user_id(키셋 커서)를 기록하고
+    발송을 마치면 완료로 표시하므로, 중간에 실패해 다시 실행해도 남은 보유자부터 이어서 발송하고
+    같은 쿠폰은 하루에 한 번만 발송합니다.
+
+    Args:
+        days_left: 만료까지 남은 일수 (기본값: COUPON_EXPIRY_NOTICE_DAYS)
+    """
+    from datetime import datetime, time, timedelta, timezone
+    from zoneinfo import ZoneInfo
+
+    from backend.core import models
+    from backend.core.config import get_settings
+    from backend.core.database import SessionLocal
+    from backend.notifications.service import coupon_expiring_content, create_notifications_bulk
+
+    settings = get_settings()
+    days_left = days_left if days_left is not None else settings.coupon_expiry_notice_days
+    batch_size = settings.notification_fanout_batch_size
+    local_tz = ZoneInfo(celery_app.conf.timezone)
+    expiry_date = datetime.now(local_tz).date() + timedelta(days=days_left)
+    window_start = (
+        datetime.combine(expiry_date, time.min, tzinfo=local_tz)
+        .astimezone(timezone.utc)
+        .replace(tzinfo=None)
+    )
+    window_end = window_start + timedelta(days=1)
+
+    db = SessionLocal()
+    try:
+        coupons = (
+            db.query(models.Coupon.id, models.Coupon.name)
+            .filter(
+                models.Coupon.is_active.is_(True),
+                models.Coupon.valid_until >= window_start,
+                models.Coupon.valid_until < window_end,
+            )
+            .all()
+        )
+
+        total = 0
+        for coupon in coupons:
+            marker = f"notifications:coupon_expiring:{coupon.id}:{expiry_date}"
+            last_id = _get_fanout_cursor(marker)
+            if last_id == FANOUT_DONE:
+                continue
+
+            content = coupon_expiring_content(coupon.name, days_left)
+            while True:
+                query = db.query(models.UserCoupon.user_id).filter(
+                    models.UserCoupon.coupon_id == coupon.id,
+                    models.UserCoupon.is_used.is_(False),
+                )
+                if last_id is not None:
+                    query = query.filter(models.UserCoupon.user_id > last_id)
+                user_ids = [str(row.user_id) for row in query.order_by(models.UserCoupon.user_id).limit(batch_size).all()]
+                if not user_ids:
+                    break
+
+                total += create_notifications_bulk(db, user_ids, batch_size=batch_size, **content)
+                last_id = user_ids[-1]
+                _set_fanout_cursor(marker, last_id)
+
+            _set_fanout_cursor(marker, FANOUT_DONE)
+
+        logger.info("Coupon expiry notifications sent: %d coupons, %d users", len(coupons), total)
+        return {"success": True, "coupons": len(coupons), "sent": total}
+    except Exception as e:
+        db.rollback()
+        logger.error("Coupon expiry notification failed: %s", str(e))
+        raise
+    finally:
+        db.close()
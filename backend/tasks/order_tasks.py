@@ -0,0 +1,296 @@
+"""주문 관련 비동기 태스크
+
+주문 생성/상태 변경/취소의 부수 효과(이메일, 알림, 캐시 무효화)를 처리합니다.
+요청 핸들러는 아웃박스에 이벤트만 기록하고, 릴레이가 이 태스크들로 전달합니다.
+"""
+from datetime import datetime, timedelta
+from typing import List, Optional
+
+from . import celery_app
+from backend.core.logger import get_logger
+
+logger = get_logger(__name__)
+
+# 전달 완료 이벤트 삭제 배치 크기
+OUTBOX_CLEANUP_BATCH_SIZE = 5000
+
+
+@celery_app.task
+def relay_outbox_events():
+    """아웃박스 미전달 이벤트를 Celery 태스크로 전달
+
+    대기 이벤트가 배치 크기보다 적어질 때까지 반복합니다.
+    """
+    from backend.core.config import get_settings
+    from backend.core.database import SessionLocal
+    from backend.core.outbox import relay_pending_events
+
+    batch_size = get_settings().outbox_relay_batch_size
+
+    def send(task_name: str, kwargs: dict) -> None:
+        celery_app.send_task(task_name, kwargs=kwargs)
+
+    db = SessionLocal()
+    try:
+        total = 0
+        while True:
+            dispatched = relay_pending_events(db, send, batch_size)
+            total += dispatched
+            if dispatched < batch_size:
+                break
+        if total:
+            logger.info("Outbox events dispatched: %d", total)
+        return total
+    except Exception as e:
+        db.rollback()
+        logger.error("Outbox relay failed: %s", str(e))
+        raise
+    finally:
+        db.close()
+
+
+@celery_app.task
+def cleanup_outbox_events():
+    """보관 기간이 지난 전달 완료 이벤트 삭제"""
+    from sqlalchemy import delete, select
+    from backend.core import models
+    from backend.core.config import get_settings
+    from backend.core.database import SessionLocal
+
+    cutoff = datetime.utcnow() - timedelta(days=get_settings().outbox_retention_days)
+    db = SessionLocal()
+    try:
+        deleted = 0
+        while True:
+            ids = select(models.OutboxEvent.id).where(
+                models.OutboxEvent.dispatched_at.isnot(None),
+                models.OutboxEvent.dispatched_at < cutoff,
+            ).limit(OUTBOX_CLEANUP_BATCH_SIZE)
+            result = db.execute(delete(models.OutboxEvent).where(models.OutboxEvent.id.in_(ids)))
+            db.commit()
+            deleted += result.rowcount
+            if result.rowcount < OUTBOX_CLEANUP_BATCH_SIZE:
+                break
+        logger.info("Outbox events cleaned up: %d", deleted)
+        return deleted
+    except Exception as e:
+        db.rollback()
+        logger.error("Outbox cleanup failed: %s", str(e))
+        raise
+    finally:
+        db.close()
+
+
+@celery_app.task(bind=True, max_retries=3)
+def handle_order_created(self, order_id: str, event_id: Optional[str] = None):
+    """주문 생성 후처리: 주문 확인 이메일, 알림"""
+    from backend.core import models
+    from backend.core.database import SessionLocal
+    from backend.core.outbox import already_handled, mark_handled
+    from backend.notifications.service import create_notification
+    from backend.tasks.email_tasks import send_order_confirmation_email
+
+    if already_handled(event_id):
+        return {"success": True, "duplicate": True}
+
+    db = SessionLocal()
+    try:
+        row = (
+            db.query(models.Order.order_number, models.Order.user_id, models.User.email)
+            .outerjoin(models.User, models.User.id == models.Order.user_id)
+            .filter(models.Order.id == order_id)
+            .first()
+        )
+        if not row:
+            logger.warning("Order %s not found for created event", order_id)
+            return {"success": False}
+
+        if row.email:
+            send_order_confirmation_email.delay(row.order_number, row.email)
+        if row.user_id:
+            create_notification(
+                db=db,
+                user_id=str(row.user_id),
+                notification_type="order",
+                title=f"주문 완료 ({row.order_number})",
+                message="주문이 접수되었습니다",
+                link=f"/orders/{row.order_number}",
+            )
+
+        mark_handled(event_id)
+        return {"success": True}
+    except Exception as e:
+        db.rollback()
+        logger.error("Order created handler failed for %s: %s", order_id, str(e))
+        self.retry(exc=e, countdown=30 * (self.request.retries + 1))
+    finally:
+        db.close()
+
+
+@celery_app.task(bind=True, max_retries=3)
+def handle_order_status_changed(
+    self,
+    order_id: str,
+    status: str,
+    event_id: Optional[str] = None,
+):
+    """주문 상태 변경 후처리: 알림, 발송 이메일, 배송 추적 캐시 무효화"""
+    from backend.core import models
+    from backend.core.database import SessionLocal
+    from backend.core.outbox import already_handled, mark_handled
+    from backend.core.redis import cache_delete
+    from backend.notifications.service import notify_order_status_changed
+    from backend.shipping.tracker import tracking_cache_key
+    from backend.tasks.email_tasks import send_shipping_notification_email
+
+    if already_handled(event_id):
+        return {"success": True, "duplicate": True}
+
+    db = SessionLocal()
+    try:
+        row = (
+            db.query(
+                models.Order.order_number,
+                models.Order.user_id,
+                models.Order.courier,
+                models.Order.tracking_number,
+                models.User.email,
+            )
+            .outerjoin(models.User, models.User.id == models.Order.user_id)
+            .filter(models.Order.id == order_id)
+            .first()
+        )
+        if not row:
+            logger.warning("Order %s not found for status event", order_id)
+            return {"success": False}
+
+        if status == "shipped" and row.courier and row.tracking_number:
+            # 송장이 새로 등록/변경되었으므로 이전 추적 결과 제거
+            cache_delete(tracking_cache_key(row.courier, row.tracking_number))
+            if row.email:
+                send_shipping_notification_email.delay(row.order_number, row.email, row.tracking_number)
+
+        if row.user_id:
+            notify_order_status_changed(
+                db=db,
+                user_id=str(row.user_id),
+                order_number=row.order_number,
+                new_status=status,
+            )
+
+        mark_handled(event_id)
+        return {"success": True}
+    except Exception as e:
+        db.rollback()
+        logger.error("Order status handler failed for %s: %s", order_id, str(e))
+        self.retry(exc=e, countdown=30 * (self.request.retries + 1))
+    finally:
+        db.close()
+
+
+@celery_app.task(bind=True, max_retries=3)
+def handle_shipments_registered(
+    self,
+    order_ids: List[str],
+    event_id: Optional[str] = None,
+):
+    """송장 일괄 등록 후처리: 배송 추적 캐시 무효화, 알림(한 번에 저장), 발송 이메일(한 번에 발행)
+
+    재시도 시 중복이 생기지 않도록 알림은 한 번의 커밋으로 저장하고 단계 완료를 기록하며,
+    되돌릴 수 없는 이메일 발행은 마지막에 한 번만 수행한 뒤 바로 처리 완료를 기록합니다.
+    """
+    from celery import group
+    from backend.core import models
+    from backend.core.database import SessionLocal
+    from backend.core.outbox import already_handled, mark_handled
+    from backend.core.redis import cache_delete_many
+    from backend.notifications.service import create_notifications_each, order_status_content
+    from backend.shipping.tracker import tracking_cache_key
+    from backend.tasks.email_tasks import send_shipping_notification_email
+
+    if already_handled(event_id):
+        return {"success": True, "duplicate": True}
+    notified_marker = f"{event_id}:notifications" if event_id else None
+
+    db = SessionLocal()
+    try:
+        # 등록 후 상태가 다시 바뀐 주문(취소 등)은 제외
+        rows = (
+            db.query(
+                models.Order.order_number,
+                models.Order.user_id,
+                models.Order.courier,
+                models.Order.tracking_number,
+                models.User.email,
+            )
+            .outerjoin(models.User, models.User.id == models.Order.user_id)
+            .filter(models.Order.id.in_(order_ids), models.Order.status == "shipped")
+            .all()
+        )
+
+        cache_delete_many([tracking_cache_key(row.courier, row.tracking_number) for row in rows])
+
+        if not already_handled(notified_marker):
+            create_notifications_each(db, [
+                {"user_id": str(row.user_id), **order_status_content(row.order_number, "shipped")}
+                for row in rows
+                if row.user_id
+            ])
+            mark_handled(notified_marker)
+
+        emails = [
+            send_shipping_notification_email.s(row.order_number, row.email, row.tracking_number)
+            for row in rows
+            if row.email
+        ]
+        if emails:
+            group(emails).apply_async()
+        mark_handled(event_id)
+        return {"success": True, "orders": len(rows), "emails": len(emails)}
+    except Exception as e:
+        db.rollback()
+        logger.error("Shipments registered handler failed (%d orders): %s", len(order_ids), str(e))
+        self.retry(exc=e, countdown=30 * (self.request.retries + 1))
+    finally:
+        db.close()
+
+
+@celery_app.task(bind=True, max_retries=3)
+def handle_order_cancelled(
+    self,
+    order_id: str,
+    restocked_product_ids: Optional[List[int]] = None,
+    event_id: Optional[str] = None,
+):
+    """주문 취소 후처리: 알림, 품절 상품 재입고 알림 등록"""
+    from backend.core import models
+    from backend.core.database import SessionLocal
+    from backend.core.outbox import already_handled, mark_handled
+    from backend.notifications.service import notify_order_status_changed, schedule_back_in_stock
+
+    if already_handled(event_id):
+        return {"success": True, "duplicate": True}
+
+    db = SessionLocal()
+    try:
+        row = db.query(models.Order.order_number, models.Order.user_id).filter(
+            models.Order.id == order_id
+        ).first()
+        if row and row.user_id:
+            notify_order_status_changed(
+                db=db,
+                user_id=str(row.user_id),
+                order_number=row.order_number,
+                new_status="cancelled",
+            )
+
+        schedule_back_in_stock(restocked_product_ids or [])
+
+        mark_handled(event_id)
+        return {"success": True}
+    except Exception as e:
+        db.rollback()
+        logger.error("Order cancelled handler failed for %s: %s", order_id, str(e))
+        self.retry(exc=e, countdown=30 * (self.request.retries + 1))
+    finally:
+        db.close()
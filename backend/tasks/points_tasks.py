@@ -0,0 +1,72 @@
+"""포인트 관련 비동기 태스크"""
+from . import celery_app
+from backend.core.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+@celery_app.task
+def expire_points():
+    """소멸 예정 시각이 지난 적립 포인트 소멸 처리 (매일 실행)
+
+    배치마다 적립 내역 표시, 사용자별 소멸 금액 계산, users.points 차감, 소멸 내역 기록을
+    한 문장으로 처리합니다. 남은 대상이 배치 크기보다 적어질 때까지 반복합니다.
+    """
+    from datetime import datetime
+    from backend.core.config import get_settings
+    from backend.core.database import SessionLocal
+    from backend.points.service import expire_points as expire_points_batch
+
+    batch_size = get_settings().points_expiry_batch_size
+    now = datetime.utcnow()
+    db = SessionLocal()
+    try:
+        total_rows = total_users = total_points = 0
+        while True:
+            rows, users, points = expire_points_batch(db, now, batch_size)
+            total_rows += rows
+            total_users += users
+            total_points += points
+            if rows < batch_size:
+                break
+        logger.info(
+            "Points expired: %d grants, %d users, %d points",
+            total_rows, total_users, total_points,
+        )
+        return {"grants": total_rows, "users": total_users, "points": total_points}
+    except Exception as e:
+        db.rollback()
+        logger.error("Points expiry failed: %s", str(e))
+        raise
+    finally:
+        db.close()
+
+
+@celery_app.task
+def reconcile_point_balances():
+    """users.points 잔액과 user_points 원장 합계 대사 (매일 실행)
+
+    불일치한 사용자를 배치 단위로 원장 합계 기준으로 보정합니다. 정상 상태에서는 0건이어야
+    하므로 보정 건수가 있으면 경고 로그를 남깁니다.
+    """
+    from backend.core.config import get_settings
+    from backend.core.database import SessionLocal
+    from backend.points.service import reconcile_balances
+
+    batch_size = get_settings().points_reconcile_batch_size
+    db = SessionLocal()
+    try:
+        total = 0
+        while True:
+            fixed = reconcile_balances(db, batch_size)
+            total += fixed
+            if fixed < batch_size:
+                break
+        logger.info("Point balances reconciled: %d users", total)
+        return {"fixed": total}
+    except Exception as e:
+        db.rollback()
+        logger.error("Point balance reconciliation failed: %s", str(e))
+        raise
+    finally:
+        db.close()
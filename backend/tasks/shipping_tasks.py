@@ -0,0 +1,92 @@
+"""배송 추적 관련 비동기 태스크"""
+import asyncio
+from datetime import datetime
+
+from . import celery_app
+from backend.core.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+@celery_app.task
+def poll_shipped_orders(page_size: int = 200, concurrency: int = 10):
+    """배송중 주문 일괄 추적 (주기적 배치)
+    
+    shipped 상태 주문을 페이지 단위로 조회하여 동시에 추적하고,
+    결과를 캐시에 저장한 뒤 배송 완료된 주문을 한 번의 UPDATE로 전환합니다.
+    
+    Args:
+        page_size: 페이지당 조회할 주문 수
+        concurrency: 최대 동시 추적 요청 수
+    """
+    from backend.core.database import SessionLocal
+    from backend.core import models
+    from backend.orders.service import invalidate_status_summary
+    from backend.shipping.tracker import cache_tracking, shipping_tracker
+    
+    db = SessionLocal()
+    try:
+        tracked = 0
+        delivered: dict[str, str] = {}  # 주문 ID -> 사용자 ID
+        last_id = None
+        
+        while True:
+            # 키셋 페이지네이션: id 기준으로 다음 페이지 조회
+            query = db.query(
+                models.Order.id,
+                models.Order.courier,
+                models.Order.tracking_number,
+                models.Order.user_id,
+            ).filter(
+                models.Order.status == "shipped",
+                models.Order.courier.isnot(None),
+                models.Order.tracking_number.isnot(None),
+            )
+            if last_id is not None:
+                query = query.filter(models.Order.id > last_id)
+            rows = query.order_by(models.Order.id).limit(page_size).all()
+            if not rows:
+                break
+            last_id = rows[-1].id
+            
+            results = asyncio.run(
+                shipping_tracker.track_many(
+                    [(row.courier, row.tracking_number) for row in rows],
+                    concurrency=concurrency,
+                )
+            )
+            
+            for row in rows:
+                info = results.get((row.courier, row.tracking_number))
+                if info is None:
+                    continue
+                cache_tracking(info)
+                tracked += 1
+                if info.is_delivered:
+                    delivered[row.id] = row.user_id
+        
+        delivered_count = 0
+        if delivered:
+            now = datetime.utcnow()
+            delivered_count = db.query(models.Order).filter(
+                models.Order.id.in_(list(delivered)),
+                models.Order.status == "shipped",
+            ).update(
+                {
+                    models.Order.status: "delivered",
+                    models.Order.delivered_at: now,
+                    models.Order.updated_at: now,
+                },
+                synchronize_session=False,
+            )
+            db.commit()
+            invalidate_status_summary(delivered.values())
+        
+        logger.info("Tracked %d shipments, %d marked delivered", tracked, delivered_count)
+        return {"tracked": tracked, "delivered": delivered_count}
+    except Exception as e:
+        logger.error("Failed to poll shipped orders: %s", str(e))
+        db.rollback()
+        return {"error": str(e)}
+    finally:
+        db.close()
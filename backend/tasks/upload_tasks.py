@@ -0,0 +1,150 @@
+"""업로드 파일 관련 비동기 태스크"""
+import asyncio
+import json
+import re
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import Iterable, List, Set
+
+from . import celery_app
+from backend.core.logger import get_logger
+
+logger = get_logger(__name__)
+
+URL_PATTERN = re.compile(r"https?://[^\s\"'<>]+")
+
+
+def _collect_block_urls(db) -> Set[str]:
+    """배너/콘텐츠 블록(JSONB)에 포함된 URL 집합
+
+    블록 테이블은 작으므로 한 번 훑어서 메모리에 보관합니다.
+    """
+    from backend.core import models
+
+    urls: Set[str] = set()
+    for column in (models.Banner.content_blocks, models.Content.blocks):
+        for (blocks,) in db.query(column).yield_per(500):
+            if blocks:
+                urls.update(URL_PATTERN.findall(json.dumps(blocks, ensure_ascii=False)))
+    return urls
+
+
+def _find_referenced_urls(db, urls: List[str]) -> Set[str]:
+    """주어진 URL 중 상품/배너/콘텐츠/리뷰/주문 내역에서 참조 중인 URL"""
+    from backend.core import models
+
+    referenced: Set[str] = set()
+
+    scalar_columns = (
+        models.Product.image_url,
+        models.Banner.banner_image,
+        models.Content.thumbnail_url,
+        models.OrderItem.product_image,
+        models.InstagramSettings.featured_image_url,
+    )
+    for column in scalar_columns:
+        referenced.update(
+            value for (value,) in db.query(column).filter(column.in_(urls)).distinct()
+        )
+
+    array_columns = (models.Product.images, models.Review.images)
+    for column in array_columns:
+        for (values,) in db.query(column).filter(column.overlap(urls)):
+            referenced.update(values or [])
+
+    return referenced.intersection(urls)
+
+
+def _file_urls(uploaded) -> List[str]:
+    return [uploaded.url] + [v["url"] for v in (uploaded.variants or [])]
+
+
+def _file_paths(uploaded) -> Iterable[str]:
+    from backend.uploads.storage import path_from_public_url
+
+    yield uploaded.file_path
+    for variant in uploaded.variants or []:
+        path = path_from_public_url(uploaded.bucket, variant["url"])
+        if path:
+            yield path
+
+
+@celery_app.task
+def cleanup_orphaned_uploads(min_age_hours: int = 24, batch_size: int = 500):
+    """어디에서도 참조하지 않는 업로드 파일 정리 (일일 배치)
+
+    업로드 직후 아직 저장되지 않은 폼을 보호하기 위해 마지막 업로드(중복 업로드로
+    기존 파일을 돌려준 경우 포함)가 min_age_hours보다 오래된 파일만 대상으로 하며,
+    원본과 파생본 중 하나라도 참조되면 유지합니다.
+    """
+    from sqlalchemy import delete
+
+    from backend.core.database import SessionLocal
+    from backend.core import models
+    from backend.uploads.service import forget_upload
+    from backend.uploads.storage import delete_from_supabase
+
+    db = SessionLocal()
+    try:
+        cutoff = datetime.utcnow() - timedelta(hours=min_age_hours)
+        block_urls = _collect_block_urls(db)
+
+        scanned = 0
+        deleted = 0
+        last_id = None
+        while True:
+            query = db.query(models.UploadedFile).filter(models.UploadedFile.last_uploaded_at < cutoff)
+            if last_id is not None:
+                query = query.filter(models.UploadedFile.id > last_id)
+            rows = query.order_by(models.UploadedFile.id).limit(batch_size).all()
+            if not rows:
+                break
+            last_id = rows[-1].id
+            scanned += len(rows)
+
+            candidate_urls = list({url for row in rows for url in _file_urls(row)})
+            referenced = _find_referenced_urls(db, candidate_urls)
+            referenced.update(block_urls.intersection(candidate_urls))
+
+            orphans_by_bucket = defaultdict(list)
+            for row in rows:
+                if not referenced.intersection(_file_urls(row)):
+                    orphans_by_bucket[row.bucket].append(row)
+
+            for bucket, orphans in orphans_by_bucket.items():
+                # 조회 이후 다시 업로드된(last_uploaded_at 갱신) 파일은 지우지 않고,
+                # 실제로 삭제된 행의 Storage 객체만 제거 (실패 시 행 삭제도 롤백)
+                deleted_ids = set(db.execute(
+                    delete(models.UploadedFile)
+                    .where(
+                        models.UploadedFile.id.in_([row.id for row in orphans]),
+                        models.UploadedFile.last_uploaded_at < cutoff,
+                    )
+                    .returning(models.UploadedFile.id)
+                ).scalars())
+                orphans = [row for row in orphans if row.id in deleted_ids]
+                if not orphans:
+                    db.rollback()
+                    continue
+
+                paths = [path for row in orphans for path in _file_paths(row)]
+                if not asyncio.run(delete_from_supabase(bucket, paths)):
+                    db.rollback()
+                    continue
+
+                for row in orphans:
+                    # 커밋 후 만료된 삭제 행을 다시 읽지 않도록 세션에서 분리
+                    db.expunge(row)
+                db.commit()
+                for row in orphans:
+                    forget_upload(row)
+                deleted += len(orphans)
+
+        logger.info("Scanned %d uploads, deleted %d orphaned files", scanned, deleted)
+        return {"scanned": scanned, "deleted": deleted}
+    except Exception as e:
+        logger.error("Failed to cleanup orphaned uploads: %s", str(e))
+        db.rollback()
+        return {"error": str(e)}
+    finally:
+        db.close()
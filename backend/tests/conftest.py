@@ -18,6 +18,7 @@ os.environ["JWT_SECRET"] = "test-secret-key-for-testing-only"
 
 from backend.core.models import Base
 from backend.core.database import get_db
+from backend.core.query_stats import assert_max_queries as _assert_max_queries, instrument_engine
 from backend.main import app
 
 
@@ -28,6 +29,9 @@ test_engine = create_engine(
     connect_args={"check_same_thread": False},  # SQLite 전용
 )
 
+# 쿼리 예산 테스트용 집계
+instrument_engine(test_engine)
+
 TestSessionLocal = sessionmaker(
     bind=test_engine,
     autocommit=False,
@@ -73,6 +77,18 @@ def client(db: Session) -> Generator[TestClient, None, None]:
     app.dependency_overrides.clear()
 
 
+@pytest.fixture
+def assert_max_queries():
+    """쿼리 예산 검사 컨텍스트 매니저
+    
+    사용 예:
+        def test_list(client, assert_max_queries):
+            with assert_max_queries(3):
+                client.get("/products")
+    """
+    return _assert_max_queries
+
+
 @pytest.fixture
 def test_user_data() -> dict:
     """테스트 사용자 데이터"""
@@ -0,0 +1,159 @@
+"""송장 일괄 등록 테스트"""
+import io
+from datetime import datetime
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.orm import Session
+
+from backend.admin import schemas, service
+from backend.core import models
+from backend.core.exceptions import BadRequestError
+from backend.core.ids import new_id
+
+
+@pytest.fixture
+def user(db: Session) -> models.User:
+    """주문자"""
+    user = models.User(
+        id=str(uuid4()),
+        email="buyer@example.com",
+        name="구매자",
+        password_hash="x",
+        phone="010-1234-5678",
+    )
+    db.add(user)
+    db.commit()
+    return user
+
+
+def _order(db: Session, user: models.User, order_number: str, status: str) -> models.Order:
+    order = models.Order(
+        id=new_id(),
+        user_id=user.id,
+        order_number=order_number,
+        status=status,
+        total_amount=10000,
+        discount_amount=0,
+        shipping_fee=0,
+        final_amount=10000,
+        recipient_name="홍길동",
+        recipient_phone="010-1234-5678",
+        postal_code="12345",
+        address="서울시 강남구",
+        payment_method="card",
+        payment_status="paid",
+        created_at=datetime.utcnow(),
+    )
+    db.add(order)
+    db.commit()
+    return order
+
+
+def _entry(order_number: str, courier: str = "cj", tracking_number: str = "123456789012") -> schemas.ShipmentEntry:
+    return schemas.ShipmentEntry(order_number=order_number, courier=courier, tracking_number=tracking_number)
+
+
+class TestParseShipmentCsv:
+    """송장 CSV 파싱 테스트"""
+
+    def test_parse_with_bom_and_blank_rows(self):
+        """엑셀 BOM과 빈 행은 무시"""
+        content = (
+            "﻿order_number,courier,tracking_number\n"
+            "ORD-1,cj,111\n"
+            "\n"
+            ",,\n"
+            "ORD-2, Hanjin ,222\n"
+        ).encode("utf-8")
+
+        entries = service.parse_shipment_csv(content)
+
+        assert [entry.order_number for entry in entries] == ["ORD-1", "ORD-2"]
+        assert entries[1].courier == " Hanjin "  # 정규화는 등록 단계에서 수행
+        assert entries[1].tracking_number == "222"
+
+    def test_parse_missing_header(self):
+        """필수 헤더가 없으면 오류"""
+        with pytest.raises(BadRequestError) as exc_info:
+            service.parse_shipment_csv(b"order_number,courier\nORD-1,cj\n")
+
+        assert "tracking_number" in exc_info.value.message
+
+    def test_parse_non_utf8(self):
+        """UTF-8이 아닌 파일은 오류"""
+        with pytest.raises(BadRequestError):
+            service.parse_shipment_csv("order_number,courier,tracking_number\n주문,cj,1\n".encode("cp949"))
+
+    def test_read_rejects_oversized_file(self, monkeypatch):
+        """최대 행 수 기준 크기를 넘는 업로드는 끝까지 읽지 않고 거부"""
+        settings = service.get_settings()
+        monkeypatch.setattr(settings, "shipment_bulk_max_rows", 1)
+        monkeypatch.setattr(settings, "shipment_csv_row_bytes", 10)
+
+        assert service.read_shipment_csv(io.BytesIO(b"x" * 20)) == b"x" * 20
+        with pytest.raises(BadRequestError):
+            service.read_shipment_csv(io.BytesIO(b"x" * 21))
+
+
+class TestRegisterShipments:
+    """송장 일괄 등록 검증 테스트"""
+
+    def test_invalid_rows_are_reported_without_update(self, db: Session, user: models.User):
+        """중복/없는 주문/미지원 택배사/배송 불가 상태 행은 사유와 함께 건너뜀"""
+        _order(db, user, "ORD-1", "paid")
+        _order(db, user, "ORD-2", "delivered")
+        _order(db, user, "ORD-3", "cancelled")
+        _order(db, user, "ORD-4", "paid")
+
+        result = service.register_shipments(db, [
+            _entry("ORD-1", courier="unknown"),
+            _entry("ORD-1"),
+            _entry("ORD-404"),
+            _entry("ORD-2"),
+            _entry("ORD-3"),
+            _entry("ORD-4", tracking_number=" "),
+        ])
+
+        assert result.updated == 0
+        assert result.shipped == 0
+        assert [(error.row, error.order_number) for error in result.errors] == [
+            (1, "ORD-1"),
+            (2, "ORD-1"),
+            (3, "ORD-404"),
+            (4, "ORD-2"),
+            (5, "ORD-3"),
+            (6, "ORD-4"),
+        ]
+        reasons = [error.reason for error in result.errors]
+        assert reasons[0] == "지원하지 않는 택배사입니다: unknown"
+        assert reasons[1] == "같은 주문번호가 중복되었습니다."
+        assert reasons[2] == "주문을 찾을 수 없습니다."
+        assert reasons[3] == "배송 처리할 수 없는 주문 상태입니다: delivered"
+        assert reasons[4] == "배송 처리할 수 없는 주문 상태입니다: cancelled"
+        assert reasons[5] == "운송장번호가 없습니다."
+
+        db.expire_all()
+        assert db.query(models.Order).filter(models.Order.status == "shipped").count() == 0
+        assert db.query(models.OutboxEvent).count() == 0
+
+    def test_unchanged_shipment_is_skipped(self, db: Session, user: models.User):
+        """같은 송장으로 이미 배송중인 주문은 다시 갱신하지 않음"""
+        order = _order(db, user, "ORD-1", "shipped")
+        order.courier = "cj"
+        order.tracking_number = "123456789012"
+        db.commit()
+
+        result = service.register_shipments(db, [_entry(" ORD-1 ", courier=" CJ ")])
+
+        assert result.updated == 0
+        assert result.errors == []
+
+    def test_empty_and_too_many_rows_rejected(self, db: Session, monkeypatch):
+        """빈 요청과 최대 행 수 초과 요청은 거부"""
+        with pytest.raises(BadRequestError):
+            service.register_shipments(db, [])
+
+        monkeypatch.setattr(service.get_settings(), "shipment_bulk_max_rows", 2)
+        with pytest.raises(BadRequestError):
+            service.register_shipments(db, [_entry("ORD-1"), _entry("ORD-2"), _entry("ORD-3")])
@@ -136,3 +136,83 @@ class TestMe:
         
         assert response.status_code == 403  # HTTPBearer 기본 동작
 
+
+
+class TestTokenVerification:
+    """토큰 검증 캐시 테스트"""
+    
+    def test_repeated_token_uses_cache(self):
+        """같은 토큰은 서명 검증을 한 번만 수행"""
+        from backend.core.security import (
+            _verify_token_signature,
+            create_access_token,
+            decode_access_token,
+        )
+        
+        token = create_access_token("cache-user")
+        before = _verify_token_signature.cache_info()
+        
+        decode_access_token(token)
+        decode_access_token(token)
+        
+        after = _verify_token_signature.cache_info()
+        assert after.misses - before.misses == 1
+        assert after.hits - before.hits == 1
+    
+    def test_cached_token_still_checks_type(self):
+        """캐시된 리프레시 토큰을 액세스 토큰으로 사용 불가"""
+        from backend.core.exceptions import UnauthorizedError
+        from backend.core.security import create_refresh_token, decode_access_token, decode_refresh_token
+        
+        token = create_refresh_token("cache-user")
+        decode_refresh_token(token)
+        
+        with pytest.raises(UnauthorizedError):
+            decode_access_token(token)
+    
+    def test_authenticated_request_rate_limit_key(self, authenticated_client: tuple):
+        """인증된 요청은 사용자 ID 기반 rate limit 키 사용"""
+        from starlette.requests import Request
+        from backend.core.rate_limit import get_rate_limit_key
+        
+        client, user = authenticated_client
+        request = Request({
+            "type": "http",
+            "method": "GET",
+            "path": "/",
+            "headers": [(b"authorization", client.headers["Authorization"].encode())],
+        })
+        
+        assert get_rate_limit_key(request) == f"user:{user['id']}"
+        assert request.state.auth_payload["sub"] == user["id"]
+
+
+class TestPasswordHashing:
+    """비밀번호 해시 테스트"""
+    
+    def test_async_hash_and_verify(self):
+        """전용 스레드 풀에서 해시/검증"""
+        import asyncio
+        from backend.core.security import hash_password_async, verify_password_async
+        
+        async def run():
+            hashed = await hash_password_async("testpassword123")
+            return (
+                await verify_password_async("testpassword123", hashed),
+                await verify_password_async("wrongpassword", hashed),
+            )
+        
+        assert asyncio.run(run()) == (True, False)
+    
+    def test_rehash_when_cost_factor_changes(self):
+        """cost factor가 다른 해시는 검증 성공 시 새 해시 반환"""
+        from backend.core.security import pwd_context, verify_and_update_password
+        
+        current_rounds = pwd_context.to_dict()["bcrypt__rounds"]
+        old_hash = pwd_context.hash("testpassword123", rounds=current_rounds - 1)
+        
+        valid, new_hash = verify_and_update_password("testpassword123", old_hash)
+        
+        assert valid
+        assert new_hash is not None
+        assert verify_and_update_password("testpassword123", new_hash) == (True, None)
@@ -39,7 +39,29 @@ class TestAddToCart:
         assert response.status_code == 200
         data = response.json()
         assert data["success"] is True
-    
+
+    def test_add_same_item_increments_quantity(
+        self,
+        authenticated_client: tuple,
+        test_product: models.Product,
+    ):
+        """같은 상품/옵션을 다시 담으면 수량 증가"""
+        client, user = authenticated_client
+
+        cart_data = {
+            "productId": test_product.id,
+            "quantity": 2,
+            "color": "Black",
+            "size": "M",
+        }
+
+        first = client.post("/cart", json=cart_data)
+        second = client.post("/cart", json=cart_data)
+
+        assert second.status_code == 200
+        assert second.json()["item"]["id"] == first.json()["item"]["id"]
+        assert second.json()["item"]["quantity"] == 4
+
     def test_add_to_cart_nonexistent_product(self, authenticated_client: tuple):
         """존재하지 않는 상품"""
         client, user = authenticated_client
@@ -151,3 +173,30 @@ class TestRemoveFromCart:
         cart_response = client.get("/cart")
         assert cart_response.json()["items"] == []
 
+
+
+class TestCartQuote:
+    """장바구니 견적 테스트"""
+
+    def test_quote_current_cart(
+        self,
+        authenticated_client: tuple,
+        test_product: models.Product,
+    ):
+        """현재 장바구니 견적 (무료 배송 기준 이상)"""
+        client, user = authenticated_client
+
+        client.post("/cart", json={
+            "productId": test_product.id,
+            "quantity": 2,
+            "color": "Black",
+            "size": "M",
+        })
+
+        response = client.post("/cart/quote", json={})
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["subtotal"] == test_product.price * 2
+        assert data["shippingFee"] == 0
+        assert data["finalAmount"] == test_product.price * 2
@@ -0,0 +1,105 @@
+"""쿠폰 사용 처리 테스트"""
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Generator
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session, sessionmaker
+
+from backend.core import models
+from backend.core.exceptions import BadRequestError
+from backend.coupons.redemption import redeem_coupon
+
+TEST_POSTGRES_URL = os.environ.get("TEST_POSTGRES_URL")
+
+
+@pytest.fixture
+def postgres_db() -> Generator[Session, None, None]:
+    """동시성 테스트용 Postgres 세션 (TEST_POSTGRES_URL이 없으면 건너뜀)
+
+    SQLite는 쓰기를 파일 단위로 직렬화하고 ARRAY 컬럼을 만들 수 없으므로,
+    조건부 UPDATE의 행 잠금 동작은 실제 Postgres에서만 확인합니다.
+    """
+    if not TEST_POSTGRES_URL:
+        pytest.skip("TEST_POSTGRES_URL이 설정되지 않음")
+
+    engine = create_engine(TEST_POSTGRES_URL, pool_size=20)
+    models.Base.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine)()
+    try:
+        yield session
+    finally:
+        session.close()
+        models.Base.metadata.drop_all(bind=engine)
+        engine.dispose()
+
+
+class TestCouponRedemption:
+    """쿠폰 사용 한도 테스트"""
+
+    def test_concurrent_redemption_respects_usage_limit(self, postgres_db: Session):
+        """동시에 사용해도 사용 한도를 넘지 않음"""
+        db = postgres_db
+        now = datetime.utcnow()
+        coupon = models.Coupon(
+            id=str(uuid4()),
+            code="FIRST3",
+            name="선착순 3명",
+            discount_type="fixed_amount",
+            discount_value=1000,
+            min_purchase_amount=0,
+            valid_from=now - timedelta(days=1),
+            valid_until=now + timedelta(days=1),
+            usage_limit=3,
+            usage_count=0,
+            is_active=True,
+        )
+        db.add(coupon)
+
+        user_coupon_ids = []
+        for i in range(10):
+            user = models.User(
+                id=str(uuid4()),
+                email=f"coupon_{i}@example.com",
+                name="테스트",
+                password_hash="x",
+                phone="010-0000-0000",
+            )
+            user_coupon = models.UserCoupon(
+                id=str(uuid4()),
+                user_id=user.id,
+                coupon_id=coupon.id,
+                is_used=False,
+            )
+            db.add_all([user, user_coupon])
+            user_coupon_ids.append(user_coupon.id)
+        db.commit()
+
+        SessionLocal = sessionmaker(bind=db.get_bind())
+        barrier = threading.Barrier(len(user_coupon_ids))
+
+        def redeem(user_coupon_id: str) -> bool:
+            session = SessionLocal()
+            try:
+                user_coupon = session.get(models.UserCoupon, user_coupon_id)
+                user_coupon.coupon  # 쿠폰 로드 (대기 중 쿼리 방지)
+                barrier.wait()
+                redeem_coupon(session, user_coupon, None)
+                session.commit()
+                return True
+            except BadRequestError:
+                return False
+            finally:
+                session.close()
+
+        with ThreadPoolExecutor(max_workers=len(user_coupon_ids)) as executor:
+            results = list(executor.map(redeem, user_coupon_ids))
+
+        db.expire_all()
+        assert results.count(True) == 3
+        assert db.get(models.Coupon, coupon.id).usage_count == 3
+        assert db.query(models.UserCoupon).filter(models.UserCoupon.is_used.is_(True)).count() == 3
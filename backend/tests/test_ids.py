@@ -0,0 +1,90 @@
+"""시간순 ID(UUIDv7) 테스트"""
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from backend.core import ids
+
+FIXED_TIME = datetime(2026, 10, 19, 10, 0, 0, 123000, tzinfo=timezone.utc)
+
+
+class FakeClock:
+    """ids.time 대체 (time_ns를 직접 조정)"""
+
+    def __init__(self, now: datetime):
+        self.now_ns = int(now.timestamp() * 1000) * 1_000_000
+
+    def time_ns(self) -> int:
+        return self.now_ns
+
+
+@pytest.fixture
+def clock(monkeypatch) -> FakeClock:
+    clock = FakeClock(FIXED_TIME)
+    monkeypatch.setattr(ids, "time", clock)
+    monkeypatch.setattr(ids, "_last_ms", 0)
+    monkeypatch.setattr(ids, "_sequence", 0)
+    return clock
+
+
+class TestNewId:
+    """UUIDv7 생성 테스트"""
+
+    def test_version_and_variant(self):
+        """RFC 9562 버전(7)/변형 비트"""
+        value = uuid.UUID(ids.new_id())
+
+        assert value.version == 7
+        assert value.variant == uuid.RFC_4122
+
+    def test_unique_and_monotonic_within_one_ms(self, clock: FakeClock):
+        """같은 밀리초에 순번이 넘쳐도 고유하고 생성 순서대로 증가"""
+        generated = [uuid.UUID(ids.new_id()) for _ in range(ids._MAX_SEQUENCE * 2)]
+
+        assert len(set(generated)) == len(generated)
+        assert generated == sorted(generated)
+        # 순번이 넘치면 다음 밀리초를 미리 사용
+        assert ids.uuid7_timestamp(generated[0]) == FIXED_TIME
+        assert ids.uuid7_timestamp(generated[-1]) > FIXED_TIME
+
+    def test_monotonic_when_clock_goes_backwards(self, clock: FakeClock):
+        """시계가 되돌아가도 마지막 시각 기준으로 증가"""
+        first = uuid.UUID(ids.new_id())
+        clock.now_ns -= 5 * 1_000_000
+        second = uuid.UUID(ids.new_id())
+
+        assert second > first
+        assert ids.uuid7_timestamp(second) == FIXED_TIME
+
+    def test_timestamp_round_trip(self, clock: FakeClock):
+        """uuid7_timestamp는 생성 시각(밀리초)을 복원"""
+        value = ids.new_id()
+
+        assert ids.uuid7_timestamp(value) == FIXED_TIME
+        assert ids.uuid7_timestamp(uuid.UUID(value)) == FIXED_TIME
+
+        clock.now_ns += 1_000_000
+        assert ids.uuid7_timestamp(ids.new_id()) == FIXED_TIME + timedelta(milliseconds=1)
+
+
+class TestSortableCode:
+    """시간순 짧은 코드 테스트"""
+
+    def test_preserves_generation_order(self, clock: FakeClock):
+        """같은 날 생성된 ID의 코드는 생성 순서대로 정렬"""
+        generated = []
+        for _ in range(3):
+            generated.extend(ids.new_id() for _ in range(ids._MAX_SEQUENCE + 10))
+            clock.now_ns += 7 * 1_000_000
+        codes = [ids.sortable_code(value) for value in generated]
+
+        assert len(set(codes)) == len(codes)
+        assert codes == sorted(codes)
+
+    def test_code_alphabet_and_length(self):
+        """Crockford Base32 문자만 사용"""
+        code = ids.sortable_code(ids.new_id())
+
+        assert len(code) == 10
+        assert set(code) <= set(ids._CROCKFORD_ALPHABET)
@@ -31,3 +31,119 @@ class TestNotifications:
         data = response.json()
         assert data["success"] is True
 
+    
+    def test_unread_count(self, authenticated_client):
+        """읽지 않은 알림 수 조회"""
+        client, _ = authenticated_client
+        
+        response = client.get("/notifications/unread-count")
+        assert response.status_code == 200
+        assert response.json()["unread_count"] == 0
+    
+    def test_unread_counter_decremented_once(self, authenticated_client, db, monkeypatch):
+        """읽음/삭제가 반복되어도 실제로 바뀐 요청만 안 읽은 알림 수를 줄임"""
+        from backend.notifications import service
+        
+        client, user = authenticated_client
+        read = service.create_notification(db, user["id"], "system", "읽을 알림", "내용")
+        unread = service.create_notification(db, user["id"], "system", "삭제할 알림", "내용")
+        read_id, unread_id = read.id, unread.id
+        
+        adjustments = []
+        monkeypatch.setattr(service, "_adjust_unread", adjustments.append)
+        
+        assert client.post(f"/notifications/{read_id}/read").json()["success"] is True
+        assert client.post(f"/notifications/{read_id}/read").json()["success"] is True
+        assert client.delete(f"/notifications/{read_id}").json()["success"] is True
+        assert adjustments == [{user["id"]: -1}]
+        
+        assert client.delete(f"/notifications/{unread_id}").json()["success"] is True
+        assert client.delete(f"/notifications/{unread_id}").json()["success"] is False
+        assert client.post(f"/notifications/{unread_id}/read").json()["success"] is False
+        assert adjustments == [{user["id"]: -1}, {user["id"]: -1}]
+    
+    def test_concurrent_read_decrements_once(self, authenticated_client, db, monkeypatch):
+        """먼저 읽어 둔 요청이 늦게 처리되어도 안 읽은 알림 수를 다시 줄이지 않음"""
+        from sqlalchemy.orm import sessionmaker
+        from backend.core import models
+        from backend.notifications import service
+        
+        _, user = authenticated_client
+        notification_id = service.create_notification(db, user["id"], "system", "알림", "내용").id
+        adjustments = []
+        monkeypatch.setattr(service, "_adjust_unread", adjustments.append)
+        
+        # 두 번째 요청이 첫 번째 요청의 커밋 전에 알림을 읽어 둔 상황
+        other = sessionmaker(bind=db.get_bind())()
+        try:
+            stale = other.get(models.Notification, notification_id)
+            assert stale.is_read is False
+            assert service.mark_as_read(db, user["id"], notification_id) is True
+            assert service.mark_as_read(other, user["id"], notification_id) is True
+        finally:
+            other.close()
+        
+        assert adjustments == [{user["id"]: -1}]
+
+
+class TestExpiringCouponNotifications:
+    """만료 임박 쿠폰 알림 테스트"""
+    
+    def test_seoul_day_window_and_resume_after_failure(self, db, monkeypatch):
+        """서울 기준 하루에 만료되는 쿠폰만 발송하고, 실패 후 재실행 시 남은 보유자부터 이어서 발송"""
+        from datetime import datetime, timedelta
+        from zoneinfo import ZoneInfo
+        from uuid import uuid4
+        from sqlalchemy.orm import sessionmaker
+        from backend.core import models
+        from backend.core.ids import new_id
+        from backend.notifications import service
+        from backend.tasks import notification_tasks
+        
+        expiry_date = datetime.now(ZoneInfo("Asia/Seoul")).date() + timedelta(days=3)
+        midnight = datetime(expiry_date.year, expiry_date.month, expiry_date.day)
+        coupons = []
+        for valid_until in (
+            midnight - timedelta(hours=9) + timedelta(minutes=30),  # 서울 00:30
+            midnight + timedelta(hours=23),  # 서울 다음 날 08:00
+        ):
+            coupon = models.Coupon(
+                id=str(uuid4()),
+                code=uuid4().hex[:8],
+                name="만료 임박 쿠폰",
+                discount_type="fixed_amount",
+                discount_value=1000,
+                valid_from=datetime.utcnow() - timedelta(days=1),
+                valid_until=valid_until,
+            )
+            coupons.append(coupon)
+        db.add_all(coupons)
+        for i in range(5):
+            user_id = new_id()
+            db.add(models.User(id=user_id, email=f"coupon{i}@example.com", name="사용자", password_hash="x", phone="010-0000-0000"))
+            db.add_all(models.UserCoupon(id=str(uuid4()), user_id=user_id, coupon_id=coupon.id) for coupon in coupons)
+        db.commit()
+        
+        cursors = {}
+        monkeypatch.setattr(notification_tasks, "_get_fanout_cursor", cursors.get)
+        monkeypatch.setattr(notification_tasks, "_set_fanout_cursor", cursors.__setitem__)
+        monkeypatch.setattr("backend.core.database.SessionLocal", sessionmaker(bind=db.get_bind()))
+        monkeypatch.setattr(service.get_settings(), "notification_fanout_batch_size", 2)
+        
+        create_bulk = service.create_notifications_bulk
+        calls = []
+        
+        def failing_second_batch(*args, **kwargs):
+            calls.append(args)
+            if len(calls) == 2:
+                raise ConnectionError("db down")
+            return create_bulk(*args, **kwargs)
+        
+        monkeypatch.setattr(service, "create_notifications_bulk", failing_second_batch)
+        with pytest.raises(ConnectionError):
+            notification_tasks.notify_expiring_coupons(days_left=3)
+        assert db.query(models.Notification).count() == 2
+        
+        assert notification_tasks.notify_expiring_coupons(days_left=3) == {"success": True, "coupons": 1, "sent": 3}
+        assert notification_tasks.notify_expiring_coupons(days_left=3)["sent"] == 0
+        assert db.query(models.Notification).count() == 5
@@ -1,4 +1,7 @@
 """주문 API 테스트"""
+from datetime import datetime, timedelta
+from uuid import uuid4
+
 import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy.orm import Session
@@ -116,6 +119,29 @@ class TestCreateOrder:
         response = client.post("/orders", json=order_data)
         
         assert response.status_code == 400
+    
+    def test_create_order_invalid_idempotency_key(self, authenticated_client: tuple):
+        """형식이 잘못된 Idempotency-Key는 주문을 만들지 않고 422 반환"""
+        client, user = authenticated_client
+        
+        order_data = {
+            "items": [],
+            "shippingAddress": {
+                "recipientName": "홍길동",
+                "phone": "010-1234-5678",
+                "postalCode": "12345",
+                "address": "서울시 강남구",
+                "addressDetail": "",
+                "deliveryMessage": "",
+            },
+            "paymentMethod": "card",
+            "discountAmount": 0,
+        }
+        
+        response = client.post("/orders", json=order_data, headers={"Idempotency-Key": "bad key!"})
+        
+        assert response.status_code == 422
+        assert response.json()["code"] == "validation_error"
 
 
 class TestCancelOrder:
@@ -168,3 +194,234 @@ class TestCancelOrder:
         db.refresh(product_with_stock)
         assert product_with_stock.stock_quantity == 10
 
+    def test_cancel_order_restores_points_and_coupon(
+        self,
+        authenticated_client: tuple,
+        db: Session,
+        product_with_stock: models.Product,
+    ):
+        """주문 취소 시 사용한 포인트와 쿠폰 반환"""
+        client, user = authenticated_client
+
+        now = datetime.utcnow()
+        coupon = models.Coupon(
+            id=str(uuid4()),
+            code="CANCEL1",
+            name="취소 테스트",
+            discount_type="fixed_amount",
+            discount_value=1000,
+            min_purchase_amount=0,
+            valid_from=now - timedelta(days=1),
+            valid_until=now + timedelta(days=1),
+            usage_limit=1,
+            usage_count=0,
+            is_active=True,
+        )
+        user_coupon = models.UserCoupon(
+            id=str(uuid4()),
+            user_id=user["id"],
+            coupon_id=coupon.id,
+            is_used=False,
+        )
+        db.add_all([coupon, user_coupon])
+        db.query(models.User).filter(models.User.id == user["id"]).update({"points": 3000})
+        db.commit()
+
+        response = client.post("/orders", json={
+            "items": [
+                {"productId": product_with_stock.id, "quantity": 1, "color": "Black", "size": "M"}
+            ],
+            "shippingAddress": {
+                "recipientName": "홍길동",
+                "phone": "010-1234-5678",
+                "postalCode": "12345",
+                "address": "서울시 강남구",
+            },
+            "paymentMethod": "card",
+            "userCouponId": user_coupon.id,
+            "usePoints": 2000,
+        })
+        assert response.status_code == 200
+        order_id = response.json()["orderId"]
+
+        db.expire_all()
+        assert db.get(models.User, user["id"]).points == 1000
+        assert db.get(models.UserCoupon, user_coupon.id).is_used is True
+
+        response = client.put(f"/orders/{order_id}/cancel", json={"reason": "단순 변심"})
+        assert response.status_code == 200
+
+        db.expire_all()
+        assert db.get(models.User, user["id"]).points == 3000
+        restored = db.get(models.UserCoupon, user_coupon.id)
+        assert restored.is_used is False
+        assert restored.order_id is None
+        assert db.get(models.Coupon, coupon.id).usage_count == 0
+
+    def test_cancel_order_query_count_independent_of_items(
+        self,
+        authenticated_client: tuple,
+        db: Session,
+        test_product_data: dict,
+        assert_max_queries,
+    ):
+        """주문 아이템 수와 관계없이 취소 쿼리 수 일정 (N+1 방지)"""
+        client, user = authenticated_client
+        
+        products = [
+            models.Product(**{**test_product_data, "name": f"상품 {i}", "stock_quantity": 10})
+            for i in range(3)
+        ]
+        db.add_all(products)
+        db.commit()
+        
+        def create_order(items: list) -> str:
+            response = client.post("/orders", json={
+                "items": [
+                    {"productId": product.id, "quantity": 1, "color": "Black", "size": "M"}
+                    for product in items
+                ],
+                "shippingAddress": {
+                    "recipientName": "홍길동",
+                    "phone": "010-1234-5678",
+                    "postalCode": "12345",
+                    "address": "서울시 강남구",
+                },
+                "paymentMethod": "card",
+            })
+            return response.json()["orderId"]
+        
+        single_order_id = create_order(products[:1])
+        multi_order_id = create_order(products)
+        
+        with assert_max_queries(100) as single:
+            client.put(f"/orders/{single_order_id}/cancel", json={"reason": "단순 변심"})
+        with assert_max_queries(single.count) as multi:
+            client.put(f"/orders/{multi_order_id}/cancel", json={"reason": "단순 변심"})
+        
+        assert multi.count == single.count
+
+
+class TestOrderTracking:
+    """배송 추적 테스트"""
+    
+    def test_tracking_not_registered(
+        self,
+        authenticated_client: tuple,
+        product_with_stock: models.Product,
+    ):
+        """송장 등록 전 배송 추적 시 404 반환"""
+        client, user = authenticated_client
+        
+        order_data = {
+            "items": [
+                {
+                    "productId": product_with_stock.id,
+                    "quantity": 1,
+                    "color": "Black",
+                    "size": "M",
+                }
+            ],
+            "shippingAddress": {
+                "recipientName": "홍길동",
+                "phone": "010-1234-5678",
+                "postalCode": "12345",
+                "address": "서울시 강남구",
+            },
+            "paymentMethod": "card",
+        }
+        
+        response = client.post("/orders", json=order_data)
+        order_id = response.json()["orderId"]
+        
+        response = client.get(f"/orders/{order_id}/tracking")
+        assert response.status_code == 404
+    
+    def test_tracking_shipped_order(
+        self,
+        authenticated_client: tuple,
+        db: Session,
+        product_with_stock: models.Product,
+    ):
+        """송장 등록된 주문의 배송 추적 조회"""
+        client, user = authenticated_client
+        
+        order_data = {
+            "items": [
+                {
+                    "productId": product_with_stock.id,
+                    "quantity": 1,
+                    "color": "Black",
+                    "size": "M",
+                }
+            ],
+            "shippingAddress": {
+                "recipientName": "홍길동",
+                "phone": "010-1234-5678",
+                "postalCode": "12345",
+                "address": "서울시 강남구",
+            },
+            "paymentMethod": "card",
+        }
+        
+        response = client.post("/orders", json=order_data)
+        order_id = response.json()["orderId"]
+        
+        order = db.query(models.Order).filter(models.Order.id == order_id).first()
+        order.status = "shipped"
+        order.courier = "cj"
+        order.tracking_number = "123456789012"
+        db.commit()
+        
+        response = client.get(f"/orders/{order_id}/tracking")
+        assert response.status_code == 200
+        data = response.json()
+        assert data["courier"] == "cj"
+        assert data["tracking_number"] == "123456789012"
+
+
+class TestOrderHistory:
+    """주문 내역 (커서 기반) 테스트"""
+
+    def test_history_pages_with_cursor_and_summary(
+        self,
+        authenticated_client: tuple,
+        product_with_stock: models.Product,
+    ):
+        """커서로 모든 주문을 중복 없이 조회하고 상태별 건수 반영"""
+        client, user = authenticated_client
+
+        order_ids = []
+        for _ in range(3):
+            response = client.post("/orders", json={
+                "items": [
+                    {"productId": product_with_stock.id, "quantity": 1, "color": "Black", "size": "M"}
+                ],
+                "shippingAddress": {
+                    "recipientName": "홍길동",
+                    "phone": "010-1234-5678",
+                    "postalCode": "12345",
+                    "address": "서울시 강남구",
+                },
+                "paymentMethod": "card",
+            })
+            order_ids.append(response.json()["orderId"])
+        client.put(f"/orders/{order_ids[0]}/cancel", json={"reason": "단순 변심"})
+
+        first = client.get("/orders/history", params={"limit": 2}).json()
+        second = client.get("/orders/history", params={"limit": 2, "cursor": first["nextCursor"]}).json()
+
+        assert [o["id"] for o in first["orders"] + second["orders"]] == order_ids[::-1]
+        assert second["nextCursor"] is None
+
+        summary = client.get("/orders/summary").json()
+        assert summary["pending"] == 2
+        assert summary["cancelled"] == 1
+
+    def test_history_rejects_tampered_cursor(self, authenticated_client: tuple):
+        """형식이 잘못된 커서는 400 반환"""
+        client, _ = authenticated_client
+
+        for cursor in ("garbage", "2026-10-19T10:00:00|not-a-uuid", "not-a-date|01a153a2-e1f0-72c6-a71b-6fb89c54702c"):
+            response = client.get("/orders/history", params={"cursor": cursor})
+            assert response.status_code == 400
@@ -110,3 +110,43 @@ class TestGetProduct:
         
         assert product.view_count == initial_view_count + 1
 
+
+
+class TestRequestId:
+    """요청 ID 헤더 테스트"""
+    
+    def test_request_id_generated(self, client: TestClient):
+        """요청 ID가 없으면 새로 발급"""
+        response = client.get("/products")
+        
+        assert len(response.headers["X-Request-Id"]) == 32
+    
+    def test_request_id_propagated(self, client: TestClient):
+        """클라이언트가 보낸 요청 ID 유지"""
+        response = client.get("/products", headers={"X-Request-Id": "trace-abc-123"})
+        
+        assert response.headers["X-Request-Id"] == "trace-abc-123"
+    
+    def test_invalid_request_id_replaced(self, client: TestClient):
+        """허용되지 않는 형식의 요청 ID는 새로 발급"""
+        response = client.get("/products", headers={"X-Request-Id": "bad id; injected"})
+        
+        assert response.headers["X-Request-Id"] != "bad id; injected"
+
+
+class TestMetrics:
+    """메트릭 엔드포인트 테스트"""
+    
+    def test_metrics_use_route_template(self, client: TestClient, db: Session, test_product_data: dict):
+        """상품 ID가 아닌 라우트 템플릿으로 집계"""
+        product = models.Product(**test_product_data)
+        db.add(product)
+        db.commit()
+        
+        client.get(f"/products/{product.id}")
+        response = client.get("/metrics")
+        
+        assert response.status_code == 200
+        assert 'route="/products/{product_id}"' in response.text
+        assert str(product.id) not in response.text
+        assert "db_queries_per_request" in response.text
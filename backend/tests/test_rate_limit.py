@@ -0,0 +1,279 @@
+"""Rate Limit 엔진 테스트"""
+import random
+
+import pytest
+from fastapi.testclient import TestClient
+
+from backend.core import rate_limit_engine
+from backend.core.rate_limit import get_limit
+from backend.core.rate_limit_engine import (
+    LocalDenyCache,
+    LocalTokenBucket,
+    MemorySlidingWindow,
+    RateLimitResult,
+    RatePolicy,
+    SlidingWindowLimiter,
+)
+
+
+class FakeClock:
+    """rate_limit_engine.time 대체 (monotonic 시각을 직접 조정)"""
+
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch) -> FakeClock:
+    clock = FakeClock()
+    monkeypatch.setattr(rate_limit_engine, "time", clock)
+    return clock
+
+
+class TestParseRate:
+    """제한 문자열 파싱 테스트"""
+
+    def test_parse_rate(self):
+        """단위/배수/복수형 처리"""
+        assert rate_limit_engine.parse_rate("5/minute") == RatePolicy(limit=5, window=60)
+        assert rate_limit_engine.parse_rate("10/5 seconds") == RatePolicy(limit=10, window=5)
+        assert rate_limit_engine.parse_rate("100 / hour") == RatePolicy(limit=100, window=3600)
+
+    def test_parse_invalid_rate(self):
+        """잘못된 형식은 오류"""
+        with pytest.raises(ValueError):
+            rate_limit_engine.parse_rate("5 per minute")
+
+    def test_lease_size(self):
+        """작은 제한은 임대하지 않고, 큰 제한은 1/10씩 임대"""
+        assert RatePolicy(limit=5, window=60).lease_size == 1
+        assert RatePolicy(limit=200, window=60).lease_size == 20
+
+
+class TestLocalTokenBucket:
+    """로컬 임대 토큰 버킷 테스트"""
+
+    def test_take_until_empty(self, clock: FakeClock):
+        """임대한 토큰 수만큼만 소비"""
+        bucket = LocalTokenBucket()
+        bucket.put("key", 2, ttl=60)
+
+        assert bucket.take("key") is True
+        assert bucket.take("key") is True
+        assert bucket.take("key") is False
+        assert bucket.take("other") is False
+
+    def test_tokens_expire_with_window(self, clock: FakeClock):
+        """임대 토큰은 윈도우가 지나면 사용할 수 없음"""
+        bucket = LocalTokenBucket()
+        bucket.put("key", 5, ttl=60)
+        assert bucket.take("key") is True
+
+        clock.now += 60
+        assert bucket.take("key") is False
+
+    def test_put_ignores_empty_lease_and_evicts_oldest(self, clock: FakeClock):
+        """빈 임대는 저장하지 않고, 최대 키 수를 넘으면 오래된 키부터 제거"""
+        bucket = LocalTokenBucket(max_keys=2)
+        bucket.put("empty", 0, ttl=60)
+        bucket.put("a", 1, ttl=60)
+        bucket.put("b", 1, ttl=60)
+        bucket.put("c", 1, ttl=60)
+
+        assert bucket.take("empty") is False
+        assert bucket.take("a") is False
+        assert bucket.take("b") is True
+        assert bucket.take("c") is True
+
+
+class TestLocalDenyCache:
+    """로컬 거부 캐시 테스트"""
+
+    def test_denies_until_deadline(self, clock: FakeClock):
+        """재시도 가능 시각 전까지 남은 시간과 함께 거부"""
+        cache = LocalDenyCache()
+        cache.put("key", clock.now + 30)
+
+        result = cache.check("key")
+        assert result.allowed is False
+        assert result.retry_after == pytest.approx(30)
+
+        clock.now += 30
+        assert cache.check("key") is None
+
+    def test_ignores_past_deadline(self, clock: FakeClock):
+        """이미 지난 시각은 저장하지 않음"""
+        cache = LocalDenyCache()
+        cache.put("key", clock.now)
+
+        assert cache.check("key") is None
+
+
+class TestMemorySlidingWindow:
+    """메모리 sliding-window-log 테스트"""
+
+    def test_deny_with_retry_after(self, clock: FakeClock):
+        """제한 초과 시 가장 오래된 요청이 만료될 때까지의 시간 반환"""
+        window = MemorySlidingWindow()
+        policy = RatePolicy(limit=2, window=10)
+
+        assert window.hit("key", policy) == RateLimitResult(True, 0.0, 1)
+        clock.now += 3
+        assert window.hit("key", policy) == RateLimitResult(True, 0.0, 0)
+        clock.now += 1
+
+        result = window.hit("key", policy)
+        assert result.allowed is False
+        assert result.retry_after == pytest.approx(6)
+        assert result.remaining == 0
+
+    def test_allows_again_after_window_slides(self, clock: FakeClock):
+        """윈도우 경계가 아니라 가장 오래된 요청 만료 시점부터 다시 허용"""
+        window = MemorySlidingWindow()
+        policy = RatePolicy(limit=2, window=10)
+        window.hit("key", policy)
+        clock.now += 3
+        window.hit("key", policy)
+
+        clock.now += 7
+        assert window.hit("key", policy).allowed is True
+        assert window.hit("key", policy).allowed is False
+
+    def test_get_retry_after_rounds_up(self):
+        """Retry-After는 1초 이상 정수로 올림"""
+        assert rate_limit_engine.get_retry_after(RateLimitResult(True)) is None
+        assert rate_limit_engine.get_retry_after(RateLimitResult(False, 5.2)) == 6
+        assert rate_limit_engine.get_retry_after(RateLimitResult(False, 0.0)) == 1
+
+
+class TestSlidingWindowLimiter:
+    """Redis + 로컬 임대 Rate Limiter 테스트"""
+
+    def test_lease_serves_requests_locally(self, clock: FakeClock, monkeypatch):
+        """큰 제한은 임대 단위로 Redis에 기록하고 나머지는 로컬에서 소비"""
+        limiter = SlidingWindowLimiter()
+        policy = RatePolicy(limit=100, window=60)
+        calls = []
+
+        def fake_hit_redis(key, policy, quantity):
+            calls.append(quantity)
+            return RateLimitResult(True, 0.0, policy.limit - sum(calls))
+
+        monkeypatch.setattr(limiter, "_hit_redis", fake_hit_redis)
+
+        for _ in range(policy.lease_size + 1):
+            assert limiter.hit("key", policy).allowed is True
+
+        assert calls == [policy.lease_size, policy.lease_size]
+
+    def test_short_lease_falls_back_to_single_request(self, clock: FakeClock, monkeypatch):
+        """임대할 여유가 없으면 요청 1건만 기록"""
+        limiter = SlidingWindowLimiter()
+        policy = RatePolicy(limit=100, window=60)
+        calls = []
+
+        def fake_hit_redis(key, policy, quantity):
+            calls.append(quantity)
+            return RateLimitResult(quantity == 1, 0.0 if quantity == 1 else 1.5, 3)
+
+        monkeypatch.setattr(limiter, "_hit_redis", fake_hit_redis)
+
+        assert limiter.hit("key", policy).allowed is True
+        assert calls == [policy.lease_size, 1]
+        assert limiter.local.take(f"{rate_limit_engine.KEY_PREFIX}:key") is False
+
+    def test_memory_fallback_when_redis_fails(self, clock: FakeClock, monkeypatch):
+        """Redis 오류 시 메모리 로그로 제한하고, 재시도 간격 동안 Redis를 호출하지 않음"""
+        limiter = SlidingWindowLimiter()
+        policy = RatePolicy(limit=2, window=60)
+        calls = []
+
+        def failing_hit_redis(key, policy, quantity):
+            calls.append(quantity)
+            raise ConnectionError("redis down")
+
+        monkeypatch.setattr(limiter, "_hit_redis", failing_hit_redis)
+
+        assert limiter.hit("key", policy).allowed is True
+        assert limiter.hit("key", policy).allowed is True
+        result = limiter.hit("key", policy)
+        assert result.allowed is False
+        assert result.retry_after == pytest.approx(60)
+        assert calls == [1]
+
+        # 재시도 간격이 지나면 다시 Redis 시도
+        clock.now += rate_limit_engine.REDIS_RETRY_INTERVAL
+        limiter.hit("other", policy)
+        assert calls == [1, 1]
+
+
+    def test_denied_key_skips_redis_until_retry(self, clock: FakeClock, monkeypatch):
+        """작은 제한에서 Redis가 거부하면 재시도 가능 시각까지 Redis를 호출하지 않음"""
+        limiter = SlidingWindowLimiter()
+        policy = RatePolicy(limit=2, window=60)
+        redis = MemorySlidingWindow()  # Lua 스크립트와 같은 판정
+        calls = []
+
+        def fake_hit_redis(key, policy, quantity):
+            calls.append(quantity)
+            return redis.hit(key, policy, quantity)
+
+        monkeypatch.setattr(limiter, "_hit_redis", fake_hit_redis)
+
+        assert limiter.hit("key", policy).allowed is True
+        clock.now += 10
+        assert limiter.hit("key", policy).allowed is True
+        clock.now += 10
+        for _ in range(20):
+            result = limiter.hit("key", policy)
+            assert result.allowed is False
+            assert result.retry_after == pytest.approx(40)
+        assert len(calls) == 3
+
+        clock.now += 40
+        assert limiter.hit("key", policy).allowed is True
+        assert len(calls) == 4
+
+    def test_deny_cache_matches_redis_decisions(self, clock: FakeClock, monkeypatch):
+        """로컬 거부 캐시를 거쳐도 매 요청의 판정은 Redis만 사용할 때와 같음"""
+        rng = random.Random(42)
+        policy = RatePolicy(limit=5, window=60)
+        limiter = SlidingWindowLimiter()
+        redis = MemorySlidingWindow()
+        reference = MemorySlidingWindow()
+        monkeypatch.setattr(limiter, "_hit_redis", lambda key, policy, quantity: redis.hit(key, policy, quantity))
+
+        for _ in range(500):
+            clock.now += rng.choice([0, 0.5, 1, 5, 20])
+            key = rng.choice(["a", "b"])
+            expected = reference.hit(f"{rate_limit_engine.KEY_PREFIX}:{key}", policy)
+            assert limiter.hit(key, policy).allowed is expected.allowed
+
+
+class TestRateLimitDependency:
+    """rate_limit() 라우트 의존성 테스트"""
+
+    def test_exceeded_returns_429_with_retry_after(self, client: TestClient, monkeypatch):
+        """제한 초과 시 429와 Retry-After 헤더 반환"""
+        limiter = SlidingWindowLimiter()
+
+        def failing_hit_redis(key, policy, quantity):
+            raise ConnectionError("redis down")
+
+        monkeypatch.setattr(limiter, "_hit_redis", failing_hit_redis)
+        monkeypatch.setattr(rate_limit_engine, "sliding_window_limiter", limiter)
+
+        credentials = {"email": "nobody@example.com", "password": "wrong-password"}
+        limit = rate_limit_engine.get_policy(get_limit("auth_login")).limit
+        for _ in range(limit):
+            assert client.post("/auth/login", json=credentials).status_code == 401
+
+        response = client.post("/auth/login", json=credentials)
+
+        assert response.status_code == 429
+        retry_after = int(response.headers["Retry-After"])
+        assert 1 <= retry_after <= 60
+        assert response.json()["retry_after"] == retry_after
@@ -0,0 +1,92 @@
+"""업로드 파일 테스트"""
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+from sqlalchemy.orm import Session, sessionmaker
+
+from backend.core import models
+from backend.tasks import upload_tasks
+from backend.uploads import service
+
+
+def _uploaded_file(content_hash: str, uploaded_at: datetime) -> models.UploadedFile:
+    return models.UploadedFile(
+        id=str(uuid4()),
+        bucket="images",
+        file_path=service.content_file_path(content_hash, ".png"),
+        url=f"https://example.com/{content_hash}.png",
+        content_type="image/png",
+        size=100,
+        content_hash=content_hash,
+        variants=[],
+        created_at=uploaded_at,
+        last_uploaded_at=uploaded_at,
+    )
+
+
+class TestOrphanedUploadCleanup:
+    """미참조 업로드 정리 테스트"""
+
+    def test_duplicate_upload_protects_old_file_from_cleanup(self, db: Session, monkeypatch):
+        """중복 업로드로 재사용된 오래된 파일은 정리 대상에서 제외"""
+        two_days_ago = datetime.utcnow() - timedelta(days=2)
+        reused = _uploaded_file("a" * 64, two_days_ago)
+        stale = _uploaded_file("b" * 64, two_days_ago)
+        db.add_all([reused, stale])
+        db.commit()
+        reused_id, stale_id, stale_path = reused.id, stale.id, stale.file_path
+
+        # 같은 내용을 다시 업로드 (기존 매니페스트 반환)
+        manifest = service.reuse_upload(db, "images", reused.content_hash)
+        assert manifest["url"] == reused.url
+
+        deleted_paths = []
+
+        async def fake_delete(bucket, paths):
+            deleted_paths.extend(paths)
+            return True
+
+        monkeypatch.setattr("backend.core.database.SessionLocal", sessionmaker(bind=db.get_bind()))
+        monkeypatch.setattr("backend.uploads.storage.delete_from_supabase", fake_delete)
+        monkeypatch.setattr(upload_tasks, "_collect_block_urls", lambda db: set())
+        monkeypatch.setattr(upload_tasks, "_find_referenced_urls", lambda db, urls: set())
+
+        result = upload_tasks.cleanup_orphaned_uploads(min_age_hours=24)
+
+        assert result["deleted"] == 1
+        assert deleted_paths == [stale_path]
+        db.expire_all()
+        assert db.get(models.UploadedFile, reused_id) is not None
+        assert db.get(models.UploadedFile, stale_id) is None
+
+    def test_reupload_during_cleanup_keeps_file(self, db: Session, monkeypatch):
+        """조회 후 삭제 전에 다시 업로드된 파일은 행과 Storage 객체 모두 유지"""
+        two_days_ago = datetime.utcnow() - timedelta(days=2)
+        reused = _uploaded_file("c" * 64, two_days_ago)
+        stale = _uploaded_file("d" * 64, two_days_ago)
+        db.add_all([reused, stale])
+        db.commit()
+        reused_id, stale_path = reused.id, stale.file_path
+
+        def reupload_while_checking(task_db, urls):
+            # 참조 확인 중 같은 내용이 다시 업로드됨
+            service.reuse_upload(db, "images", "c" * 64)
+            return set()
+
+        deleted_paths = []
+
+        async def fake_delete(bucket, paths):
+            deleted_paths.extend(paths)
+            return True
+
+        monkeypatch.setattr("backend.core.database.SessionLocal", sessionmaker(bind=db.get_bind()))
+        monkeypatch.setattr("backend.uploads.storage.delete_from_supabase", fake_delete)
+        monkeypatch.setattr(upload_tasks, "_collect_block_urls", lambda db: set())
+        monkeypatch.setattr(upload_tasks, "_find_referenced_urls", reupload_while_checking)
+
+        result = upload_tasks.cleanup_orphaned_uploads(min_age_hours=24)
+
+        assert result == {"scanned": 2, "deleted": 1}
+        assert deleted_paths == [stale_path]
+        db.expire_all()
+        assert db.get(models.UploadedFile, reused_id) is not None
@@ -0,0 +1,161 @@
+"""이미지 파생본(variant) 생성 파이프라인
+
+원본 이미지를 한 번만 디코딩하여 목록 썸네일/상세/확대용 크기로
+리사이즈하고 WebP/AVIF 포맷으로 인코딩합니다.
+CPU 작업은 프로세스 풀에서 실행되어 이벤트 루프를 막지 않습니다.
+원본은 바이트가 아닌 임시 파일 경로로 전달하므로 API 프로세스가 원본 전체를
+메모리에 올리지 않고, 워커 프로세스가 파일에서 직접 읽습니다.
+"""
+import asyncio
+import io
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, TypedDict
+
+from backend.core.config import get_settings
+from backend.core.logger import get_logger
+
+logger = get_logger(__name__)
+settings = get_settings()
+
+# 파생본 크기 (이름 -> 최대 너비 px)
+VARIANT_WIDTHS = {
+    "thumbnail": 320,   # 상품 목록
+    "detail": 960,      # 상품 상세
+    "zoom": 1600,       # 확대 보기
+}
+
+# 출력 포맷별 인코딩 옵션 (브라우저 선호 순서)
+VARIANT_FORMATS = {
+    "avif": {"quality": 50},
+    "webp": {"quality": 80, "method": 4},
+}
+
+FORMAT_MIME_TYPES = {
+    "avif": "image/avif",
+    "webp": "image/webp",
+}
+
+# 파생본을 만들지 않는 원본 타입 (애니메이션 보존)
+SKIP_MIME_TYPES = {"image/gif"}
+
+_executor: Optional[ProcessPoolExecutor] = None
+
+
+class RenderedVariant(TypedDict):
+    name: str
+    format: str
+    width: int
+    height: int
+    content: bytes
+
+
+def is_pipeline_available() -> bool:
+    """Pillow 설치 여부 확인"""
+    try:
+        import PIL  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+def _supported_formats() -> List[str]:
+    from PIL import features
+
+    supported = []
+    for fmt in VARIANT_FORMATS:
+        try:
+            if features.check(fmt):
+                supported.append(fmt)
+        except ValueError:
+            # 구버전 Pillow는 avif 기능 키를 모름
+            continue
+    return supported
+
+
+def render_variants(source_path: str) -> List[RenderedVariant]:
+    """원본 파일을 한 번 디코딩하여 모든 파생본 생성 (프로세스 풀에서 실행)
+
+    원본보다 큰 크기로 확대하지 않으며, 같은 너비가 되는 크기는 한 번만 생성합니다.
+    """
+    from PIL import Image, ImageOps
+
+    with Image.open(source_path) as opened:
+        image = ImageOps.exif_transpose(opened)
+        image.load()
+
+    if image.mode not in ("RGB", "RGBA"):
+        has_alpha = "A" in image.getbands() or "transparency" in image.info
+        image = image.convert("RGBA" if has_alpha else "RGB")
+
+    formats = _supported_formats()
+    variants: List[RenderedVariant] = []
+    rendered_widths = set()
+
+    # 큰 크기부터 축소하여 다음 단계 리사이즈 비용을 줄임
+    source = image
+    for name, max_width in sorted(VARIANT_WIDTHS.items(), key=lambda item: -item[1]):
+        width = min(max_width, image.width)
+        if width in rendered_widths:
+            continue
+        rendered_widths.add(width)
+
+        height = max(round(image.height * width / image.width), 1)
+        resized = source.resize((width, height), Image.Resampling.LANCZOS) if width != source.width else source
+        source = resized
+
+        for fmt in formats:
+            buffer = io.BytesIO()
+            resized.save(buffer, format=fmt.upper(), **VARIANT_FORMATS[fmt])
+            variants.append(
+                RenderedVariant(
+                    name=name,
+                    format=fmt,
+                    width=width,
+                    height=height,
+                    content=buffer.getvalue(),
+                )
+            )
+
+    return variants
+
+
+def _get_executor() -> ProcessPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ProcessPoolExecutor(max_workers=settings.image_workers)
+    return _executor
+
+
+async def generate_variants(source_path: str, content_type: str) -> List[RenderedVariant]:
+    """프로세스 풀에서 파생본 생성
+
+    Pillow가 없거나 파생본 대상이 아닌 타입이면 빈 목록을 반환합니다.
+    """
+    if content_type in SKIP_MIME_TYPES:
+        return []
+    if not is_pipeline_available():
+        logger.warning("Pillow not installed, image variants disabled")
+        return []
+
+    loop = asyncio.get_running_loop()
+    try:
+        return await loop.run_in_executor(_get_executor(), render_variants, source_path)
+    except Exception as e:
+        logger.error("Image variant generation failed: %s", str(e))
+        return []
+
+
+def variant_file_path(file_path: str, name: str, fmt: str) -> str:
+    """원본 경로에서 파생본 경로 생성 (uploads/{user}/{stem}/{name}.{fmt})"""
+    stem = os.path.splitext(file_path)[0]
+    return f"{stem}/{name}.{fmt}"
+
+
+def build_srcset(variants: List[dict]) -> dict:
+    """포맷별 srcset 문자열 생성 ({"webp": "url 320w, url 960w", ...})"""
+    srcset: dict = {}
+    for variant in sorted(variants, key=lambda v: v["width"]):
+        entry = f"{variant['url']} {variant['width']}w"
+        srcset[variant["format"]] = f"{srcset[variant['format']]}, {entry}" if variant["format"] in srcset else entry
+    return srcset
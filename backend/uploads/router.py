@@ -1,17 +1,30 @@
+import asyncio
 import os
 import re
-import uuid
-from datetime import datetime
-from typing import Optional
+import tempfile
+from typing import Dict, List, Optional
 
-from fastapi import APIRouter, Depends, File, UploadFile, HTTPException
-from pydantic import BaseModel
-import httpx
+from fastapi import APIRouter, Depends, File, Query, UploadFile, HTTPException
+from fastapi.concurrency import run_in_threadpool
+from pydantic import BaseModel, Field
+from sqlalchemy.orm import Session
 
 from backend.core.config import get_settings
+from backend.core.database import get_db
+from backend.core.rate_limit import rate_limit
 from backend.core.security import get_current_user_id
 from backend.core.logger import get_logger
 
+from . import service
+from .images import FORMAT_MIME_TYPES, build_srcset, generate_variants, variant_file_path
+from .storage import (
+    RESUMABLE_THRESHOLD,
+    UploadStream,
+    resumable_upload_to_supabase,
+    stream_to_supabase,
+    upload_to_supabase,
+)
+
 logger = get_logger(__name__)
 settings = get_settings()
 
@@ -59,12 +72,28 @@ MIME_TO_EXTENSION = {
 IMAGE_BUCKET = "content/images"
 VIDEO_BUCKET = "content/videos"
 
+# 파일 크기 제한
+MAX_IMAGE_SIZE = 10 * 1024 * 1024  # 10MB
+MAX_VIDEO_SIZE = 100 * 1024 * 1024  # 100MB
+
+
+class ImageVariant(BaseModel):
+    name: str  # thumbnail, detail, zoom
+    format: str  # avif, webp
+    width: int
+    height: int
+    url: str
+    size: int
+
 
 class UploadResponse(BaseModel):
     url: str
     filename: str
     content_type: str
     size: int
+    variants: List[ImageVariant] = Field(default_factory=list)
+    # 포맷별 srcset 문자열 ({"webp": "https://... 320w, https://... 960w"})
+    srcset: Dict[str, str] = Field(default_factory=dict)
 
 
 def get_file_extension(filename: str) -> str:
@@ -131,58 +160,88 @@ def validate_file_content(content: bytes, extension: str, is_video: bool = False
     return True, detected_type
 
 
-async def upload_to_supabase(
-    bucket: str,
-    file_path: str,
-    content: bytes,
-    content_type: str
-) -> str:
-    """Supabase Storage에 파일 업로드"""
-    if not settings.supabase_url or not settings.supabase_service_key:
-        raise HTTPException(
-            status_code=500,
-            detail="Supabase Storage가 설정되지 않았습니다. SUPABASE_URL과 SUPABASE_SERVICE_KEY를 설정해주세요."
-        )
+async def validate_stream_head(stream: UploadStream, extension: str, is_video: bool) -> str:
+    """첫 청크만 읽어 크기와 파일 형식 검증 후 감지된 MIME type 반환"""
+    # 멀티파트 파싱 시 크기가 기록되었다면 업로드 전에 거부
+    if stream.declared_size is not None:
+        stream.check_size(stream.declared_size)
     
-    # Supabase Storage API URL
-    storage_url = f"{settings.supabase_url}/storage/v1/object/{bucket}/{file_path}"
+    head = await stream.read_head()
     
-    headers = {
-        "Authorization": f"Bearer {settings.supabase_service_key}",
-        "Content-Type": content_type,
-    }
+    # 최소 크기 검증 (빈 파일 방지)
+    if len(head) < 8:
+        raise HTTPException(status_code=400, detail="유효하지 않은 파일입니다.")
+    
+    # 파일 내용 검증 (매직 바이트로 실제 파일 타입 확인)
+    is_valid, result = validate_file_content(head, extension, is_video=is_video)
+    if not is_valid:
+        raise HTTPException(status_code=400, detail=result)
     
-    async with httpx.AsyncClient() as client:
-        response = await client.post(
-            storage_url,
-            content=content,
-            headers=headers,
+    return result
+
+
+async def store_image_variants(
+    bucket: str,
+    file_path: str,
+    source_path: str,
+    content_type: str,
+) -> List[dict]:
+    """이미지 파생본 생성 후 Storage에 동시 업로드, 매니페스트 반환"""
+    rendered = await generate_variants(source_path, content_type)
+    if not rendered:
+        return []
+    
+    paths = [variant_file_path(file_path, v["name"], v["format"]) for v in rendered]
+    urls = await asyncio.gather(
+        *(
+            upload_to_supabase(bucket, path, v["content"], FORMAT_MIME_TYPES[v["format"]], upsert=True)
+            for path, v in zip(paths, rendered)
         )
-        
-        if response.status_code not in [200, 201]:
-            logger.error(f"Supabase upload failed: {response.status_code} - {response.text}")
-            raise HTTPException(
-                status_code=500,
-                detail=f"파일 업로드에 실패했습니다: {response.text}"
-            )
+    )
     
-    # Public URL 반환
-    public_url = f"{settings.supabase_url}/storage/v1/object/public/{bucket}/{file_path}"
-    return public_url
+    return [
+        {
+            "name": v["name"],
+            "format": v["format"],
+            "width": v["width"],
+            "height": v["height"],
+            "url": url,
+            "size": len(v["content"]),
+        }
+        for v, url in zip(rendered, urls)
+    ]
 
 
-@router.post("/image", response_model=UploadResponse)
+def build_upload_response(manifest: dict) -> UploadResponse:
+    """매니페스트로 업로드 응답 생성"""
+    variants = manifest.get("variants") or []
+    return UploadResponse(
+        url=manifest["url"],
+        filename=os.path.basename(manifest["file_path"]),
+        content_type=manifest["content_type"],
+        size=manifest["size"],
+        variants=[ImageVariant(**v) for v in variants],
+        srcset=build_srcset(variants),
+    )
+
+
+@router.post("/image", response_model=UploadResponse, dependencies=[Depends(rate_limit("upload"))])
 async def upload_image(
     file: UploadFile = File(...),
     user_id: str = Depends(get_current_user_id),
+    db: Session = Depends(get_db),
 ):
     """이미지 파일 업로드 (Supabase Storage)
     
     보안 검증:
     - 파일 확장자 검사
-    - 파일 크기 제한 (10MB)
-    - 파일 내용 시그니처 검증 (매직 바이트)
+    - 파일 크기 제한 (10MB, 스트리밍 중 검사)
+    - 파일 내용 시그니처 검증 (첫 청크의 매직 바이트)
     - 확장자와 파일 내용 일치 검증
+    
+    업로드 후 썸네일/상세/확대용 WebP·AVIF 파생본을 생성하여
+    srcset에 바로 쓸 수 있는 구조로 반환합니다.
+    같은 내용의 이미지가 이미 있으면 업로드 없이 기존 URL을 반환합니다.
     """
     
     # 파일명 sanitization
@@ -196,58 +255,76 @@ async def upload_image(
             detail=f"허용되지 않은 파일 형식입니다. 허용: {', '.join(ALLOWED_IMAGE_EXTENSIONS)}"
         )
     
-    # 파일 읽기
-    content = await file.read()
-    
-    # 파일 크기 확인 (10MB 제한)
-    if len(content) > 10 * 1024 * 1024:
-        raise HTTPException(status_code=400, detail="파일 크기는 10MB를 초과할 수 없습니다.")
-    
-    # 최소 크기 검증 (빈 파일 방지)
-    if len(content) < 8:
-        raise HTTPException(status_code=400, detail="유효하지 않은 파일입니다.")
-    
-    # 파일 내용 검증 (매직 바이트로 실제 파일 타입 확인)
-    is_valid, result = validate_file_content(content, ext, is_video=False)
-    if not is_valid:
-        raise HTTPException(status_code=400, detail=result)
+    stream = UploadStream(file, max_size=MAX_IMAGE_SIZE)
+    detected_mime_type = await validate_stream_head(stream, ext, is_video=False)
     
-    detected_mime_type = result
+    # 같은 내용이 이미 업로드되어 있으면 기존 URL 반환
+    content_hash = await stream.compute_digest()
+    existing = await run_in_threadpool(service.reuse_upload, db, IMAGE_BUCKET, content_hash)
+    if existing:
+        logger.info("Duplicate image upload by user %s: %s", user_id, existing['file_path'])
+        return build_upload_response(existing)
     
-    # 고유 파일명 생성
-    unique_filename = f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:8]}{ext}"
-    file_path = f"uploads/{user_id}/{unique_filename}"
+    # 콘텐츠 주소 기반 경로
+    file_path = service.content_file_path(content_hash, ext)
     
-    # Supabase Storage에 업로드
-    public_url = await upload_to_supabase(
+    # Supabase Storage에 스트리밍 업로드
+    public_url = await stream_to_supabase(
         IMAGE_BUCKET,
         file_path,
-        content,
-        detected_mime_type  # 감지된 MIME type 사용
+        stream,
+        detected_mime_type,  # 감지된 MIME type 사용
+        upsert=True,
     )
     
-    logger.info(f"Image uploaded: {unique_filename} by user {user_id} (type: {detected_mime_type})")
+    # 파생본 생성 (스풀 파일을 경로가 있는 임시 파일로 청크 복사하여 프로세스 풀에 경로만 전달)
+    with tempfile.NamedTemporaryFile(suffix=ext) as source:
+        await run_in_threadpool(stream.copy_to, source)
+        variants = await store_image_variants(
+            IMAGE_BUCKET,
+            file_path,
+            source.name,
+            detected_mime_type,
+        )
     
-    return UploadResponse(
+    manifest = await run_in_threadpool(
+        service.record_upload,
+        db,
+        bucket=IMAGE_BUCKET,
+        file_path=file_path,
         url=public_url,
-        filename=unique_filename,
         content_type=detected_mime_type,
-        size=len(content),
+        size=stream.size,
+        user_id=user_id,
+        content_hash=content_hash,
+        variants=variants,
     )
+    
+    logger.info(
+        f"Image uploaded: {file_path} by user {user_id} "
+        f"(type: {detected_mime_type}, variants: {len(variants)})"
+    )
+    
+    return build_upload_response(manifest)
 
 
-@router.post("/video", response_model=UploadResponse)
+@router.post("/video", response_model=UploadResponse, dependencies=[Depends(rate_limit("upload"))])
 async def upload_video(
     file: UploadFile = File(...),
+    resumable: bool = Query(False, description="재개 가능(TUS) 업로드 강제 사용"),
     user_id: str = Depends(get_current_user_id),
+    db: Session = Depends(get_db),
 ):
     """동영상 파일 업로드 (Supabase Storage)
     
     보안 검증:
     - 파일 확장자 검사
-    - 파일 크기 제한 (100MB)
-    - 파일 내용 시그니처 검증 (매직 바이트)
+    - 파일 크기 제한 (100MB, 스트리밍 중 검사)
+    - 파일 내용 시그니처 검증 (첫 청크의 매직 바이트)
     - 확장자와 파일 내용 일치 검증
+    
+    20MB를 초과하거나 resumable=true이면 TUS 재개 가능 업로드를 사용합니다.
+    같은 내용의 동영상이 이미 있으면 업로드 없이 기존 URL을 반환합니다.
     """
     
     # 파일명 sanitization
@@ -261,41 +338,50 @@ async def upload_video(
             detail=f"허용되지 않은 파일 형식입니다. 허용: {', '.join(ALLOWED_VIDEO_EXTENSIONS)}"
         )
     
-    # 파일 읽기
-    content = await file.read()
-    
-    # 파일 크기 확인 (100MB 제한)
-    if len(content) > 100 * 1024 * 1024:
-        raise HTTPException(status_code=400, detail="파일 크기는 100MB를 초과할 수 없습니다.")
-    
-    # 최소 크기 검증 (빈 파일 방지)
-    if len(content) < 8:
-        raise HTTPException(status_code=400, detail="유효하지 않은 파일입니다.")
-    
-    # 파일 내용 검증 (매직 바이트로 실제 파일 타입 확인)
-    is_valid, result = validate_file_content(content, ext, is_video=True)
-    if not is_valid:
-        raise HTTPException(status_code=400, detail=result)
-    
-    detected_mime_type = result
-    
-    # 고유 파일명 생성
-    unique_filename = f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:8]}{ext}"
-    file_path = f"uploads/{user_id}/{unique_filename}"
-    
-    # Supabase Storage에 업로드
-    public_url = await upload_to_supabase(
-        VIDEO_BUCKET,
-        file_path,
-        content,
-        detected_mime_type  # 감지된 MIME type 사용
-    )
-    
-    logger.info(f"Video uploaded: {unique_filename} by user {user_id} (type: {detected_mime_type})")
+    stream = UploadStream(file, max_size=MAX_VIDEO_SIZE)
+    detected_mime_type = await validate_stream_head(stream, ext, is_video=True)
+    
+    # 같은 내용이 이미 업로드되어 있으면 기존 URL 반환
+    content_hash = await stream.compute_digest()
+    existing = await run_in_threadpool(service.reuse_upload, db, VIDEO_BUCKET, content_hash)
+    if existing:
+        logger.info("Duplicate video upload by user %s: %s", user_id, existing['file_path'])
+        return build_upload_response(existing)
+    
+    # 콘텐츠 주소 기반 경로
+    file_path = service.content_file_path(content_hash, ext)
+    
+    # 대용량 파일은 재개 가능 업로드, 그 외는 스트리밍 업로드
+    declared_size = stream.declared_size
+    if resumable or (declared_size is not None and declared_size > RESUMABLE_THRESHOLD):
+        public_url = await resumable_upload_to_supabase(
+            VIDEO_BUCKET,
+            file_path,
+            stream,
+            detected_mime_type,
+            upsert=True,
+        )
+    else:
+        public_url = await stream_to_supabase(
+            VIDEO_BUCKET,
+            file_path,
+            stream,
+            detected_mime_type,
+            upsert=True,
+        )
     
-    return UploadResponse(
+    manifest = await run_in_threadpool(
+        service.record_upload,
+        db,
+        bucket=VIDEO_BUCKET,
+        file_path=file_path,
         url=public_url,
-        filename=unique_filename,
         content_type=detected_mime_type,
-        size=len(content),
+        size=stream.size,
+        user_id=user_id,
+        content_hash=content_hash,
     )
+    
+    logger.info("Video uploaded: %s by user %s (type: %s)", file_path, user_id, detected_mime_type)
+    
+    return build_upload_response(manifest)
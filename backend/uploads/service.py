@@ -0,0 +1,142 @@
+"""업로드 파일 기록 및 콘텐츠 해시 인덱스
+
+같은 내용의 파일은 SHA-256 해시로 식별하여 Storage에 한 번만 저장합니다.
+해시 -> 매니페스트 조회는 Redis를 먼저 보고, 없으면 DB(uploaded_files)를 조회합니다.
+"""
+from datetime import datetime
+from typing import List, Optional
+
+from sqlalchemy import update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from backend.core import models
+from backend.core.ids import new_id
+from backend.core.logger import get_logger
+from backend.core.redis import cache_delete, cache_get, cache_set
+
+logger = get_logger(__name__)
+
+# 해시 인덱스 캐시 설정
+HASH_INDEX_PREFIX = "upload:hash"
+HASH_INDEX_TTL = 60 * 60 * 24 * 7  # 7일 (DB가 원본이므로 만료돼도 무방)
+
+
+def hash_index_key(bucket: str, content_hash: str) -> str:
+    """해시 인덱스 캐시 키"""
+    return f"{HASH_INDEX_PREFIX}:{bucket}:{content_hash}"
+
+
+def content_file_path(content_hash: str, extension: str) -> str:
+    """콘텐츠 주소 기반 저장 경로 (uploads/{해시 앞 2자리}/{해시}{확장자})"""
+    return f"uploads/{content_hash[:2]}/{content_hash}{extension}"
+
+
+def to_manifest(uploaded: models.UploadedFile) -> dict:
+    """업로드 기록을 캐시/응답용 딕셔너리로 변환"""
+    return {
+        "url": uploaded.url,
+        "file_path": uploaded.file_path,
+        "content_type": uploaded.content_type,
+        "size": uploaded.size,
+        "variants": uploaded.variants or [],
+    }
+
+
+def find_by_hash(db: Session, bucket: str, content_hash: str) -> Optional[dict]:
+    """같은 내용의 기존 업로드 조회 (Redis -> DB 순)"""
+    cached = cache_get(hash_index_key(bucket, content_hash))
+    if cached:
+        return cached
+
+    uploaded = (
+        db.query(models.UploadedFile)
+        .filter(
+            models.UploadedFile.bucket == bucket,
+            models.UploadedFile.content_hash == content_hash,
+        )
+        .first()
+    )
+    if not uploaded:
+        return None
+
+    manifest = to_manifest(uploaded)
+    cache_set(hash_index_key(bucket, content_hash), manifest, HASH_INDEX_TTL)
+    return manifest
+
+
+def touch_upload(db: Session, bucket: str, content_hash: str) -> None:
+    """기존 파일 재사용 시 마지막 업로드 시각 갱신 (미참조 파일 정리 대상에서 제외)"""
+    db.execute(
+        update(models.UploadedFile)
+        .where(
+            models.UploadedFile.bucket == bucket,
+            models.UploadedFile.content_hash == content_hash,
+        )
+        .values(last_uploaded_at=datetime.utcnow())
+    )
+    db.commit()
+
+
+def reuse_upload(db: Session, bucket: str, content_hash: str) -> Optional[dict]:
+    """같은 내용의 기존 업로드가 있으면 마지막 업로드 시각을 갱신하고 매니페스트 반환
+
+    폼 저장 전에 정리 태스크가 기존 파일을 지우지 않도록, 새로 업로드한 것과 같게 취급합니다.
+    """
+    manifest = find_by_hash(db, bucket, content_hash)
+    if manifest is not None:
+        touch_upload(db, bucket, content_hash)
+    return manifest
+
+
+def record_upload(
+    db: Session,
+    bucket: str,
+    file_path: str,
+    url: str,
+    content_type: str,
+    size: int,
+    user_id: str,
+    content_hash: Optional[str] = None,
+    variants: Optional[List[dict]] = None,
+) -> dict:
+    """업로드 파일 및 파생본 매니페스트 저장 후 해시 인덱스 등록
+
+    동시에 같은 파일이 업로드되어 해시 유니크 제약에 걸리면
+    먼저 저장된 기록을 반환합니다 (경로가 같으므로 Storage 객체도 동일).
+    """
+    now = datetime.utcnow()
+    uploaded = models.UploadedFile(
+        id=new_id(),
+        bucket=bucket,
+        file_path=file_path,
+        url=url,
+        content_type=content_type,
+        size=size,
+        content_hash=content_hash,
+        variants=variants or [],
+        uploaded_by=user_id,
+        created_at=now,
+        last_uploaded_at=now,
+    )
+    db.add(uploaded)
+    try:
+        db.commit()
+    except IntegrityError:
+        db.rollback()
+        existing = reuse_upload(db, bucket, content_hash) if content_hash else None
+        if existing is None:
+            raise
+        logger.info("Concurrent duplicate upload resolved: %s", content_hash)
+        return existing
+
+    manifest = to_manifest(uploaded)
+    if content_hash:
+        cache_set(hash_index_key(bucket, content_hash), manifest, HASH_INDEX_TTL)
+    return manifest
+
+
+def forget_upload(uploaded: models.UploadedFile) -> None:
+    """해시 인덱스에서 제거 (GC 후 호출)"""
+    if uploaded.content_hash:
+        cache_delete(hash_index_key(uploaded.bucket, uploaded.content_hash))
@@ -0,0 +1,338 @@
+"""Supabase Storage 업로드 유틸리티
+
+파일 전체를 메모리에 올리지 않고 청크 단위로 Storage에 전달합니다.
+대용량 파일은 TUS 프로토콜 기반 재개 가능(resumable) 업로드를 사용합니다.
+"""
+import base64
+import hashlib
+import shutil
+from typing import AsyncIterator, BinaryIO, List, Optional
+
+import httpx
+from fastapi import HTTPException, UploadFile
+
+from backend.core.config import get_settings
+from backend.core.logger import get_logger
+from backend.core.metrics import instrumented_client
+
+logger = get_logger(__name__)
+settings = get_settings()
+
+# 스트리밍 청크 크기 (업로드당 메모리 사용량 상한)
+CHUNK_SIZE = 1024 * 1024  # 1MB
+
+# 재개 가능 업로드 설정 (Supabase TUS 엔드포인트는 6MB 청크 고정)
+RESUMABLE_CHUNK_SIZE = 6 * 1024 * 1024
+RESUMABLE_THRESHOLD = 20 * 1024 * 1024  # 20MB 초과 시 재개 가능 업로드 사용
+RESUMABLE_MAX_RETRIES = 3
+
+# 스트리밍 업로드는 시간이 걸리므로 기본 타임아웃보다 길게
+STORAGE_TIMEOUT = httpx.Timeout(60.0, connect=10.0)
+
+
+class UploadStream:
+    """UploadFile을 청크 단위로 읽으며 크기 제한을 강제하는 스트림
+
+    첫 청크(head)는 매직 바이트 검증용으로 한 번만 읽어 보관하고,
+    이후 청크는 Storage로 전달하면서 버립니다.
+    """
+
+    def __init__(self, file: UploadFile, max_size: int, chunk_size: int = CHUNK_SIZE):
+        self.file = file
+        self.max_size = max_size
+        self.chunk_size = chunk_size
+        self.size = 0
+        self.content_hash: Optional[str] = None
+        self._head: Optional[bytes] = None
+
+    @property
+    def declared_size(self) -> Optional[int]:
+        """멀티파트 파싱 시 기록된 파일 크기 (알 수 없으면 None)"""
+        return self.file.size
+
+    async def read_head(self) -> bytes:
+        """첫 청크 읽기 (매직 바이트 검증용)"""
+        if self._head is None:
+            await self.file.seek(0)
+            self._head = await self.file.read(self.chunk_size)
+        return self._head
+
+    def check_size(self, size: int) -> None:
+        if size > self.max_size:
+            limit_mb = self.max_size // (1024 * 1024)
+            raise HTTPException(status_code=400, detail=f"파일 크기는 {limit_mb}MB를 초과할 수 없습니다.")
+
+    async def compute_digest(self) -> str:
+        """파일을 청크 단위로 읽으며 SHA-256 계산 (크기 제한도 함께 검사)
+
+        업로드 전에 중복 여부를 판단하기 위해 스풀 파일을 한 번 훑습니다.
+        """
+        if self.content_hash is None:
+            hasher = hashlib.sha256()
+            size = 0
+            await self.file.seek(0)
+            while True:
+                chunk = await self.file.read(self.chunk_size)
+                if not chunk:
+                    break
+                size += len(chunk)
+                self.check_size(size)
+                hasher.update(chunk)
+            self.size = size
+            self.content_hash = hasher.hexdigest()
+        return self.content_hash
+
+    def copy_to(self, target: BinaryIO) -> None:
+        """스풀 파일 내용을 다른 파일로 청크 단위 복사 (블로킹, 스레드 풀에서 호출)"""
+        self.file.file.seek(0)
+        shutil.copyfileobj(self.file.file, target, self.chunk_size)
+        target.flush()
+
+    async def iter_chunks(self) -> AsyncIterator[bytes]:
+        """head부터 파일 끝까지 청크 단위로 반환 (크기 제한 초과 시 중단)"""
+        head = await self.read_head()
+        self.size = len(head)
+        self.check_size(self.size)
+        yield head
+
+        await self.file.seek(len(head))
+
+        while True:
+            chunk = await self.file.read(self.chunk_size)
+            if not chunk:
+                break
+            self.size += len(chunk)
+            self.check_size(self.size)
+            yield chunk
+
+
+def _require_storage_config() -> None:
+    if not settings.supabase_url or not settings.supabase_service_key:
+        raise HTTPException(
+            status_code=500,
+            detail="Supabase Storage가 설정되지 않았습니다. SUPABASE_URL과 SUPABASE_SERVICE_KEY를 설정해주세요."
+        )
+
+
+def _auth_headers(upsert: bool = False) -> dict:
+    headers = {"Authorization": f"Bearer {settings.supabase_service_key}"}
+    if upsert:
+        # 콘텐츠 주소 경로는 내용이 같으므로 덮어써도 안전
+        headers["x-upsert"] = "true"
+    return headers
+
+
+def get_public_url(bucket: str, file_path: str) -> str:
+    """Storage 객체의 Public URL"""
+    return f"{settings.supabase_url}/storage/v1/object/public/{bucket}/{file_path}"
+
+
+async def upload_to_supabase(
+    bucket: str,
+    file_path: str,
+    content: bytes,
+    content_type: str,
+    upsert: bool = False,
+) -> str:
+    """Supabase Storage에 파일 업로드 (메모리에 있는 작은 파일용)"""
+    _require_storage_config()
+
+    # Supabase Storage API URL
+    storage_url = f"{settings.supabase_url}/storage/v1/object/{bucket}/{file_path}"
+
+    headers = {
+        **_auth_headers(upsert),
+        "Content-Type": content_type,
+    }
+
+    async with instrumented_client("supabase_storage") as client:
+        response = await client.post(
+            storage_url,
+            content=content,
+            headers=headers,
+        )
+
+        if response.status_code not in [200, 201]:
+            logger.error("Supabase upload failed: %s - %s", response.status_code, response.text)
+            raise HTTPException(
+                status_code=500,
+                detail=f"파일 업로드에 실패했습니다: {response.text}"
+            )
+
+    return get_public_url(bucket, file_path)
+
+
+async def stream_to_supabase(
+    bucket: str,
+    file_path: str,
+    stream: UploadStream,
+    content_type: str,
+    upsert: bool = False,
+) -> str:
+    """Supabase Storage에 청크 전송 방식(chunked request body)으로 업로드"""
+    _require_storage_config()
+
+    storage_url = f"{settings.supabase_url}/storage/v1/object/{bucket}/{file_path}"
+    headers = {
+        **_auth_headers(upsert),
+        "Content-Type": content_type,
+    }
+
+    async with instrumented_client("supabase_storage", timeout=STORAGE_TIMEOUT) as client:
+        response = await client.post(
+            storage_url,
+            content=stream.iter_chunks(),
+            headers=headers,
+        )
+
+        if response.status_code not in [200, 201]:
+            logger.error("Supabase streaming upload failed: %s - %s", response.status_code, response.text)
+            raise HTTPException(
+                status_code=500,
+                detail=f"파일 업로드에 실패했습니다: {response.text}"
+            )
+
+    return get_public_url(bucket, file_path)
+
+
+def _encode_tus_metadata(metadata: dict) -> str:
+    return ",".join(
+        f"{key} {base64.b64encode(value.encode()).decode()}"
+        for key, value in metadata.items()
+    )
+
+
+async def resumable_upload_to_supabase(
+    bucket: str,
+    file_path: str,
+    stream: UploadStream,
+    content_type: str,
+    upsert: bool = False,
+) -> str:
+    """Supabase Storage에 TUS 프로토콜로 재개 가능 업로드
+
+    청크 전송이 실패하면 서버의 Upload-Offset을 조회해 해당 위치부터 재전송합니다.
+    메모리 사용량은 청크 하나(6MB)로 제한됩니다.
+    """
+    _require_storage_config()
+
+    # "content/images" 형태의 버킷 경로를 버킷명과 객체 prefix로 분리
+    bucket_name, _, prefix = bucket.partition("/")
+    object_name = f"{prefix}/{file_path}" if prefix else file_path
+
+    tus_headers = {
+        **_auth_headers(),
+        "Tus-Resumable": "1.0.0",
+    }
+    create_headers = {
+        **tus_headers,
+        **_auth_headers(upsert),
+        "Upload-Metadata": _encode_tus_metadata({
+            "bucketName": bucket_name,
+            "objectName": object_name,
+            "contentType": content_type,
+        }),
+    }
+
+    total = stream.declared_size
+    if total is not None:
+        stream.check_size(total)
+        create_headers["Upload-Length"] = str(total)
+    else:
+        create_headers["Upload-Defer-Length"] = "1"
+
+    async with instrumented_client("supabase_storage", timeout=STORAGE_TIMEOUT) as client:
+        response = await client.post(
+            f"{settings.supabase_url}/storage/v1/upload/resumable",
+            headers=create_headers,
+        )
+        if response.status_code != 201 or "Location" not in response.headers:
+            logger.error("Supabase resumable upload create failed: %s - %s", response.status_code, response.text)
+            raise HTTPException(
+                status_code=500,
+                detail=f"파일 업로드에 실패했습니다: {response.text}"
+            )
+        upload_url = response.headers["Location"]
+
+        offset = 0
+        retries = 0
+        while True:
+            await stream.file.seek(offset)
+            chunk = await stream.file.read(RESUMABLE_CHUNK_SIZE)
+            stream.check_size(offset + len(chunk))
+            if not chunk and total is not None and offset < total:
+                raise HTTPException(status_code=400, detail="유효하지 않은 파일입니다.")
+
+            if total is not None:
+                is_last = offset + len(chunk) >= total
+            else:
+                is_last = len(chunk) < RESUMABLE_CHUNK_SIZE
+
+            patch_headers = {
+                **tus_headers,
+                "Upload-Offset": str(offset),
+                "Content-Type": "application/offset+octet-stream",
+            }
+            if total is None and is_last:
+                patch_headers["Upload-Length"] = str(offset + len(chunk))
+
+            try:
+                response = await client.patch(upload_url, content=chunk, headers=patch_headers)
+                if response.status_code != 204:
+                    raise httpx.HTTPStatusError(
+                        f"Unexpected status {response.status_code}",
+                        request=response.request,
+                        response=response,
+                    )
+                offset = int(response.headers.get("Upload-Offset", offset + len(chunk)))
+            except httpx.HTTPError as e:
+                retries += 1
+                if retries > RESUMABLE_MAX_RETRIES:
+                    logger.error("Supabase resumable upload failed at offset %s: %s", offset, e)
+                    raise HTTPException(status_code=500, detail="파일 업로드에 실패했습니다.")
+
+                # 서버가 받은 위치부터 재개
+                logger.warning("Resumable upload chunk failed at offset %s, retrying (%s): %s", offset, retries, e)
+                head = await client.head(upload_url, headers=tus_headers)
+                if head.status_code == 200 and "Upload-Offset" in head.headers:
+                    offset = int(head.headers["Upload-Offset"])
+                continue
+
+            if is_last:
+                break
+
+        stream.size = offset
+
+    return get_public_url(bucket, file_path)
+
+
+async def delete_from_supabase(bucket: str, file_paths: List[str]) -> bool:
+    """Supabase Storage 객체 일괄 삭제"""
+    if not file_paths:
+        return True
+    _require_storage_config()
+
+    # "content/images" 형태의 버킷 경로를 버킷명과 객체 prefix로 분리
+    bucket_name, _, prefix = bucket.partition("/")
+    prefixes = [f"{prefix}/{path}" if prefix else path for path in file_paths]
+
+    async with instrumented_client("supabase_storage", timeout=STORAGE_TIMEOUT) as client:
+        response = await client.request(
+            "DELETE",
+            f"{settings.supabase_url}/storage/v1/object/{bucket_name}",
+            json={"prefixes": prefixes},
+            headers=_auth_headers(),
+        )
+
+    if response.status_code != 200:
+        logger.error("Supabase delete failed: %s - %s", response.status_code, response.text)
+        return False
+    return True
+
+
+def path_from_public_url(bucket: str, url: str) -> Optional[str]:
+    """Public URL에서 버킷 내 객체 경로 추출"""
+    marker = f"/storage/v1/object/public/{bucket}/"
+    if marker not in url:
+        return None
+    return url.split(marker, 1)[1]
@@ -0,0 +1,19 @@
+-- 005_add_uploaded_files.sql
+-- 업로드 파일 및 이미지 파생본(썸네일/상세/확대, WebP/AVIF) 매니페스트
+
+CREATE TABLE IF NOT EXISTS uploaded_files (
+    id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+    bucket VARCHAR(100) NOT NULL,
+    file_path TEXT NOT NULL UNIQUE,
+    url TEXT NOT NULL,
+    content_type VARCHAR(100) NOT NULL,
+    size INTEGER NOT NULL,
+    variants JSONB DEFAULT '[]'::jsonb,
+    uploaded_by UUID REFERENCES users(id) ON DELETE SET NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS idx_uploaded_files_url ON uploaded_files(url);
+CREATE INDEX IF NOT EXISTS idx_uploaded_files_uploaded_by ON uploaded_files(uploaded_by);
+
+COMMENT ON COLUMN uploaded_files.variants IS '이미지 파생본 매니페스트 [{name, format, width, height, url, size}]';
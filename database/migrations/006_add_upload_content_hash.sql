@@ -0,0 +1,14 @@
+-- 006_add_upload_content_hash.sql
+-- 콘텐츠 해시 기반 업로드 중복 제거
+
+ALTER TABLE uploaded_files ADD COLUMN IF NOT EXISTS content_hash VARCHAR(64);
+
+-- 같은 버킷 안에서 같은 내용은 한 번만 저장
+CREATE UNIQUE INDEX IF NOT EXISTS idx_uploaded_files_bucket_hash
+    ON uploaded_files(bucket, content_hash)
+    WHERE content_hash IS NOT NULL;
+
+-- 고아 객체 정리 태스크의 생성일 기준 스캔용
+CREATE INDEX IF NOT EXISTS idx_uploaded_files_created_at ON uploaded_files(created_at);
+
+COMMENT ON COLUMN uploaded_files.content_hash IS '파일 내용 SHA256 해시 (중복 업로드 판별)';
@@ -0,0 +1,46 @@
+-- 007_add_audit_logs.sql
+-- 감사 로그 (월 단위 파티션)
+
+CREATE TABLE IF NOT EXISTS audit_logs (
+    id UUID NOT NULL DEFAULT uuid_generate_v4(),
+    action VARCHAR(50) NOT NULL,
+    user_id UUID,
+    resource_type VARCHAR(50),
+    resource_id VARCHAR(100),
+    details JSONB DEFAULT '{}'::jsonb,
+    ip_address VARCHAR(45),
+    user_agent TEXT,
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    -- 파티션 테이블의 PK에는 파티션 키가 포함되어야 함
+    PRIMARY KEY (created_at, id)
+) PARTITION BY RANGE (created_at);
+
+-- 조회 필터용 인덱스 (파티션별로 자동 생성)
+CREATE INDEX IF NOT EXISTS idx_audit_logs_user_created ON audit_logs(user_id, created_at DESC);
+CREATE INDEX IF NOT EXISTS idx_audit_logs_resource_created ON audit_logs(resource_type, resource_id, created_at DESC);
+CREATE INDEX IF NOT EXISTS idx_audit_logs_action_created ON audit_logs(action, created_at DESC);
+
+-- 월 파티션 생성 함수 (celery beat가 다음 달 파티션을 미리 생성)
+CREATE OR REPLACE FUNCTION create_audit_logs_partition(target_month DATE)
+RETURNS VOID AS $$
+DECLARE
+    month_start DATE := date_trunc('month', target_month)::date;
+    partition_name TEXT := 'audit_logs_' || to_char(month_start, 'YYYY_MM');
+BEGIN
+    EXECUTE format(
+        'CREATE TABLE IF NOT EXISTS %I PARTITION OF audit_logs FOR VALUES FROM (%L) TO (%L)',
+        partition_name,
+        month_start,
+        (month_start + INTERVAL '1 month')::date
+    );
+END;
+$$ LANGUAGE plpgsql;
+
+-- 파티션이 없는 기간의 로그 유실 방지
+CREATE TABLE IF NOT EXISTS audit_logs_default PARTITION OF audit_logs DEFAULT;
+
+-- 이번 달과 다음 달 파티션
+SELECT create_audit_logs_partition(CURRENT_DATE);
+SELECT create_audit_logs_partition((CURRENT_DATE + INTERVAL '1 month')::date);
+
+COMMENT ON TABLE audit_logs IS '감사 로그 (created_at 기준 월 파티션, 오래된 파티션은 DETACH/DROP으로 보관 정책 적용)';
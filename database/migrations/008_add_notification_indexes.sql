@@ -0,0 +1,17 @@
+-- 008_add_notification_indexes.sql
+-- 알림 목록/읽지 않은 알림 조회용 복합 인덱스
+
+-- 사용자별 최신순 목록, 읽지 않은 알림 목록/개수를 하나의 인덱스로 처리
+CREATE INDEX IF NOT EXISTS idx_notifications_user_read_created
+    ON notifications(user_id, is_read, created_at DESC);
+
+-- 복합 인덱스로 대체되는 단일 컬럼 인덱스 제거 (is_read 단독 인덱스는 선택도가 낮음)
+DROP INDEX IF EXISTS idx_notifications_user_id;
+DROP INDEX IF EXISTS idx_notifications_is_read;
+DROP INDEX IF EXISTS idx_notifications_created_at;
+
+-- 사용자 삭제 시 알림도 삭제되므로 user_id는 필수
+DELETE FROM notifications WHERE user_id IS NULL;
+ALTER TABLE notifications ALTER COLUMN user_id SET NOT NULL;
+ALTER TABLE notifications ALTER COLUMN is_read SET NOT NULL;
+ALTER TABLE notifications ALTER COLUMN created_at SET NOT NULL;
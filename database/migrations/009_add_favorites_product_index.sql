@@ -0,0 +1,7 @@
+-- 009_add_favorites_product_index.sql
+-- 재입고 알림 발송 시 상품별 찜 사용자를 user_id 순서로 나누어 조회
+
+CREATE INDEX IF NOT EXISTS idx_favorites_product_user ON favorites(product_id, user_id);
+
+-- 복합 인덱스로 대체
+DROP INDEX IF EXISTS idx_favorites_product_id;
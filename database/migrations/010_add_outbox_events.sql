@@ -0,0 +1,26 @@
+-- 010_add_outbox_events.sql
+-- 트랜잭셔널 아웃박스 (주문 변경의 부수 효과를 Celery로 전달)
+
+CREATE TABLE IF NOT EXISTS outbox_events (
+    id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+    event_type VARCHAR(100) NOT NULL,
+    aggregate_type VARCHAR(50) NOT NULL,
+    aggregate_id VARCHAR(100) NOT NULL,
+    payload JSONB NOT NULL DEFAULT '{}'::jsonb,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    last_error TEXT,
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    dispatched_at TIMESTAMP
+);
+
+-- 릴레이가 전달 대기 이벤트를 생성 순서대로 조회 (전달 완료 행은 인덱스에서 제외)
+CREATE INDEX IF NOT EXISTS idx_outbox_events_pending
+    ON outbox_events(created_at)
+    WHERE dispatched_at IS NULL;
+
+-- 전달 완료 이벤트 정리용
+CREATE INDEX IF NOT EXISTS idx_outbox_events_dispatched
+    ON outbox_events(dispatched_at)
+    WHERE dispatched_at IS NOT NULL;
+
+COMMENT ON TABLE outbox_events IS '트랜잭셔널 아웃박스 (at-least-once 전달, 소비자는 중복 수신을 허용해야 함)';
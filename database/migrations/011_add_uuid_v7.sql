@@ -0,0 +1,29 @@
+-- 011_add_uuid_v7.sql
+-- 시간순 UUID(v7) 생성 함수와 쓰기가 많은 테이블의 PK 기본값 변경
+-- 애플리케이션은 backend.core.ids.new_id()로 직접 생성하며, 이 기본값은 SQL로 직접 넣는 행에 적용됩니다.
+
+CREATE OR REPLACE FUNCTION uuid_generate_v7()
+RETURNS UUID AS $$
+DECLARE
+    -- 앞 6바이트: Unix epoch 밀리초, 나머지 10바이트: 무작위
+    value BYTEA := substring(int8send((extract(epoch FROM clock_timestamp()) * 1000)::BIGINT) FROM 3)
+        || substring(uuid_send(gen_random_uuid()) FROM 7);
+BEGIN
+    -- version 7 (0111xxxx)
+    value := set_byte(value, 6, (get_byte(value, 6) & 15) | 112);
+    -- variant 10xxxxxx
+    value := set_byte(value, 8, (get_byte(value, 8) & 63) | 128);
+    RETURN encode(value, 'hex')::UUID;
+END;
+$$ LANGUAGE plpgsql VOLATILE;
+
+ALTER TABLE orders ALTER COLUMN id SET DEFAULT uuid_generate_v7();
+ALTER TABLE order_items ALTER COLUMN id SET DEFAULT uuid_generate_v7();
+ALTER TABLE carts ALTER COLUMN id SET DEFAULT uuid_generate_v7();
+ALTER TABLE favorites ALTER COLUMN id SET DEFAULT uuid_generate_v7();
+ALTER TABLE reviews ALTER COLUMN id SET DEFAULT uuid_generate_v7();
+ALTER TABLE user_coupons ALTER COLUMN id SET DEFAULT uuid_generate_v7();
+ALTER TABLE user_points ALTER COLUMN id SET DEFAULT uuid_generate_v7();
+ALTER TABLE notifications ALTER COLUMN id SET DEFAULT uuid_generate_v7();
+ALTER TABLE outbox_events ALTER COLUMN id SET DEFAULT uuid_generate_v7();
+ALTER TABLE audit_logs ALTER COLUMN id SET DEFAULT uuid_generate_v7();
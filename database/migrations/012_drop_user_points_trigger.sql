@@ -0,0 +1,6 @@
+-- 012_drop_user_points_trigger.sql
+-- users.points는 애플리케이션이 user_points 기록과 같은 트랜잭션에서 직접 갱신합니다
+-- (포인트 지급, 주문 시 사용). 트리거가 남아 있으면 같은 변경이 두 번 반영되므로 제거합니다.
+
+DROP TRIGGER IF EXISTS trigger_update_user_points ON user_points;
+DROP FUNCTION IF EXISTS update_user_points();
@@ -0,0 +1,16 @@
+-- 013_add_user_coupons_unique.sql
+-- 사용자당 쿠폰 1장 (일괄 발행의 INSERT ... ON CONFLICT DO NOTHING 대상)
+
+-- 중복 발행분 정리 (사용한 쿠폰, 먼저 발행한 쿠폰 우선 유지)
+DELETE FROM user_coupons uc
+USING (
+    SELECT id,
+           ROW_NUMBER() OVER (
+               PARTITION BY user_id, coupon_id
+               ORDER BY is_used DESC, created_at
+           ) AS rn
+    FROM user_coupons
+) ranked
+WHERE uc.id = ranked.id AND ranked.rn > 1;
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_user_coupons_user_coupon ON user_coupons(user_id, coupon_id);
@@ -0,0 +1,15 @@
+-- 014_add_points_expiry.sql
+-- 포인트 적립 내역 소멸 처리, 쿠폰 만료 임박 알림 대상 조회용 인덱스
+
+ALTER TABLE user_points ADD COLUMN IF NOT EXISTS expires_at TIMESTAMP;
+ALTER TABLE user_points ADD COLUMN IF NOT EXISTS expired_at TIMESTAMP;
+
+-- 소멸 대상 적립 내역 (아직 처리하지 않은 적립만)
+CREATE INDEX IF NOT EXISTS idx_user_points_expiring
+    ON user_points(expires_at)
+    WHERE points > 0 AND expired_at IS NULL;
+
+-- 쿠폰별 미사용 보유자 (만료 임박 알림 일괄 발송)
+CREATE INDEX IF NOT EXISTS idx_user_coupons_coupon_unused
+    ON user_coupons(coupon_id, user_id)
+    WHERE is_used = false;
@@ -0,0 +1,8 @@
+-- 015_add_orders_user_created_index.sql
+-- 사용자별 주문 내역 커서 조회 (created_at, id 최신순)
+
+CREATE INDEX IF NOT EXISTS idx_orders_user_created
+    ON orders(user_id, created_at DESC, id DESC);
+
+-- user_id 단독 조회는 위 인덱스의 선두 컬럼으로 처리
+DROP INDEX IF EXISTS idx_orders_user_id;
@@ -0,0 +1,4 @@
+-- 016_add_orders_points_used.sql
+-- 주문에 사용한 포인트 (주문 취소 시 반환)
+
+ALTER TABLE orders ADD COLUMN IF NOT EXISTS points_used INTEGER NOT NULL DEFAULT 0;
@@ -0,0 +1,14 @@
+-- 017_add_uploaded_files_last_uploaded_at.sql
+-- 마지막 업로드 시각 (중복 업로드로 기존 파일을 재사용할 때도 갱신)
+-- 미참조 업로드 정리(cleanup_orphaned_uploads)는 이 시각을 기준으로 합니다.
+
+ALTER TABLE uploaded_files ADD COLUMN IF NOT EXISTS last_uploaded_at TIMESTAMP;
+UPDATE uploaded_files SET last_uploaded_at = created_at WHERE last_uploaded_at IS NULL;
+ALTER TABLE uploaded_files ALTER COLUMN last_uploaded_at SET DEFAULT CURRENT_TIMESTAMP;
+ALTER TABLE uploaded_files ALTER COLUMN last_uploaded_at SET NOT NULL;
+
+-- 고아 객체 정리 태스크의 스캔 기준이 생성일에서 마지막 업로드 시각으로 바뀜
+CREATE INDEX IF NOT EXISTS idx_uploaded_files_last_uploaded_at ON uploaded_files(last_uploaded_at);
+DROP INDEX IF EXISTS idx_uploaded_files_created_at;
+
+COMMENT ON COLUMN uploaded_files.last_uploaded_at IS '마지막 업로드 시각 (중복 업로드 재사용 포함, 미참조 파일 정리 기준)';
@@ -684,7 +684,7 @@ export interface PointHistory {
 
 export interface PointHistoryResponse {
   history: PointHistory[];
-  total: number;
+  next_cursor?: string | null;
 }
 
 export async function issuePoints(userId: string, data: {